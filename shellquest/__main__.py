@@ -19,7 +19,7 @@ def main():
 
         logger.info("ShellQuest exited normally")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         console.print("\n\n[bold]Game interrupted. Progress saved. Goodbye![/bold]\n")
         logger.info("ShellQuest interrupted by user")
         sys.exit(0)
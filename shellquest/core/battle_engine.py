@@ -1,17 +1,25 @@
 """Battle mode engine for ShellQuest - LAN Multiplayer."""
 
+import errno
+import hashlib
+import os
+import queue
+import sys
 import socket
 import threading
 import json
 import time
 import random
 import re
-from dataclasses import dataclass, asdict
+import selectors
+import struct
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
+from rich.style import Style
 from rich.prompt import Prompt
 from rich.live import Live
 from rich.table import Table
@@ -21,10 +29,49 @@ from ..ui.components import UIComponents
 from ..models.player import PlayerStats
 from ..models.question import Question
 from ..utils import (
-    logger, clear_terminal, sanitize_name,
+    logger, clear_terminal, sanitize_name, read_key,
     DEFAULT_PORT, BUFFER_SIZE, SOCKET_TIMEOUT, MAX_NAME_LENGTH
 )
 
+# Host address validation
+# IPv4: digits and dots only (xxx.xxx.xxx.xxx)
+# Hostname: alphanumeric, dots, hyphens; must start and end alphanumeric
+_IPV4_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?$')
+
+# Multiple choice shortcuts: 1-4 and a-d both pick an option by position
+_ANSWER_INDEX = {
+    **{c: i for i, c in enumerate('1234')},
+    **{c: i for i, c in enumerate('abcd')},
+}
+
+# Optional io_uring accept path (Linux only, opt-in)
+try:
+    import liburing
+except ImportError:  # pragma: no cover - depends on platform/extras
+    liburing = None
+
+IOURING_ENV = 'SHELLQUEST_IOURING'
+
+# Every message on the wire is prefixed with its length (4 bytes, big-endian)
+_HEADER = struct.Struct('!I')
+
+# Payloads are JSON objects unless they start with this tag byte, which
+# marks a binary round result (see BattleResult.pack)
+_RESULT_TAG = 0x01
+
+
+def _configure_battle_socket(sock: socket.socket) -> None:
+    """Tune a battle socket for small, latency-sensitive messages."""
+    # Disable Nagle so each question/answer goes out immediately
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
 
 def safe_json_loads(data: str) -> Optional[dict]:
     """Safely parse JSON data."""
@@ -35,14 +82,47 @@ def safe_json_loads(data: str) -> Optional[dict]:
         return None
 
 
-def safe_recv(sock: socket.socket, timeout: float = SOCKET_TIMEOUT) -> Optional[str]:
-    """Safely receive data from socket with timeout."""
+def _decode_message(payload) -> Optional[dict]:
+    """Decode a message payload (any bytes-like), rejecting anything but a JSON object."""
+    if len(payload) and payload[0] == _RESULT_TAG:
+        return _decode_result(payload)
+    message = safe_json_loads(str(payload, 'utf-8', 'replace'))
+    if not isinstance(message, dict):
+        logger.error("Received message is not a JSON object")
+        return None
+    return message
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytearray]:
+    """Read exactly `size` bytes from socket. Returns None if the peer closed."""
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return None
+        received += count
+    return buf
+
+
+def safe_recv(sock: socket.socket, timeout: float = SOCKET_TIMEOUT) -> Optional[dict]:
+    """Safely receive one length-prefixed JSON message from socket with timeout."""
     try:
         sock.settimeout(timeout)
-        data = sock.recv(BUFFER_SIZE)
-        if not data:
+        header = _recv_exact(sock, _HEADER.size)
+        if header is None:
+            return None
+
+        (length,) = _HEADER.unpack(header)
+        if length > BUFFER_SIZE:
+            logger.error(f"Message too large: {length} bytes")
             return None
-        return data.decode('utf-8', errors='replace')
+
+        payload = _recv_exact(sock, length)
+        if payload is None:
+            return None
+        return _decode_message(payload)
     except socket.timeout:
         logger.warning("Socket receive timeout")
         return None
@@ -51,25 +131,367 @@ def safe_recv(sock: socket.socket, timeout: float = SOCKET_TIMEOUT) -> Optional[
         return None
 
 
+def _encode_message(data: dict) -> Optional[bytes]:
+    """Frame a message for the wire, or None if it's too large."""
+    payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    if len(payload) > BUFFER_SIZE:
+        logger.error(f"Message too large to send: {len(payload)} bytes")
+        return None
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _encode_result(result: 'BattleResult', extra: dict) -> Optional[bytes]:
+    """Frame a round result in binary form, with any extra fields as JSON."""
+    payload = bytes((_RESULT_TAG,)) + result.pack() + json.dumps(extra, separators=(',', ':')).encode('utf-8')
+    if len(payload) > BUFFER_SIZE:
+        logger.error(f"Message too large to send: {len(payload)} bytes")
+        return None
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _decode_result(payload) -> Optional[dict]:
+    """Decode a binary result into the same shape as a JSON result message."""
+    try:
+        result, end = BattleResult.unpack_from(payload, 1)
+    except (struct.error, UnicodeDecodeError) as e:
+        logger.error(f"Malformed result message: {e}")
+        return None
+
+    extra = safe_json_loads(str(payload[end:], 'utf-8', 'replace')) if end < len(payload) else {}
+    if not isinstance(extra, dict):
+        logger.error("Malformed result message: extra fields")
+        return None
+
+    message = {'type': 'result', 'data': result.to_dict()}
+    message.update(extra)
+    return message
+
+
 def safe_send(sock: socket.socket, data: dict) -> bool:
-    """Safely send JSON data through socket."""
+    """Safely send JSON data through socket as a length-prefixed message."""
+    try:
+        frame = _encode_message(data)
+        if frame is None:
+            return False
+        sock.sendall(frame)
+        return True
+    except (socket.error, OSError, TypeError) as e:
+        logger.error(f"Socket send error: {e}")
+        return False
+
+
+def safe_send_multi(sock: socket.socket, messages: List[dict]) -> bool:
+    """Send several messages with a single write where the platform allows."""
     try:
-        json_data = json.dumps(data)
-        sock.sendall(json_data.encode('utf-8'))
+        frames = []
+        for data in messages:
+            frame = _encode_message(data)
+            if frame is None:
+                return False
+            frames.append(frame)
+
+        if hasattr(sock, 'sendmsg'):
+            # Gather write; finish with sendall if the kernel took only part
+            sent = sock.sendmsg(frames)
+            rest = b''.join(frames)[sent:]
+            if rest:
+                sock.sendall(rest)
+        else:
+            sock.sendall(b''.join(frames))
         return True
     except (socket.error, OSError, TypeError) as e:
         logger.error(f"Socket send error: {e}")
         return False
 
 
+def _wire_question(question: Question) -> dict:
+    """Client-facing question payload (never includes the correct answer)."""
+    return {
+        'id': question.id,
+        'text': question.question_text,
+        'options': question.options,
+        'type': question.type.value,
+        'command': question.command
+    }
+
+
+def questions_fingerprint(questions: List[Question]) -> str:
+    """Hash of the question bank as the client would render it.
+
+    Host and client compare this at handshake; when it matches, rounds
+    carry only the question ID.
+    """
+    wire = sorted((_wire_question(q) for q in questions), key=lambda w: w['id'])
+    blob = json.dumps(wire, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _select_battle_questions(pool: List[Question], num_questions: int) -> List[Question]:
+    """Pick up to num_questions questions from the pool in random order."""
+    k = min(num_questions, len(pool))
+    if k == len(pool):
+        # Whole pool requested: a shuffle skips sample()'s selection pass
+        selected = list(pool)
+        random.shuffle(selected)
+        return selected
+    return random.sample(pool, k)
+
+
+def _normalize_mcq_answer(raw: str, options: Optional[List[str]]) -> str:
+    """Expand a 1-4 / a-d shortcut to the option text; otherwise return raw."""
+    idx = _ANSWER_INDEX.get(raw.lower())
+    if idx is not None and options and idx < len(options):
+        return options[idx]
+    return raw
+
+
+def _read_answer(console: Console, options: Optional[List[str]]) -> Tuple[str, float]:
+    """Prompt for an answer and time it.
+
+    For multiple choice, a digit naming one of the options is accepted as
+    soon as it's pressed. Anything else, including a letter that starts an
+    option's text, continues as a normal line of input.
+
+    Returns:
+        Tuple of (answer, seconds taken)
+    """
+    if not options or not sys.stdin.isatty():
+        start_time = time.monotonic()
+        answer = Prompt.ask("Your answer")
+        return answer.strip(), time.monotonic() - start_time
+
+    console.print("Your answer: ", end="")
+    start_time = time.monotonic()
+    first = read_key()
+    if first in ('\r', '\n'):
+        console.print()
+        return "", time.monotonic() - start_time
+    if first and not first.isprintable():
+        first = ""
+    if first and first.isdigit() and _ANSWER_INDEX.get(first, len(options)) < len(options):
+        time_taken = time.monotonic() - start_time
+        console.print(first)
+        return first, time_taken
+
+    # Free-form answer: echo the first key and read the rest of the line
+    console.print(first or "", end="")
+    rest = input()
+    return ((first or "") + rest).strip(), time.monotonic() - start_time
+
+
+def _iouring_enabled() -> bool:
+    """Whether the io_uring accept path is requested and usable."""
+    return (
+        liburing is not None
+        and os.environ.get(IOURING_ENV) == '1'
+        and hasattr(os, 'uname')
+        and os.uname().sysname == 'Linux'
+    )
+
+
+class IoUringAcceptor:
+    """Accept battle connections through an io_uring submission queue.
+
+    Only used when SHELLQUEST_IOURING=1 on Linux with the ``liburing``
+    bindings installed. Any failure here makes the server fall back to
+    a plain ``accept()``.
+    """
+
+    QUEUE_DEPTH = 32
+    _ACCEPT_DATA = 1
+    _CANCEL_DATA = 2
+
+    def __init__(self):
+        self.ring = liburing.io_uring()
+        self.cqes = liburing.io_uring_cqes()
+        liburing.io_uring_queue_init(self.QUEUE_DEPTH, self.ring, 0)
+
+    def accept(self, server_socket: socket.socket, timeout: float) -> Tuple[socket.socket, tuple]:
+        """Accept one connection, raising socket.timeout if none arrives."""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_accept(sqe, server_socket.fileno(), None, None, 0)
+        liburing.io_uring_sqe_set_data64(sqe, self._ACCEPT_DATA)
+        liburing.io_uring_submit(self.ring)
+
+        try:
+            self._wait(timeout)
+        except socket.timeout:
+            self._cancel_accept()
+            raise
+
+        cqe = self.cqes[0]
+        try:
+            fd = liburing.trap_error(cqe.res)
+        finally:
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+
+        conn = socket.socket(fileno=fd)
+        return conn, conn.getpeername()
+
+    def _wait(self, timeout: float):
+        """Wait for a completion; only ETIME means nobody connected."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            try:
+                liburing.io_uring_wait_cqe_timeout(self.ring, self.cqes, liburing.timespec(remaining))
+                return
+            except OSError as e:
+                if e.errno == errno.EINTR:  # e.g. SIGWINCH from a terminal resize
+                    continue
+                if e.errno == errno.ETIME:
+                    raise socket.timeout("Timed out waiting for opponent") from e
+                raise
+
+    def _cancel_accept(self):
+        """Cancel the armed accept and reap it, closing a connection that won the race."""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_cancel64(sqe, self._ACCEPT_DATA, 0)
+        liburing.io_uring_sqe_set_data64(sqe, self._CANCEL_DATA)
+        liburing.io_uring_submit(self.ring)
+
+        # Both the cancel and the accept always complete once the cancel is submitted
+        pending = {self._ACCEPT_DATA, self._CANCEL_DATA}
+        while pending:
+            liburing.io_uring_wait_cqe(self.ring, self.cqes)
+            cqe = self.cqes[0]
+            try:
+                if cqe.user_data == self._ACCEPT_DATA and cqe.res >= 0:
+                    os.close(cqe.res)
+                pending.discard(cqe.user_data)
+            finally:
+                liburing.io_uring_cqe_seen(self.ring, cqe)
+
+    def close(self):
+        """Tear down the ring."""
+        liburing.io_uring_queue_exit(self.ring)
+
+
+class BattleChannel:
+    """Message stream over a connected battle socket.
+
+    Reads wait on a selector instead of re-arming the socket timeout for
+    every message, and bytes that arrive early stay buffered until the
+    next recv().
+    """
+
+    def __init__(self, sock: socket.socket):
+        # Blocking mode: recv() only runs once the selector reports data
+        sock.settimeout(None)
+        self.sock = sock
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+        self._rx = bytearray()
+        # Kernel reads land here; only the filled part is copied into _rx
+        self._rx_buf = bytearray(BUFFER_SIZE)
+        self._rx_mv = memoryview(self._rx_buf)
+        # Set once the peer hangs up or the stream is unusable
+        self.closed = False
+
+    def recv(self, timeout: float = SOCKET_TIMEOUT) -> Optional[dict]:
+        """Receive the next message, or None on timeout/disconnect."""
+        deadline = time.monotonic() + timeout
+        while True:
+            if len(self._rx) >= _HEADER.size:
+                (length,) = _HEADER.unpack_from(self._rx)
+                if length > BUFFER_SIZE:
+                    logger.error(f"Message too large: {length} bytes")
+                    self.closed = True
+                    return None
+                end = _HEADER.size + length
+                if len(self._rx) >= end:
+                    with memoryview(self._rx) as view:
+                        message = _decode_message(view[_HEADER.size:end])
+                    del self._rx[:end]
+                    return message
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                logger.warning("Socket receive timeout")
+                return None
+
+            try:
+                n = self.sock.recv_into(self._rx_mv)
+            except (socket.error, OSError) as e:
+                logger.error(f"Socket receive error: {e}")
+                self.closed = True
+                return None
+            if not n:
+                self.closed = True
+                return None
+            self._rx += self._rx_mv[:n]
+
+    def send(self, data: dict) -> bool:
+        """Send one message."""
+        return safe_send(self.sock, data)
+
+    def send_many(self, messages: List[dict]) -> bool:
+        """Send several messages in one write."""
+        return safe_send_multi(self.sock, messages)
+
+    def send_result(self, result: 'BattleResult', **extra) -> bool:
+        """Send a round result in binary form; received as a 'result' message."""
+        try:
+            frame = _encode_result(result, extra)
+            if frame is None:
+                return False
+            self.sock.sendall(frame)
+            return True
+        except (socket.error, OSError, TypeError, struct.error) as e:
+            logger.error(f"Socket send error: {e}")
+            return False
+
+    def close(self):
+        """Release the selector (the socket is closed by its owner)."""
+        try:
+            self._selector.close()
+        except (OSError, ValueError):
+            pass
+        self._rx_mv.release()
+
+
 @dataclass
 class BattleResult:
     """Result of a battle question."""
+    __slots__ = ('player_name', 'is_correct', 'time_taken', 'points')
+
     player_name: str
     is_correct: bool
     time_taken: float
     points: int
 
+    # is_correct, time_taken, points, name length; the UTF-8 name follows
+    _PACK = struct.Struct('!?dIH')
+
+    def pack(self) -> bytes:
+        """Binary encoding for the wire."""
+        name = self.player_name.encode('utf-8')
+        return self._PACK.pack(self.is_correct, self.time_taken, self.points, len(name)) + name
+
+    @classmethod
+    def unpack_from(cls, buf, offset: int = 0) -> Tuple['BattleResult', int]:
+        """Decode a packed result at offset. Returns (result, end offset)."""
+        is_correct, time_taken, points, name_len = cls._PACK.unpack_from(buf, offset)
+        start = offset + cls._PACK.size
+        end = start + name_len
+        if end > len(buf):
+            raise struct.error("truncated player name")
+        return cls(str(buf[start:end], 'utf-8'), is_correct, time_taken, points), end
+
+    @classmethod
+    def unpack(cls, buf) -> 'BattleResult':
+        """Decode a packed result."""
+        return cls.unpack_from(buf)[0]
+
+    def to_dict(self) -> dict:
+        """Flat dict for the wire (cheaper than dataclasses.asdict)."""
+        return {
+            'player_name': self.player_name,
+            'is_correct': self.is_correct,
+            'time_taken': self.time_taken,
+            'points': self.points,
+        }
+
 
 @dataclass
 class BattleState:
@@ -85,6 +507,177 @@ class BattleState:
     winner: str = ""
 
 
+@dataclass
+class Handshake:
+    """Validated handshake message from the other player."""
+    name: str
+    questions_hash: Optional[str] = None
+
+    @classmethod
+    def parse(cls, message: dict) -> 'Handshake':
+        """Validate a decoded handshake.
+
+        Raises:
+            ValueError: If a field is missing or has the wrong type
+        """
+        name = message.get('name')
+        if not isinstance(name, str):
+            raise ValueError("Invalid handshake")
+        questions_hash = message.get('questions_hash')
+        if questions_hash is not None and not isinstance(questions_hash, str):
+            raise ValueError("Invalid handshake")
+        return cls(name=sanitize_name(name), questions_hash=questions_hash)
+
+
+@dataclass
+class ClientResult:
+    """Validated round result reported by the client."""
+    answer: str
+    time_taken: float
+
+    MIN_TIME = 0.5       # Anything faster is treated as cheating
+    MAX_TIME = 300.0     # Cap at 5 minutes
+    PENALTY_TIME = 60.0  # Time recorded for suspicious reports
+
+    @classmethod
+    def parse(cls, message: dict) -> Optional['ClientResult']:
+        """Validate a decoded result message, or None if it's malformed.
+
+        Suspicious times (non-numeric, negative, NaN or impossibly fast)
+        are replaced with PENALTY_TIME rather than rejected.
+        """
+        data = message.get('data')
+        if not isinstance(data, dict):
+            return None
+
+        answer = message.get('answer', '')
+        if not isinstance(answer, str):
+            answer = ''
+
+        time_taken = data.get('time_taken', 0)
+        if isinstance(time_taken, bool) or not isinstance(time_taken, (int, float)) \
+                or not time_taken >= cls.MIN_TIME:
+            time_taken = cls.PENALTY_TIME
+        return cls(answer=answer, time_taken=min(float(time_taken), cls.MAX_TIME))
+
+
+# Speed bonus tiers: (answered under N seconds, bonus points)
+_SPEED_BONUS_TABLE = ((5.0, 50), (10.0, 30), (20.0, 10), (float('inf'), 0))
+_BASE_BATTLE_POINTS = 100
+
+
+def calculate_battle_points(is_correct: bool, time_taken: float) -> int:
+    """Calculate points for a battle answer."""
+    if not is_correct:
+        return 0
+    return _BASE_BATTLE_POINTS + next(bonus for limit, bonus in _SPEED_BONUS_TABLE if time_taken < limit)
+
+
+class BattleRenderer:
+    """Battle screens shared by host and client."""
+
+    # Scoreboard styles, parsed once
+    _NAME = Style(bold=True)
+    _MY_SCORE = Style.parse(f"bold {Theme.PRIMARY}")
+    _THEIR_SCORE = Style.parse(f"bold {Theme.ERROR}")
+    _VS = Text("vs", style="dim")
+
+    @staticmethod
+    def question_screen(console: Console, state: BattleState, num: int, total: int,
+                        is_host: bool, question_panel: Panel):
+        """Show the scoreboard and question as a single frame.
+
+        Both panels go out in one print right after the clear, so the
+        screen is redrawn in one write instead of flickering piecemeal.
+        """
+        mine, theirs = BattleRenderer._MY_SCORE, BattleRenderer._THEIR_SCORE
+        host_style, client_style = (mine, theirs) if is_host else (theirs, mine)
+
+        # Text cells with prebuilt styles: nothing here goes through the markup parser
+        scores = Table.grid(padding=(0, 4))
+        scores.add_column(justify="center")
+        scores.add_column(justify="center")
+        scores.add_column(justify="center")
+        scores.add_row(
+            Text(state.player1_name, style=BattleRenderer._NAME),
+            BattleRenderer._VS,
+            Text(state.player2_name, style=BattleRenderer._NAME)
+        )
+        scores.add_row(
+            Text(str(state.player1_score), style=host_style),
+            "",
+            Text(str(state.player2_score), style=client_style)
+        )
+
+        clear_terminal()
+        console.print(Group(
+            Panel(scores, title=f"[bold]Round {num}/{total}[/bold]", border_style=Theme.WARNING),
+            question_panel,
+        ))
+
+    @staticmethod
+    def round_result(console: Console, my_result: BattleResult, opp_result: BattleResult,
+                     correct_answer: str):
+        """Show the result of a round."""
+        console.print("\n")
+
+        # My result
+        if my_result.is_correct:
+            console.print(f"[bold {Theme.SUCCESS}]You: ✓ Correct! +{my_result.points} pts ({my_result.time_taken:.1f}s)[/bold {Theme.SUCCESS}]")
+        else:
+            console.print(f"[bold {Theme.ERROR}]You: ✗ Wrong![/bold {Theme.ERROR}]")
+
+        # Opponent result
+        if opp_result.is_correct:
+            console.print(f"[bold {Theme.WARNING}]{opp_result.player_name}: ✓ Correct! +{opp_result.points} pts ({opp_result.time_taken:.1f}s)[/bold {Theme.WARNING}]")
+        else:
+            console.print(f"[dim]{opp_result.player_name}: ✗ Wrong![/dim]")
+
+        console.print(f"\n[dim]Correct answer: {correct_answer}[/dim]")
+
+        if not my_result.is_correct:
+            console.print("\n[dim]Press ENTER to continue...[/dim]")
+            input()
+        else:
+            time.sleep(1.5)
+
+    @staticmethod
+    def battle_end(console: Console, state: BattleState, my_name: str, is_host: bool):
+        """Show battle end screen.
+
+        The host (player1) is always listed first; the local player's
+        score is highlighted in the primary colour.
+        """
+        clear_terminal()
+
+        if state.winner == my_name:
+            result_text = ("🏆 VICTORY! 🏆", f"bold {Theme.SUCCESS}")
+        elif state.winner == "TIE":
+            result_text = ("🤝 IT'S A TIE! 🤝", f"bold {Theme.WARNING}")
+        else:
+            result_text = ("💀 DEFEAT 💀", f"bold {Theme.ERROR}")
+
+        mine, theirs = f"bold {Theme.PRIMARY}", f"bold {Theme.ERROR}"
+        host_style, client_style = (mine, theirs) if is_host else (theirs, mine)
+
+        panel = Panel(
+            Align.center(Text.assemble(
+                (f"\n{result_text[0]}\n\n", result_text[1]),
+                (f"{state.player1_name}: ", "white"),
+                (f"{state.player1_score} pts\n", host_style),
+                (f"{state.player2_name}: ", "white"),
+                (f"{state.player2_score} pts\n", client_style),
+            )),
+            title="[bold]⚔️ BATTLE COMPLETE ⚔️[/bold]",
+            border_style=Theme.WARNING,
+            padding=(1, 2)
+        )
+
+        console.print(panel)
+        console.print("\n[dim]Press ENTER to continue...[/dim]")
+        input()
+
+
 class BattleServer:
     """Server for hosting a battle."""
 
@@ -94,11 +687,39 @@ class BattleServer:
         self.questions = questions
         self.server_socket: Optional[socket.socket] = None
         self.client_socket: Optional[socket.socket] = None
+        self.channel: Optional[BattleChannel] = None
         self.client_name: str = ""
         self.battle_questions: List[Question] = []
+        self._wire_questions: List[dict] = []
+        self._send_question_ids = False
         self.state: Optional[BattleState] = None
         self.my_results: List[BattleResult] = []
         self.opponent_results: List[BattleResult] = []
+        # The ring is only built once this server actually hosts
+        self._use_iouring = _iouring_enabled()
+        self._acceptor: Optional[IoUringAcceptor] = None
+
+    def _accept_client(self, timeout: float) -> Tuple[socket.socket, tuple]:
+        """Accept the opponent's connection."""
+        if self._acceptor is None and self._use_iouring:
+            try:
+                self._acceptor = IoUringAcceptor()
+            except Exception as e:
+                logger.warning(f"io_uring unavailable, using plain accept: {e}")
+                self._use_iouring = False
+        if self._acceptor:
+            try:
+                return self._acceptor.accept(self.server_socket, timeout)
+            except socket.timeout:
+                raise
+            except Exception as e:
+                logger.warning(f"io_uring accept failed, falling back: {e}")
+                self._acceptor.close()
+                self._acceptor = None
+                self._use_iouring = False
+
+        self.server_socket.settimeout(timeout)
+        return self.server_socket.accept()
 
     def get_local_ip(self) -> str:
         """Get local IP address."""
@@ -116,6 +737,7 @@ class BattleServer:
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            _configure_battle_socket(self.server_socket)
             self.server_socket.bind(('0.0.0.0', DEFAULT_PORT))
             self.server_socket.listen(1)
 
@@ -135,30 +757,31 @@ class BattleServer:
             ))
 
             # Wait for connection
-            self.server_socket.settimeout(300)  # 5 min timeout
-            self.client_socket, addr = self.server_socket.accept()
+            self.client_socket, addr = self._accept_client(300)  # 5 min timeout
+            # Accepted sockets don't reliably inherit TCP options
+            _configure_battle_socket(self.client_socket)
             logger.info(f"Battle connection from {addr}")
 
             # Receive client name with validation
-            data = safe_recv(self.client_socket, timeout=30)
-            if not data:
+            client_info = safe_recv(self.client_socket, timeout=30)
+            if not client_info:
                 raise ConnectionError("No data received from client")
 
-            client_info = safe_json_loads(data)
-            if not client_info or 'name' not in client_info:
-                raise ValueError("Invalid client handshake")
-
-            self.client_name = sanitize_name(client_info['name'])
-
-            # Send host name
-            if not safe_send(self.client_socket, {'name': sanitize_name(self.player.username)}):
-                raise ConnectionError("Failed to send host name")
+            hello = Handshake.parse(client_info)
+            self.client_name = hello.name
+            # Same question bank on both ends: rounds only need the ID
+            self._send_question_ids = hello.questions_hash == questions_fingerprint(self.questions)
+            self.channel = BattleChannel(self.client_socket)
 
             self.console.print(f"\n[bold green]{self.client_name} has joined![/bold green]")
             time.sleep(1)
 
             # Select random questions
-            self.battle_questions = random.sample(self.questions, min(num_questions, len(self.questions)))
+            self.battle_questions = _select_battle_questions(self.questions, num_questions)
+
+            # Build the client-facing question payloads once.
+            # NOTE: correct_answer NOT sent to client for security
+            self._wire_questions = [_wire_question(q) for q in self.battle_questions]
 
             # Initialize state
             self.state = BattleState(
@@ -170,8 +793,8 @@ class BattleServer:
                 player2_name=self.client_name
             )
 
-            # Run battle
-            return self.run_battle_as_host()
+            # Run battle; our name goes out in the same write as question 1
+            return self.run_battle_as_host(greeting={'name': sanitize_name(self.player.username)})
 
         except socket.timeout:
             self.console.print("[red]Timeout waiting for opponent.[/red]")
@@ -183,31 +806,38 @@ class BattleServer:
         finally:
             self.cleanup()
 
-    def run_battle_as_host(self) -> bool:
-        """Run the battle as host."""
+    def run_battle_as_host(self, greeting: Optional[dict] = None) -> bool:
+        """Run the battle as host.
+
+        Args:
+            greeting: Handshake reply to send together with the first question
+        """
         for i, question in enumerate(self.battle_questions):
             self.state.question_num = i + 1
             # Don't send correct_answer to client - verify on host only
-            self.state.current_question = {
-                'id': question.id,
-                'text': question.question_text,
-                'options': question.options,
-                'type': question.type.value,
-                'command': question.command
-                # NOTE: correct_answer NOT sent to client for security
-            }
+            self.state.current_question = self._wire_questions[i]
+
+            outgoing = []
+            if greeting:
+                outgoing.append(greeting)
+                greeting = None
 
             # Send question to client (without answer)
-            if not safe_send(self.client_socket, {
+            question_msg = {
                 'type': 'question',
-                'data': self.state.current_question,
                 'num': self.state.question_num,
                 'total': self.state.total_questions,
                 'scores': {
                     self.player.username: self.state.player1_score,
                     self.client_name: self.state.player2_score
                 }
-            }):
+            }
+            if self._send_question_ids:
+                question_msg['id'] = question.id
+            else:
+                question_msg['data'] = self.state.current_question
+            outgoing.append(question_msg)
+            if not self.channel.send_many(outgoing):
                 logger.error("Failed to send question to client")
                 return False
 
@@ -215,40 +845,34 @@ class BattleServer:
             my_result = self.show_battle_question(question, self.state.question_num, self.state.total_questions)
 
             # Send my result with correct answer (so client can verify/display)
-            if not safe_send(self.client_socket, {
-                'type': 'result',
-                'data': asdict(my_result),
-                'correct_answer': question.correct_answer[0]  # Send only after both answered
-            }):
+            if not self.channel.send_result(
+                my_result,
+                correct_answer=question.correct_answer[0]  # Send only after both answered
+            ):
                 logger.error("Failed to send result to client")
                 return False
 
             # Receive opponent result
-            opp_data = safe_recv(self.client_socket)
-            if not opp_data:
+            opp_result_data = self.channel.recv()
+            if not opp_result_data:
                 logger.error("No response from client")
                 return False
 
-            opp_result_data = safe_json_loads(opp_data)
-            if not opp_result_data or 'data' not in opp_result_data:
+            client_result = ClientResult.parse(opp_result_data)
+            if client_result is None:
                 logger.error("Invalid result data from client")
                 return False
 
-            # Validate client's answer on server side
-            client_answer = opp_result_data.get('answer', '')
-            is_client_correct = question.is_correct(client_answer)
-
-            # Validate time_taken - prevent cheating with impossibly fast or negative times
-            client_time = opp_result_data['data'].get('time_taken', 0)
-            if not isinstance(client_time, (int, float)) or client_time < 0.5:
-                client_time = 60.0  # Penalize suspicious times
-            client_time = min(client_time, 300.0)  # Cap at 5 minutes
+            # Validate client's answer on server side; the reported time has
+            # already been clamped (impossibly fast or negative times are penalized)
+            is_client_correct = question.is_correct(client_result.answer)
+            client_time = client_result.time_taken
 
             opp_result = BattleResult(
                 player_name=self.client_name,
                 is_correct=is_client_correct,
                 time_taken=client_time,
-                points=self.calculate_battle_points(is_client_correct, client_time)
+                points=calculate_battle_points(is_client_correct, client_time)
             )
 
             # Update scores
@@ -272,7 +896,7 @@ class BattleServer:
         self.player.battles_played += 1
 
         # Send final state
-        safe_send(self.client_socket, {
+        self.channel.send({
             'type': 'game_over',
             'winner': self.state.winner,
             'scores': {
@@ -286,49 +910,18 @@ class BattleServer:
 
     def show_battle_question(self, question: Question, num: int, total: int) -> BattleResult:
         """Show question and get player's answer."""
-        clear_terminal()
-
-        # Scoreboard
-        scores = Table.grid(padding=(0, 4))
-        scores.add_column(justify="center")
-        scores.add_column(justify="center")
-        scores.add_column(justify="center")
-        scores.add_row(
-            f"[bold]{self.player.username}[/bold]",
-            "[dim]vs[/dim]",
-            f"[bold]{self.client_name}[/bold]"
+        BattleRenderer.question_screen(
+            self.console, self.state, num, total, is_host=True,
+            question_panel=UIComponents.create_question_panel(question, num, total)
         )
-        scores.add_row(
-            f"[bold {Theme.PRIMARY}]{self.state.player1_score}[/bold {Theme.PRIMARY}]",
-            "",
-            f"[bold {Theme.ERROR}]{self.state.player2_score}[/bold {Theme.ERROR}]"
-        )
-        self.console.print(Panel(scores, title=f"[bold]Round {num}/{total}[/bold]", border_style=Theme.WARNING))
-
-        # Question
-        self.console.print(UIComponents.create_question_panel(question, num, total))
-
-        start_time = time.time()
-        answer = Prompt.ask("Your answer").strip()
-        time_taken = time.time() - start_time
-
-        # Normalize answer for validation
-        user_answer = answer.lower()
-        answer_to_validate = answer
-
-        # Handle number answers for multiple choice - convert to letter index
-        if question.options and len(user_answer) == 1 and user_answer in '1234':
-            number_index = int(user_answer) - 1
-            if 0 <= number_index < len(question.options):
-                answer_to_validate = question.options[number_index]
-        # Handle letter answers for multiple choice - expand to full option
-        elif question.options and len(user_answer) == 1 and user_answer in 'abcd':
-            letter_index = ord(user_answer) - ord('a')
-            if 0 <= letter_index < len(question.options):
-                answer_to_validate = question.options[letter_index]
+
+        answer, time_taken = _read_answer(self.console, question.options)
+
+        # Expand option shortcuts for validation
+        answer_to_validate = _normalize_mcq_answer(answer, question.options)
 
         is_correct = question.is_correct(answer_to_validate)
-        points = self.calculate_battle_points(is_correct, time_taken)
+        points = calculate_battle_points(is_correct, time_taken)
 
         return BattleResult(
             player_name=self.player.username,
@@ -337,78 +930,20 @@ class BattleServer:
             points=points
         )
 
-    def calculate_battle_points(self, is_correct: bool, time_taken: float) -> int:
-        """Calculate points for a battle answer."""
-        if not is_correct:
-            return 0
-
-        base_points = 100
-        # Speed bonus: up to 50 extra points for fast answers
-        if time_taken < 5:
-            speed_bonus = 50
-        elif time_taken < 10:
-            speed_bonus = 30
-        elif time_taken < 20:
-            speed_bonus = 10
-        else:
-            speed_bonus = 0
-
-        return base_points + speed_bonus
-
     def show_round_result(self, my_result: BattleResult, opp_result: BattleResult, correct_answer: str):
         """Show the result of a round."""
-        self.console.print("\n")
-
-        # My result
-        if my_result.is_correct:
-            self.console.print(f"[bold {Theme.SUCCESS}]You: ✓ Correct! +{my_result.points} pts ({my_result.time_taken:.1f}s)[/bold {Theme.SUCCESS}]")
-        else:
-            self.console.print(f"[bold {Theme.ERROR}]You: ✗ Wrong![/bold {Theme.ERROR}]")
-
-        # Opponent result
-        if opp_result.is_correct:
-            self.console.print(f"[bold {Theme.WARNING}]{opp_result.player_name}: ✓ Correct! +{opp_result.points} pts ({opp_result.time_taken:.1f}s)[/bold {Theme.WARNING}]")
-        else:
-            self.console.print(f"[dim]{opp_result.player_name}: ✗ Wrong![/dim]")
-
-        self.console.print(f"\n[dim]Correct answer: {correct_answer}[/dim]")
-
-        if not my_result.is_correct:
-            self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-            input()
-        else:
-            time.sleep(1.5)
+        BattleRenderer.round_result(self.console, my_result, opp_result, correct_answer)
 
     def show_battle_end(self):
         """Show battle end screen."""
-        clear_terminal()
-
-        if self.state.winner == self.player.username:
-            result_text = ("🏆 VICTORY! 🏆", f"bold {Theme.SUCCESS}")
-        elif self.state.winner == "TIE":
-            result_text = ("🤝 IT'S A TIE! 🤝", f"bold {Theme.WARNING}")
-        else:
-            result_text = ("💀 DEFEAT 💀", f"bold {Theme.ERROR}")
-
-        panel = Panel(
-            Align.center(Text.assemble(
-                (f"\n{result_text[0]}\n\n", result_text[1]),
-                (f"{self.player.username}: ", "white"),
-                (f"{self.state.player1_score} pts\n", f"bold {Theme.PRIMARY}"),
-                (f"{self.client_name}: ", "white"),
-                (f"{self.state.player2_score} pts\n", f"bold {Theme.ERROR}"),
-            )),
-            title="[bold]⚔️ BATTLE COMPLETE ⚔️[/bold]",
-            border_style=Theme.WARNING,
-            padding=(1, 2)
-        )
-
-        self.console.print(panel)
-        self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-        input()
+        BattleRenderer.battle_end(self.console, self.state, self.player.username, is_host=True)
 
     def cleanup(self):
         """Clean up sockets with proper shutdown."""
+        if self.channel:
+            self.channel.close()
+            self.channel = None
+
         if self.client_socket:
             try:
                 self.client_socket.shutdown(socket.SHUT_RDWR)
@@ -431,55 +966,76 @@ class BattleServer:
                 pass
             self.server_socket = None
 
+        if self._acceptor:
+            try:
+                self._acceptor.close()
+            except Exception:
+                pass
+            self._acceptor = None
+
         logger.info("Battle server sockets cleaned up")
 
 
 class BattleClient:
     """Client for joining a battle."""
 
-    def __init__(self, console: Console, player: PlayerStats):
+    def __init__(self, console: Console, player: PlayerStats,
+                 questions: Optional[List[Question]] = None):
         self.console = console
         self.player = player
+        self.questions = questions or []
+        self.question_bank = {q.id: _wire_question(q) for q in self.questions}
         self.socket: Optional[socket.socket] = None
+        self.channel: Optional[BattleChannel] = None
         self.host_name: str = ""
         self.state: Optional[BattleState] = None
+        # Host messages are received and decoded on a background thread
+        self._rx_q: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=4)
+        self._rx_stop = threading.Event()
+        self._rx_thread: Optional[threading.Thread] = None
 
     def join_game(self, host_ip: str, port: int = DEFAULT_PORT) -> bool:
         """Join a battle game."""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(30)
-
-            # Validate IP/hostname format
-            # IPv4: digits and dots only, max 15 chars (xxx.xxx.xxx.xxx)
-            # Hostname: alphanumeric, dots, hyphens, max 253 chars
+            # Validate IP/hostname format (hostnames max 253 chars)
             host_ip = host_ip.strip()
             if len(host_ip) > 253:
                 raise ValueError("Host address too long")
-            is_ipv4 = re.match(r'^(\d{1,3}\.){3}\d{1,3}$', host_ip)
-            is_hostname = re.match(r'^[a-zA-Z0-9][a-zA-Z0-9.-]*[a-zA-Z0-9]$|^[a-zA-Z0-9]$', host_ip)
-            if not is_ipv4 and not is_hostname:
+            is_ipv4 = _IPV4_RE.match(host_ip) is not None
+            if not is_ipv4 and not _HOSTNAME_RE.match(host_ip):
                 raise ValueError("Invalid host IP or hostname format")
 
             self.console.print(f"\n[dim]Connecting to {host_ip}:{port}...[/dim]")
 
-            self.socket.connect((host_ip, port))
+            # Numeric addresses skip the resolver entirely
+            if is_ipv4:
+                flags = socket.AI_NUMERICHOST | socket.AI_NUMERICSERV
+            else:
+                flags = socket.AI_ADDRCONFIG
+            family, socktype, proto, _, sockaddr = socket.getaddrinfo(
+                host_ip, port, socket.AF_INET, socket.SOCK_STREAM, 0, flags
+            )[0]
+
+            self.socket = socket.socket(family, socktype, proto)
+            _configure_battle_socket(self.socket)
+            self.socket.settimeout(30)
+            self.socket.connect(sockaddr)
             logger.info(f"Connected to battle host at {host_ip}:{port}")
 
             # Send my name (sanitized)
-            if not safe_send(self.socket, {'name': sanitize_name(self.player.username)}):
+            hello = {'name': sanitize_name(self.player.username)}
+            if self.questions:
+                hello['questions_hash'] = questions_fingerprint(self.questions)
+            if not safe_send(self.socket, hello):
                 raise ConnectionError("Failed to send player name")
 
             # Receive host name
-            data = safe_recv(self.socket, timeout=30)
-            if not data:
+            host_info = safe_recv(self.socket, timeout=30)
+            if not host_info:
                 raise ConnectionError("No response from host")
 
-            host_info = safe_json_loads(data)
-            if not host_info or 'name' not in host_info:
-                raise ValueError("Invalid host handshake")
-
-            self.host_name = sanitize_name(host_info['name'])
+            self.host_name = Handshake.parse(host_info).name
+            self.channel = BattleChannel(self.socket)
 
             self.console.print(f"\n[bold green]Connected to {self.host_name}![/bold green]")
             time.sleep(1)
@@ -510,38 +1066,97 @@ class BattleClient:
         finally:
             self.cleanup()
 
+    def _rx_pump(self):
+        """Receive and decode host messages until the stream ends."""
+        try:
+            while not self._rx_stop.is_set():
+                message = self.channel.recv()
+                if message is not None:
+                    if not self._rx_put(message):
+                        break
+                elif self.channel.closed:
+                    break
+        except (OSError, ValueError) as e:
+            logger.error(f"Battle receive thread error: {e}")
+        finally:
+            self._rx_put(None)
+
+    def _rx_put(self, item: Optional[dict]) -> bool:
+        """Queue item for the game loop; False if the pump was stopped first.
+
+        Waits in short slices so a reader that has gone away can't leave
+        the receive thread blocked on a full queue.
+        """
+        while not self._rx_stop.is_set():
+            try:
+                self._rx_q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _next_message(self) -> Optional[dict]:
+        """Next decoded host message, or None on timeout/disconnect."""
+        try:
+            return self._rx_q.get(timeout=SOCKET_TIMEOUT)
+        except queue.Empty:
+            logger.warning("Timed out waiting for host")
+            return None
+
+    def _stop_rx_pump(self):
+        """Stop the receive thread before the channel is torn down."""
+        self._rx_stop.set()
+        if self._rx_thread is None:
+            return
+        if self.socket:
+            try:
+                # Wakes the thread if it's still waiting on the socket
+                self.socket.shutdown(socket.SHUT_RD)
+            except (socket.error, OSError):
+                pass
+        self._rx_thread.join(timeout=1.0)
+        self._rx_thread = None
+
     def run_battle_as_client(self) -> bool:
         """Run the battle as client."""
+        self._rx_thread = threading.Thread(target=self._rx_pump, name="battle-rx", daemon=True)
+        self._rx_thread.start()
+        try:
+            return self._client_loop()
+        finally:
+            self._stop_rx_pump()
+
+    def _client_loop(self) -> bool:
+        """Play rounds as they arrive from the host."""
         while True:
-            data = safe_recv(self.socket)
-            if not data:
+            message = self._next_message()
+            if not message:
                 logger.warning("Connection lost to host")
                 break
 
-            message = safe_json_loads(data)
-            if not message:
-                logger.error("Invalid message from host")
-                continue
-
-            if message['type'] == 'question':
+            if message.get('type') == 'question':
                 # Update state
                 self.state.question_num = message['num']
                 self.state.total_questions = message['total']
                 self.state.player1_score = message['scores'].get(self.host_name, 0)
                 self.state.player2_score = message['scores'].get(self.player.username, 0)
 
+                # Full payload, or just the ID when our question banks match
+                question_data = message.get('data') or self.question_bank.get(message.get('id'))
+                if not question_data:
+                    logger.error(f"Unknown question from host: {message.get('id')}")
+                    break
+
                 # Show question and get answer (returns result AND raw answer)
-                question_data = message['data']
                 my_result, raw_answer = self.show_battle_question(question_data, message['num'], message['total'])
 
                 # Receive host result first (contains correct answer now)
-                host_result_data = safe_recv(self.socket)
-                if not host_result_data:
+                host_result_msg = self._next_message()
+                if not host_result_msg:
                     logger.error("No result from host")
                     break
 
-                host_result_msg = safe_json_loads(host_result_data)
-                if not host_result_msg or 'data' not in host_result_msg:
+                if 'data' not in host_result_msg:
                     logger.error("Invalid result from host")
                     break
 
@@ -549,18 +1164,17 @@ class BattleClient:
                 correct_answer = host_result_msg.get('correct_answer', '')
 
                 # Send my result WITH raw answer for server-side validation
-                if not safe_send(self.socket, {
-                    'type': 'result',
-                    'data': asdict(my_result),
-                    'answer': raw_answer  # Server will validate this
-                }):
+                if not self.channel.send_result(
+                    my_result,
+                    answer=raw_answer  # Server will validate this
+                ):
                     logger.error("Failed to send result")
                     break
 
                 # Show round result (server validated, we use their correct_answer)
                 self.show_round_result(my_result, host_result, correct_answer)
 
-            elif message['type'] == 'game_over':
+            elif message.get('type') == 'game_over':
                 self.state.winner = message.get('winner', '')
                 self.state.player1_score = message['scores'].get(self.host_name, 0)
                 self.state.player2_score = message['scores'].get(self.player.username, 0)
@@ -579,25 +1193,6 @@ class BattleClient:
 
     def show_battle_question(self, question_data: dict, num: int, total: int) -> Tuple[BattleResult, str]:
         """Show question and get player's answer. Returns (result, raw_answer)."""
-        clear_terminal()
-
-        # Scoreboard
-        scores = Table.grid(padding=(0, 4))
-        scores.add_column(justify="center")
-        scores.add_column(justify="center")
-        scores.add_column(justify="center")
-        scores.add_row(
-            f"[bold]{self.host_name}[/bold]",
-            "[dim]vs[/dim]",
-            f"[bold]{self.player.username}[/bold]"
-        )
-        scores.add_row(
-            f"[bold {Theme.ERROR}]{self.state.player1_score}[/bold {Theme.ERROR}]",
-            "",
-            f"[bold {Theme.PRIMARY}]{self.state.player2_score}[/bold {Theme.PRIMARY}]"
-        )
-        self.console.print(Panel(scores, title=f"[bold]Round {num}/{total}[/bold]", border_style=Theme.WARNING))
-
         # Question panel
         q_text = Text()
         q_text.append(f"\n{question_data['text']}\n\n", style="bold white")
@@ -608,26 +1203,15 @@ class BattleClient:
                 q_text.append(f"  {letter}) ", style=Theme.PRIMARY)
                 q_text.append(f"{option}\n", style="white")
 
-        self.console.print(Panel(q_text, title=f"[bold]Question {num}[/bold]", border_style=Theme.PANEL_BORDER_STYLE))
-
-        start_time = time.time()
-        answer = Prompt.ask("Your answer").strip()
-        time_taken = time.time() - start_time
+        BattleRenderer.question_screen(
+            self.console, self.state, num, total, is_host=False,
+            question_panel=Panel(q_text, title=f"[bold]Question {num}[/bold]", border_style=Theme.PANEL_BORDER_STYLE)
+        )
 
-        # Normalize answer for sending to server
-        user_answer = answer.lower()
-        answer_to_send = answer  # Raw answer to send for server validation
+        answer, time_taken = _read_answer(self.console, question_data.get('options'))
 
-        # Handle number answers for multiple choice - convert to option text
-        if question_data.get('options') and len(user_answer) == 1 and user_answer in '1234':
-            number_index = int(user_answer) - 1
-            if 0 <= number_index < len(question_data['options']):
-                answer_to_send = question_data['options'][number_index]
-        # Handle letter answers for multiple choice - expand to full option
-        elif question_data.get('options') and len(user_answer) == 1 and user_answer in 'abcd':
-            letter_index = ord(user_answer) - ord('a')
-            if 0 <= letter_index < len(question_data['options']):
-                answer_to_send = question_data['options'][letter_index]
+        # Expand option shortcuts; the server validates the result
+        answer_to_send = _normalize_mcq_answer(answer, question_data.get('options'))
 
         # Client doesn't validate - just marks as pending (server will validate)
         # This is a local estimate only, server has authoritative answer
@@ -642,75 +1226,20 @@ class BattleClient:
 
         return result, answer_to_send
 
-    def calculate_battle_points(self, is_correct: bool, time_taken: float) -> int:
-        """Calculate points for a battle answer."""
-        if not is_correct:
-            return 0
-
-        base_points = 100
-        if time_taken < 5:
-            speed_bonus = 50
-        elif time_taken < 10:
-            speed_bonus = 30
-        elif time_taken < 20:
-            speed_bonus = 10
-        else:
-            speed_bonus = 0
-
-        return base_points + speed_bonus
-
     def show_round_result(self, my_result: BattleResult, opp_result: BattleResult, correct_answer: str):
         """Show the result of a round."""
-        self.console.print("\n")
-
-        if my_result.is_correct:
-            self.console.print(f"[bold {Theme.SUCCESS}]You: ✓ Correct! +{my_result.points} pts ({my_result.time_taken:.1f}s)[/bold {Theme.SUCCESS}]")
-        else:
-            self.console.print(f"[bold {Theme.ERROR}]You: ✗ Wrong![/bold {Theme.ERROR}]")
-
-        if opp_result.is_correct:
-            self.console.print(f"[bold {Theme.WARNING}]{opp_result.player_name}: ✓ Correct! +{opp_result.points} pts ({opp_result.time_taken:.1f}s)[/bold {Theme.WARNING}]")
-        else:
-            self.console.print(f"[dim]{opp_result.player_name}: ✗ Wrong![/dim]")
-
-        self.console.print(f"\n[dim]Correct answer: {correct_answer}[/dim]")
-
-        if not my_result.is_correct:
-            self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-            input()
-        else:
-            time.sleep(1.5)
+        BattleRenderer.round_result(self.console, my_result, opp_result, correct_answer)
 
     def show_battle_end(self):
         """Show battle end screen."""
-        clear_terminal()
-
-        if self.state.winner == self.player.username:
-            result_text = ("🏆 VICTORY! 🏆", f"bold {Theme.SUCCESS}")
-        elif self.state.winner == "TIE":
-            result_text = ("🤝 IT'S A TIE! 🤝", f"bold {Theme.WARNING}")
-        else:
-            result_text = ("💀 DEFEAT 💀", f"bold {Theme.ERROR}")
-
-        panel = Panel(
-            Align.center(Text.assemble(
-                (f"\n{result_text[0]}\n\n", result_text[1]),
-                (f"{self.host_name}: ", "white"),
-                (f"{self.state.player1_score} pts\n", f"bold {Theme.ERROR}"),
-                (f"{self.player.username}: ", "white"),
-                (f"{self.state.player2_score} pts\n", f"bold {Theme.PRIMARY}"),
-            )),
-            title="[bold]⚔️ BATTLE COMPLETE ⚔️[/bold]",
-            border_style=Theme.WARNING,
-            padding=(1, 2)
-        )
-
-        self.console.print(panel)
-        self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-        input()
+        BattleRenderer.battle_end(self.console, self.state, self.player.username, is_host=False)
 
     def cleanup(self):
         """Clean up socket with proper shutdown."""
+        if self.channel:
+            self.channel.close()
+            self.channel = None
+
         if self.socket:
             try:
                 self.socket.shutdown(socket.SHUT_RDWR)
@@ -1,12 +1,15 @@
 """Main game engine for ShellQuest."""
 
+import sys
 import time
-from rich.console import Console
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
-from typing import Optional
+from typing import Optional, Tuple
 
 from ..data.loader import DataLoader
 from ..models.player import PlayerStats, PlayerSession
@@ -17,15 +20,57 @@ from .quiz_handler import QuizHandler
 from .training_handler import TrainingHandler
 from ..ui.components import UIComponents
 from ..ui.theme import Theme
-from ..utils import logger, clear_terminal, sanitize_name
+from ..utils import logger, clear_terminal, sanitize_name, read_key, wait_for_key
 from .story_engine import StoryEngine
 from .battle_engine import BattleServer, BattleClient
 from .mystery_engine import MysteryEngine
 
+# Pre-formatted styles for menu, splash and goodbye renderables
+_STYLE_BOLD_PRIMARY = f"bold {Theme.PRIMARY}"
+
+_SAVE_FAILED_TEXT = Text(
+    "⚠ Your progress could not be saved. "
+    "Check ~/.shellquest/logs/shellquest.log for details.",
+    style=f"bold {Theme.ERROR}",
+)
+
+
+@lru_cache(maxsize=64)
+def _choices(n: int) -> Tuple[str, ...]:
+    """Prompt choices "1".."n", shared across redraws."""
+    return tuple(str(i) for i in range(1, n + 1))
+
+
+def _menu_passes():
+    """Yield once per pass of a redrawing menu, clearing the screen first.
+
+    Scrollback is wiped on the first pass; later passes only need the
+    visible area cleared.
+    """
+    clear_terminal()
+    while True:
+        yield
+        clear_terminal(include_scrollback=False)
+
 
 class GameEngine:
     """Main game orchestrator."""
 
+    _MAIN_MENU_OPTIONS = (
+        ("1", "🎯", "Quick Play"),
+        ("2", "📖", "Story Mode"),
+        ("3", "🔍", "Murder Mystery"),
+        ("4", "⚔️", "Battle Mode"),
+        ("5", "📊", "View Progress"),
+        ("6", "🏆", "Achievements"),
+        ("7", "📚", "Command Reference"),
+        ("8", "⚙️", "Settings"),
+        ("9", "👋", "Quit"),
+    )
+
+    # Unforced saves closer together than this are coalesced
+    SAVE_INTERVAL_SECONDS = 0.5
+
     def __init__(self):
         """Initialize game engine."""
         self.console = Console(theme=Theme.get_rich_theme())
@@ -34,19 +79,6 @@ class GameEngine:
         self.scoring_system = ScoringSystem()
         self.data_loader = DataLoader()
 
-        # Load game data
-        self.commands = self.data_loader.load_all_commands()
-        self.questions = self.data_loader.load_all_questions()
-        self.achievements_list = self.data_loader.load_achievements()
-        self.achievement_system = AchievementSystem(self.achievements_list)
-
-        # Build command-questions cache
-        self.command_questions_cache = {}
-        for q in self.questions:
-            if q.command not in self.command_questions_cache:
-                self.command_questions_cache[q.command] = []
-            self.command_questions_cache[q.command].append(q)
-
         # Initialize handlers
         self.quiz_handler = QuizHandler(self.console, self.scoring_system)
         self.training_handler = TrainingHandler(self.console, self.scoring_system)
@@ -54,26 +86,143 @@ class GameEngine:
         # Game state
         self.player: Optional[PlayerStats] = None
         self.running = True
+        self._last_save = 0.0
+        self._dirty = False
+
+        self._build_menus()
+        self._main_actions = {
+            "1": self._show_play_menu,
+            "2": self._show_story_mode,
+            "3": self._show_mystery_mode,
+            "4": self._show_battle_menu,
+            "5": self._show_progress,
+            "6": self._show_achievements,
+            "7": self._show_command_reference,
+            "8": self._show_settings,
+            "9": self._quit,
+        }
 
-        logger.info(f"GameEngine initialized with {len(self.commands)} commands, {len(self.questions)} questions")
+        logger.info("GameEngine initialized")
+
+    def _build_menus(self):
+        """Build the static menu panels once; they're reprinted as-is."""
+        self._main_menu_panel = UIComponents.create_menu(self._MAIN_MENU_OPTIONS)
+
+        self._play_menu_panel = Panel(
+            Text.assemble(
+                ("\n", ""),
+                ("  1  ", _STYLE_BOLD_PRIMARY), ("🎯 Quick Quiz (10 Questions)\n", "white"),
+                ("  2  ", _STYLE_BOLD_PRIMARY), ("🚀 Marathon (25 Questions)\n", "white"),
+                ("  3  ", _STYLE_BOLD_PRIMARY), ("⚡ Speed Round (Time Attack)\n", "white"),
+                ("  4  ", _STYLE_BOLD_PRIMARY), ("🎓 Practice Mode (No XP, Hints Free)\n", "white"),
+                ("  5  ", _STYLE_BOLD_PRIMARY), ("🔀 Random Mix (All Difficulties)\n", "white"),
+                ("  6  ", _STYLE_BOLD_PRIMARY), ("📝 Command Training (Pick a Command)\n", "white"),
+                ("  7  ", _STYLE_BOLD_PRIMARY), ("↩️  Back to Menu\n", "white"),
+                ("\n", ""),
+            ),
+            title="[bold]Select Game Mode[/bold]",
+            border_style=Theme.PANEL_BORDER_STYLE
+        )
+
+        self._battle_menu_panel = Panel(
+            Text.assemble(
+                ("\n", ""),
+                ("  1  ", _STYLE_BOLD_PRIMARY), ("🏠 Host Game\n", "white"),
+                ("  2  ", _STYLE_BOLD_PRIMARY), ("🔗 Join Game\n", "white"),
+                ("  3  ", _STYLE_BOLD_PRIMARY), ("↩️  Back\n", "white"),
+                ("\n", ""),
+            ),
+            title="[bold]Select Option[/bold]",
+            border_style=Theme.WARNING
+        )
+
+        self._settings_menu_panel = Panel(
+            Text.assemble(
+                ("\n", ""),
+                ("  1  ", _STYLE_BOLD_PRIMARY), ("👤 Edit Profile\n", "white"),
+                ("  2  ", _STYLE_BOLD_PRIMARY), ("🔄 Reset Progress\n", "white"),
+                ("  3  ", _STYLE_BOLD_PRIMARY), ("🏆 Reset Achievements\n", "white"),
+                ("  4  ", _STYLE_BOLD_PRIMARY), ("🗑️  Delete Account\n", "white"),
+                ("  5  ", _STYLE_BOLD_PRIMARY), ("👥 Switch Player\n", "white"),
+                ("  6  ", _STYLE_BOLD_PRIMARY), ("↩️  Back\n", "white"),
+                ("\n", ""),
+            ),
+            title="[bold]⚙️ Settings[/bold]",
+            border_style=Theme.PANEL_BORDER_STYLE
+        )
+
+    # Game data is loaded on first use so startup doesn't wait on parsing
+
+    @cached_property
+    def commands(self):
+        """All command definitions."""
+        commands = self.data_loader.load_all_commands()
+        logger.info(f"Loaded {len(commands)} commands")
+        return commands
+
+    @cached_property
+    def questions(self):
+        """All questions."""
+        questions = self.data_loader.load_all_questions()
+        logger.info(f"Loaded {len(questions)} questions")
+        return questions
+
+    @cached_property
+    def achievements_list(self):
+        """All achievement definitions."""
+        return self.data_loader.load_achievements()
+
+    @cached_property
+    def achievement_system(self) -> AchievementSystem:
+        """Achievement checker over the loaded definitions."""
+        return AchievementSystem(self.achievements_list)
+
+    @cached_property
+    def categories_cache(self):
+        """Commands grouped by category for the reference browser."""
+        return self.data_loader.load_commands_by_category()
+
+    @cached_property
+    def category_list(self):
+        """Category names in display order."""
+        return list(self.categories_cache)
+
+    @cached_property
+    def _story_engine(self) -> StoryEngine:
+        """Story engine, built (and chapters parsed) on first entry."""
+        return StoryEngine(self.console, self.questions, self.player)
+
+    @cached_property
+    def _mystery_engine(self) -> MysteryEngine:
+        """Mystery engine, reused across visits."""
+        return MysteryEngine(self.console, self.player)
+
+    @cached_property
+    def command_questions_cache(self):
+        """Questions grouped by command."""
+        cache = defaultdict(list)
+        for q in self.questions:
+            cache[q.command].append(q)
+        return dict(cache)
 
     def start(self):
         """Start the game."""
         self._show_splash()
         self._player_selection()
 
-        while self.running:
-            self._show_main_menu()
-
-        if self.player:
-            self.state_manager.save_progress(self.player)
+        try:
+            while self.running:
+                self._show_main_menu()
+        finally:
+            # Also runs on Ctrl+C mid-mode, so rate-limited changes still land
+            self._flush_save(force=True)
 
         clear_terminal()
         self.console.print(Panel(
             Align.center(Text.assemble(
                 ("\n", ""),
                 ("Thanks for playing ", "bold"),
-                ("ShellQuest", f"bold {Theme.PRIMARY}"),
+                ("ShellQuest", _STYLE_BOLD_PRIMARY),
                 ("!\n\n", "bold"),
                 (f"See you next time, {self.player.username}! ", Theme.SECONDARY),
                 ("\n", ""),
@@ -87,14 +236,52 @@ class GameEngine:
         clear_terminal()
         splash = Text.assemble(
             ("\n\n", ""),
-            ("    🚀 ", f"bold {Theme.PRIMARY}"),
-            ("ShellQuest", f"bold {Theme.PRIMARY}"),
+            ("    🚀 ", _STYLE_BOLD_PRIMARY),
+            ("ShellQuest", _STYLE_BOLD_PRIMARY),
             (" v1.0\n", "dim"),
-            ("\n    Master Bash/Zsh Commands Like a Pro\n\n", f"{Theme.SECONDARY}"),
+            ("\n    Master Bash/Zsh Commands Like a Pro\n\n", Theme.SECONDARY),
         )
         self.console.print(Panel(Align.center(splash), border_style=Theme.PANEL_BORDER_STYLE))
         time.sleep(1)
 
+    def _save_progress(self, force: bool = False):
+        """Save the current player, skipping saves that come in a quick burst.
+
+        A skipped save leaves the player dirty for _flush_save. Unforced
+        saves are written in the background; use force for anything the
+        user would expect to be on disk immediately.
+        """
+        if not self.player:
+            return
+        now = time.monotonic()
+        if force:
+            self.state_manager.save_progress(self.player)
+        elif now - self._last_save < self.SAVE_INTERVAL_SECONDS:
+            self._dirty = True
+            return
+        else:
+            self.state_manager.save_progress_async(self.player)
+        self._last_save = now
+        self._dirty = False
+
+    def _mark_dirty(self):
+        """Note unsaved player changes; written by the next _flush_save."""
+        self._dirty = True
+
+    def _flush_save(self, force: bool = False):
+        """Write pending changes unless the last save was very recent.
+
+        With force, the player is saved synchronously no matter what.
+        """
+        if force or self._dirty:
+            self._save_progress(force=force)
+
+    def _retry_failed_save(self) -> bool:
+        """Redo a failed background save synchronously; False if it fails again."""
+        if not self.state_manager.take_async_save_failure():
+            return True
+        return self.state_manager.save_progress(self.player)
+
     def _player_selection(self):
         """Handle player selection or creation."""
         clear_terminal()
@@ -111,7 +298,7 @@ class GameEngine:
 
             choice = Prompt.ask(
                 "\nSelect player or create new",
-                choices=[str(i) for i in range(1, len(saved_players) + 2)]
+                choices=_choices(len(saved_players) + 1)
             )
 
             choice_num = int(choice)
@@ -135,67 +322,58 @@ class GameEngine:
 
     def _show_main_menu(self):
         """Display main menu."""
+        self._flush_save()
+
         clear_terminal()
         self.player.level = self.scoring_system.get_level(self.player.xp)
 
-        self.console.print(UIComponents.create_header(self.player))
-        _, _, xp_needed = self.scoring_system.get_level_progress(self.player.xp)
-        progress_pct = self.scoring_system.get_progress_percentage(self.player.xp)
-        self.console.print(UIComponents.create_stats_panel(self.player, xp_needed, progress_pct))
-
-        menu_options = [
-            ("1", "🎯", "Quick Play"),
-            ("2", "📖", "Story Mode"),
-            ("3", "🔍", "Murder Mystery"),
-            ("4", "⚔️", "Battle Mode"),
-            ("5", "📊", "View Progress"),
-            ("6", "🏆", "Achievements"),
-            ("7", "📚", "Command Reference"),
-            ("8", "⚙️", "Settings"),
-            ("9", "👋", "Quit"),
-        ]
-        self.console.print(UIComponents.create_menu(menu_options))
-
-        choice = Prompt.ask("Select an option", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9"])
-
-        actions = {
-            "1": self._show_play_menu,
-            "2": self._show_story_mode,
-            "3": self._show_mystery_mode,
-            "4": self._show_battle_menu,
-            "5": self._show_progress,
-            "6": self._show_achievements,
-            "7": self._show_command_reference,
-            "8": self._show_settings,
-            "9": lambda: setattr(self, 'running', False),
-        }
-        actions[choice]()
+        _, _, xp_needed, progress_pct = self.scoring_system.get_full_progress(self.player.xp)
+        self.console.print(Group(
+            UIComponents.create_header(self.player),
+            UIComponents.create_stats_panel(self.player, xp_needed, progress_pct),
+            self._main_menu_panel,
+        ))
+        if not self._retry_failed_save():
+            self.console.print(_SAVE_FAILED_TEXT)
+
+        choice = self._numeric_choice("Select an option", len(self._MAIN_MENU_OPTIONS))
+        self._main_actions[choice]()
+
+    def _numeric_choice(self, prompt: str, max_n: int) -> str:
+        """Read a menu number (1..max_n, max_n <= 9) from a single keypress.
+
+        Falls back to Prompt.ask when single keys can't be read; raises
+        EOFError once input is closed, as Prompt.ask would.
+        """
+        if not sys.stdin.isatty():
+            return Prompt.ask(prompt, choices=_choices(max_n))
+
+        last = str(max_n)
+        self.console.print(f"{prompt} [bold magenta]\\[1-{last}][/bold magenta]: ", end="")
+        while True:
+            key = read_key()
+            if key is None:
+                return Prompt.ask("", choices=_choices(max_n))
+            if not key:
+                raise EOFError
+            if key == "\x03":
+                raise KeyboardInterrupt
+            if "1" <= key <= last:
+                self.console.print(key)
+                return key
+
+    def _quit(self):
+        """Leave the main loop."""
+        self.running = False
 
     def _show_play_menu(self):
         """Show play mode selection menu."""
         clear_terminal()
-        self.console.print(UIComponents.create_header())
-
-        menu = Panel(
-            Text.assemble(
-                ("\n", ""),
-                ("  1  ", f"bold {Theme.PRIMARY}"), ("🎯 Quick Quiz (10 Questions)\n", "white"),
-                ("  2  ", f"bold {Theme.PRIMARY}"), ("🚀 Marathon (25 Questions)\n", "white"),
-                ("  3  ", f"bold {Theme.PRIMARY}"), ("⚡ Speed Round (Time Attack)\n", "white"),
-                ("  4  ", f"bold {Theme.PRIMARY}"), ("🎓 Practice Mode (No XP, Hints Free)\n", "white"),
-                ("  5  ", f"bold {Theme.PRIMARY}"), ("🔀 Random Mix (All Difficulties)\n", "white"),
-                ("  6  ", f"bold {Theme.PRIMARY}"), ("📝 Command Training (Pick a Command)\n", "white"),
-                ("  7  ", f"bold {Theme.PRIMARY}"), ("↩️  Back to Menu\n", "white"),
-                ("\n", ""),
-            ),
-            title="[bold]Select Game Mode[/bold]",
-            border_style=Theme.PANEL_BORDER_STYLE
-        )
-        self.console.print(menu)
+        self.console.print(Group(UIComponents.create_header(), self._play_menu_panel))
 
-        choice = Prompt.ask("Select mode", choices=["1", "2", "3", "4", "5", "6", "7"])
+        choice = self._numeric_choice("Select mode", 7)
 
-        save_fn = lambda: self.state_manager.save_progress(self.player)
+        save_fn = self._save_progress
 
         if choice == "1":
             self.quiz_handler.run_quiz(self.player, self.questions, "essential", 10,
@@ -217,41 +395,31 @@ class GameEngine:
 
     def _show_story_mode(self):
         """Show story mode."""
-        story = StoryEngine(self.console, self.questions, self.player)
+        story = self._story_engine
+        story.player = self.player
         story.run_story_mode()
-        self.state_manager.save_progress(self.player)
+        self._mark_dirty()
 
     def _show_mystery_mode(self):
         """Show murder mystery mode."""
-        mystery = MysteryEngine(self.console, self.player)
+        mystery = self._mystery_engine
+        mystery.player = self.player
         mystery.run_mystery_mode()
-        self.state_manager.save_progress(self.player)
+        self._mark_dirty()
 
     def _show_battle_menu(self):
         """Show battle mode menu."""
         clear_terminal()
-        self.console.print(UIComponents.create_header())
-
-        self.console.print(f"\n[bold]⚔️ BATTLE MODE[/bold]")
-        self.console.print(f"\n[dim]Your Battle Record:[/dim]")
-        self.console.print(f"  Wins: [bold green]{self.player.battles_won}[/bold green]")
-        self.console.print(f"  Losses: [bold red]{self.player.battles_lost}[/bold red]")
-        self.console.print(f"  Total: {self.player.battles_played}\n")
-
-        menu = Panel(
-            Text.assemble(
-                ("\n", ""),
-                ("  1  ", f"bold {Theme.PRIMARY}"), ("🏠 Host Game\n", "white"),
-                ("  2  ", f"bold {Theme.PRIMARY}"), ("🔗 Join Game\n", "white"),
-                ("  3  ", f"bold {Theme.PRIMARY}"), ("↩️  Back\n", "white"),
-                ("\n", ""),
-            ),
-            title="[bold]Select Option[/bold]",
-            border_style=Theme.WARNING
+        record = Text.from_markup(
+            "\n[bold]⚔️ BATTLE MODE[/bold]\n"
+            "\n[dim]Your Battle Record:[/dim]\n"
+            f"  Wins: [bold green]{self.player.battles_won}[/bold green]\n"
+            f"  Losses: [bold red]{self.player.battles_lost}[/bold red]\n"
+            f"  Total: {self.player.battles_played}\n"
         )
-        self.console.print(menu)
+        self.console.print(Group(UIComponents.create_header(), record, self._battle_menu_panel))
 
-        choice = Prompt.ask("Select option", choices=["1", "2", "3"])
+        choice = self._numeric_choice("Select option", 3)
 
         if choice == "1":
             self._host_battle()
@@ -268,7 +436,7 @@ class GameEngine:
 
         server = BattleServer(self.console, self.player, self.questions)
         server.host_game(int(num_questions))
-        self.state_manager.save_progress(self.player)
+        self._mark_dirty()
 
     def _join_battle(self):
         """Join a battle game."""
@@ -279,17 +447,17 @@ class GameEngine:
         host_ip = Prompt.ask("Host IP")
 
         if host_ip.strip():
-            client = BattleClient(self.console, self.player)
+            client = BattleClient(self.console, self.player, self.questions)
             client.join_game(host_ip.strip())
-            self.state_manager.save_progress(self.player)
+            self._mark_dirty()
 
     def _show_progress(self):
         """Show player progress."""
         clear_terminal()
         self.console.print(UIComponents.create_header())
         self.console.print(UIComponents.create_progress_summary(self.player))
-        self.console.print("\n[dim]Press ENTER to return to menu...[/dim]")
-        input()
+        self.console.print("\n[dim]Press any key to return to menu...[/dim]")
+        wait_for_key()
 
     def _show_achievements(self):
         """Show achievements."""
@@ -297,92 +465,72 @@ class GameEngine:
         self.console.print(UIComponents.create_header())
         self.console.print("\n[bold]🏆 Achievements[/bold]\n")
 
-        unlocked_ids = set(self.player.unlocked_achievements)
+        unlocked_ids = self.player.unlocked_achievements
+        unlocked_count = len(unlocked_ids)
 
+        # Build the whole list as one Text so it goes out in a single print
+        listing = Text()
         for achievement in self.achievements_list:
-            rarity_style = Theme.get_rarity_style(achievement.rarity)
             if achievement.id in unlocked_ids:
-                self.console.print(f"  {achievement.icon} ", end="")
-                self.console.print(f"{achievement.name}", style=f"bold {rarity_style}", end="")
-                self.console.print(f" - {achievement.description}", style="dim")
+                rarity_style = Theme.get_rarity_style(achievement.rarity)
+                listing.append(f"  {achievement.icon} ")
+                listing.append(achievement.name, style=f"bold {rarity_style}")
+                listing.append(f" - {achievement.description}\n", style="dim")
             else:
-                self.console.print(f"  🔒 ??? - {achievement.rarity.title()}", style="dim")
+                listing.append(f"  🔒 ??? - {achievement.rarity.title()}\n", style="dim")
 
-        self.console.print(f"\n[bold]Unlocked: {len(unlocked_ids)}/{len(self.achievements_list)}[/bold]")
-        self.console.print("\n[dim]Press ENTER to return to menu...[/dim]")
-        input()
+        listing.append(f"\nUnlocked: {unlocked_count}/{len(self.achievements_list)}", style="bold")
+        self.console.print(listing)
+        self.console.print("\n[dim]Press any key to return to menu...[/dim]")
+        wait_for_key()
 
     def _show_command_reference(self):
         """Show command reference browser."""
-        while True:
-            clear_terminal()
-            self.console.print(UIComponents.create_header())
-            self.console.print("\n[bold]📚 Command Reference[/bold]\n")
-
-            categories = {}
-            for cmd in self.commands:
-                if cmd.category not in categories:
-                    categories[cmd.category] = []
-                categories[cmd.category].append(cmd)
-
-            cat_list = list(categories.keys())
+        for _ in _menu_passes():
+            categories = self.categories_cache
+            cat_list = self.category_list
+            listing = Text("\n")
+            listing.append("📚 Command Reference", style="bold")
+            listing.append("\n\n")
             for i, cat in enumerate(cat_list, 1):
-                self.console.print(f"  {i}. {cat} ({len(categories[cat])} commands)")
+                listing.append(f"  {i}. {cat} ({len(categories[cat])} commands)\n")
+            listing.append(f"  {len(cat_list) + 1}. ↩️  Back")
+            self.console.print(Group(UIComponents.create_header(), listing))
 
-            self.console.print(f"  {len(cat_list) + 1}. ↩️  Back")
-
-            choice = Prompt.ask("Select category", choices=[str(i) for i in range(1, len(cat_list) + 2)])
+            choice = Prompt.ask("Select category", choices=_choices(len(cat_list) + 1))
 
             if int(choice) > len(cat_list):
                 break
 
             self._show_category_commands(categories[cat_list[int(choice) - 1]])
 
-    def _show_category_commands(self, commands):
+    def _show_category_commands(self, group):
         """Show commands in a category."""
-        while True:
-            clear_terminal()
-            self.console.print(UIComponents.create_header())
-            self.console.print(f"\n[bold]Commands[/bold]\n")
-
-            for i, cmd in enumerate(commands, 1):
-                self.console.print(f"  {i}. {cmd.name} - {cmd.description[:40]}...")
-
-            self.console.print(f"  {len(commands) + 1}. ↩️  Back")
-
-            choice = Prompt.ask("Select command", choices=[str(i) for i in range(1, len(commands) + 2)])
-
-            if int(choice) > len(commands):
+        for _ in _menu_passes():
+            listing = Text("\n")
+            listing.append("Commands", style="bold")
+            listing.append("\n\n")
+            for i, (name, preview) in enumerate(zip(group.names, group.previews), 1):
+                listing.append(f"  {i}. {name} - {preview}\n")
+            listing.append(f"  {len(group) + 1}. ↩️  Back")
+            self.console.print(Group(UIComponents.create_header(), listing))
+
+            choice = Prompt.ask("Select command", choices=_choices(len(group) + 1))
+
+            if int(choice) > len(group):
                 break
 
             clear_terminal()
-            self.console.print(UIComponents.create_command_card(commands[int(choice) - 1]))
-            self.console.print("\n[dim]Press ENTER to go back...[/dim]")
-            input()
+            self.console.print(UIComponents.create_command_card(group.commands[int(choice) - 1]))
+            self.console.print("\n[dim]Press any key to go back...[/dim]")
+            wait_for_key()
 
     def _show_settings(self):
         """Show settings menu."""
-        while True:
-            clear_terminal()
-            self.console.print(UIComponents.create_header())
-
-            menu = Panel(
-                Text.assemble(
-                    ("\n", ""),
-                    ("  1  ", f"bold {Theme.PRIMARY}"), ("👤 Edit Profile\n", "white"),
-                    ("  2  ", f"bold {Theme.PRIMARY}"), ("🔄 Reset Progress\n", "white"),
-                    ("  3  ", f"bold {Theme.PRIMARY}"), ("🏆 Reset Achievements\n", "white"),
-                    ("  4  ", f"bold {Theme.PRIMARY}"), ("🗑️  Delete Account\n", "white"),
-                    ("  5  ", f"bold {Theme.PRIMARY}"), ("👥 Switch Player\n", "white"),
-                    ("  6  ", f"bold {Theme.PRIMARY}"), ("↩️  Back\n", "white"),
-                    ("\n", ""),
-                ),
-                title="[bold]⚙️ Settings[/bold]",
-                border_style=Theme.PANEL_BORDER_STYLE
-            )
-            self.console.print(menu)
+        for _ in _menu_passes():
+            self.console.print(Group(UIComponents.create_header(), self._settings_menu_panel))
 
-            choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5", "6"])
+            choice = self._numeric_choice("Select option", 6)
 
             if choice == "1":
                 self._edit_profile()
@@ -413,7 +561,7 @@ class GameEngine:
             new_name = sanitize_name(new_name)
             self.player.username = new_name
 
-            self.state_manager.save_progress(self.player)
+            self._save_progress(force=True)
             if old_name != new_name:
                 self.state_manager.delete_save(old_name)
 
@@ -446,7 +594,7 @@ class GameEngine:
             self.player.recently_answered = []
             self.player.unlocked_achievements = kept_achievements
 
-            self.state_manager.save_progress(self.player)
+            self._save_progress(force=True)
             self.console.print(f"\n[bold green]Progress reset![/bold green]")
         else:
             self.console.print("\n[dim]Cancelled.[/dim]")
@@ -461,8 +609,8 @@ class GameEngine:
         self.console.print(f"\nYou have {len(self.player.unlocked_achievements)} achievements.")
 
         if Confirm.ask("\nAre you sure?", default=False):
-            self.player.unlocked_achievements = []
-            self.state_manager.save_progress(self.player)
+            self.player.unlocked_achievements = set()
+            self._save_progress(force=True)
             self.console.print(f"\n[bold green]Achievements reset![/bold green]")
         else:
             self.console.print("\n[dim]Cancelled.[/dim]")
@@ -494,7 +642,7 @@ class GameEngine:
 
     def _switch_player(self):
         """Switch to a different player."""
-        self.state_manager.save_progress(self.player)
+        self._save_progress(force=True)
         self.console.print("\n[dim]Saving...[/dim]")
         time.sleep(0.5)
         self._player_selection()
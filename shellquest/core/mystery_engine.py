@@ -1,10 +1,13 @@
 """Murder Mystery mode engine for ShellQuest."""
 
+import mmap
+import os
+import sys
 import time
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, FrozenSet, Optional, Any, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.align import Align
@@ -17,10 +20,27 @@ from rich.table import Table
 from ..ui.theme import Theme
 from ..ui.components import UIComponents
 from ..models.player import PlayerStats
-from ..utils import logger, clear_terminal, PREMIUM_HINT_COST
+from ..utils import (
+    logger, clear_terminal, PREMIUM_HINT_COST, YAML_LOADER, DATACLASS_SLOTS
+)
 
+_CASES_DIR = Path(__file__).parent.parent.parent / "data" / "mystery"
 
-@dataclass
+# The two premium hints, by question type
+_PREMIUM_HINT_CHOICE = Text.from_markup(
+    "\n[bold yellow]💎 Premium Hint:[/bold yellow] "
+    "Two of these options are clearly wrong. Focus on the remaining two.\n"
+)
+_PREMIUM_HINT_COMMAND = Text.from_markup(
+    "\n[bold yellow]💎 Premium Hint:[/bold yellow] "
+    "Think step by step about what the command needs to do. Start with the base command.\n"
+)
+
+# Question types answered by picking one of challenge.options
+_CHOICE_TYPES = frozenset(("multiple_choice", "what_does_it_do"))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Challenge:
     """A mystery challenge/question."""
     id: str
@@ -32,9 +52,30 @@ class Challenge:
     success_narrative: str
     clue_unlocked: str
     options: List[str] = field(default_factory=list)
+    # Normalized answers for check_answer; derived from correct_answers
+    correct_answers_lower: FrozenSet[str] = field(default=frozenset(), repr=False)
+    # Option prompt pieces, derived from options: "A/B/C", "1/2/3" and the
+    # accepted keys ("A".. and "1"..) mapped to option indexes
+    letters: str = field(init=False, repr=False, compare=False)
+    numbers: str = field(init=False, repr=False, compare=False)
+    option_keys: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.correct_answers_lower:
+            object.__setattr__(self, "correct_answers_lower", frozenset(
+                answer.strip().lower() for answer in self.correct_answers
+            ))
+        count = len(self.options)
+        letter_keys = [chr(65 + i) for i in range(count)]
+        number_keys = [str(i + 1) for i in range(count)]
+        object.__setattr__(self, "letters", '/'.join(letter_keys))
+        object.__setattr__(self, "numbers", '/'.join(number_keys))
+        keys = {key: i for i, key in enumerate(letter_keys)}
+        keys.update((key, i) for i, key in enumerate(number_keys))
+        object.__setattr__(self, "option_keys", keys)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Scene:
     """A mystery scene."""
     id: str
@@ -45,7 +86,7 @@ class Scene:
     challenges: List[Challenge]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Suspect:
     """A mystery suspect."""
     id: str
@@ -56,7 +97,7 @@ class Suspect:
     motive: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MysteryCase:
     """A complete mystery case."""
     id: str
@@ -70,6 +111,130 @@ class MysteryCase:
     conclusion_success: str
     conclusion_failure: str
     rewards: Dict[str, Any]
+    # One clue per challenge; counted while loading, or here if not given
+    total_clues: int = field(default=0, compare=False)
+
+    def __post_init__(self):
+        if not self.total_clues:
+            self.total_clues = sum(len(scene.challenges) for scene in self.scenes)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class CaseHeader:
+    """The fields of a case shown on the case select menu."""
+    id: str
+    title: str
+    subtitle: str
+    difficulty: str
+
+
+def _read_flat_mapping(events) -> Dict[str, str]:
+    """Scalar entries of the mapping whose start event was just consumed."""
+    fields = {}
+    key = None
+    depth = 0
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            if depth == 0:
+                return fields
+            depth -= 1
+            if depth == 0:
+                key = None
+        elif depth == 0 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+            if key is None:
+                key = getattr(event, 'value', None)
+            else:
+                if isinstance(event, yaml.ScalarEvent):
+                    fields[key] = event.value
+                key = None
+    return fields
+
+
+def _read_case_section(stream) -> Optional[Dict[str, str]]:
+    """Scalar fields of the top-level 'case' mapping.
+
+    Walks parser events and stops once that mapping ends, so suspects and
+    scenes later in the file are never parsed or constructed.
+    """
+    events = yaml.parse(stream, Loader=YAML_LOADER)
+    depth = 0
+    key = None
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            if depth == 1 and key == 'case' and isinstance(event, yaml.MappingStartEvent):
+                return _read_flat_mapping(events)
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 1:
+                key = None
+        elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+            key = getattr(event, 'value', None) if key is None else None
+    return None
+
+
+def _construct_suspect(loader, node) -> Suspect:
+    s = loader.construct_mapping(node, deep=True)
+    return Suspect(
+        id=s['id'],
+        name=s['name'],
+        role=s['role'],
+        description=s['description'],
+        alibi=s['alibi'],
+        motive=s['motive']
+    )
+
+
+def _construct_challenge(loader, node) -> Challenge:
+    ch = loader.construct_mapping(node, deep=True)
+    # Handle both single correct_answer and list of correct_answers
+    correct = ch.get('correct_answers', [ch.get('correct_answer', '')])
+    if isinstance(correct, str):
+        correct = [correct]
+
+    return Challenge(
+        id=ch['id'],
+        context=ch['context'],
+        # A handful of values shared by every challenge; intern so
+        # comparisons against the literals hit the identity fast path
+        question_type=sys.intern(ch['question_type']),
+        question=ch['question'],
+        correct_answers=correct,
+        hint=ch['hint'],
+        success_narrative=ch['success_narrative'],
+        clue_unlocked=ch['clue_unlocked'],
+        options=ch.get('options', [])
+    )
+
+
+def _construct_scene(loader, node) -> Scene:
+    sc = loader.construct_mapping(node, deep=True)
+    return Scene(
+        id=sc['id'],
+        title=sc['title'],
+        location=sc['location'],
+        narrative=sc['narrative'],
+        objective=sc['objective'],
+        challenges=list(sc.get('challenges', []))
+    )
+
+
+class _CaseLoader(YAML_LOADER):
+    """Case file loader that builds the dataclasses while constructing.
+
+    Case files carry no tags, so path resolvers tag the suspect, scene and
+    challenge mappings by their position in the document.
+    """
+
+
+_CaseLoader.add_path_resolver('!suspect', ['suspects', None], dict)
+_CaseLoader.add_path_resolver('!scene', ['scenes', None], dict)
+_CaseLoader.add_path_resolver('!challenge', ['scenes', None, 'challenges', None], dict)
+_CaseLoader.add_constructor('!suspect', _construct_suspect)
+_CaseLoader.add_constructor('!scene', _construct_scene)
+_CaseLoader.add_constructor('!challenge', _construct_challenge)
 
 
 class MysteryEngine:
@@ -83,62 +248,92 @@ class MysteryEngine:
         self.total_clues: int = 0
         self.start_time: float = 0
         self.scenes_completed: int = 0
+        # Parsed cases keyed by path, valid while (mtime_ns, size) match
+        self._case_cache: Dict[Path, Tuple[int, int, MysteryCase]] = {}
+        # (filename, header) for every readable case_*.yaml, sorted by
+        # filename; rebuilt only when the directory mtime_ns changes
+        self._case_index: Optional[List[Tuple[str, CaseHeader]]] = None
+        self._case_index_mtime: Optional[int] = None
+
+    def _ensure_case_index(self) -> List[Tuple[str, CaseHeader]]:
+        """Scan the case directory and read each header once, then reuse them."""
+        try:
+            dir_mtime = _CASES_DIR.stat().st_mtime_ns
+        except OSError:
+            return []
+        if self._case_index is None or self._case_index_mtime != dir_mtime:
+            with os.scandir(_CASES_DIR) as entries:
+                case_files = sorted(
+                    entry.name for entry in entries
+                    if entry.name.startswith("case_") and entry.name.endswith(".yaml")
+                    and entry.is_file()
+                )
+            index = []
+            for case_file in case_files:
+                header = self.load_case_header(case_file)
+                if header:
+                    index.append((case_file, header))
+            self._case_index = index
+            self._case_index_mtime = dir_mtime
+        return self._case_index
+
+    def load_case_header(self, case_file: str) -> Optional[CaseHeader]:
+        """Read just the menu fields of a case; see load_case for the rest."""
+        data_path = _CASES_DIR / case_file
+
+        try:
+            with open(data_path, 'rb') as f:
+                fields = _read_case_section(f)
+            if fields is None:
+                logger.error(f"No case section in mystery case: {data_path}")
+                return None
+            return CaseHeader(
+                id=fields['id'],
+                title=fields['title'],
+                subtitle=fields['subtitle'],
+                difficulty=fields['difficulty']
+            )
+
+        except FileNotFoundError:
+            logger.error(f"Mystery case file not found: {data_path}")
+            return None
+        except yaml.YAMLError as e:
+            logger.error(f"YAML parsing error in mystery case: {e}")
+            return None
+        except KeyError as e:
+            logger.error(f"Missing required field in mystery case: {e}")
+            return None
 
     def load_case(self, case_file: str) -> Optional[MysteryCase]:
         """Load a mystery case from YAML file."""
-        data_path = Path(__file__).parent.parent.parent / "data" / "mystery" / case_file
+        data_path = _CASES_DIR / case_file
 
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            st = data_path.stat()
+            cached = self._case_cache.get(data_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                case = cached[2]
+                self.total_clues = case.total_clues
+                return case
+
+            if st.st_size == 0:
+                logger.error(f"Mystery case file is empty: {data_path}")
+                return None
+
+            # Hand the parser the mapped file; it decodes UTF-8 itself
+            with open(data_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = yaml.load(mm, Loader=_CaseLoader)
 
             case_data = data['case']
+            suspects = list(data.get('suspects') or ())
 
-            # Parse suspects
-            suspects = []
-            for s in data.get('suspects', []):
-                suspects.append(Suspect(
-                    id=s['id'],
-                    name=s['name'],
-                    role=s['role'],
-                    description=s['description'],
-                    alibi=s['alibi'],
-                    motive=s['motive']
-                ))
-
-            # Parse scenes
+            # Collect scenes and count clues in the same pass
             scenes = []
-            for sc in data.get('scenes', []):
-                challenges = []
-                for ch in sc.get('challenges', []):
-                    # Handle both single correct_answer and list of correct_answers
-                    correct = ch.get('correct_answers', [ch.get('correct_answer', '')])
-                    if isinstance(correct, str):
-                        correct = [correct]
-
-                    challenges.append(Challenge(
-                        id=ch['id'],
-                        context=ch['context'],
-                        question_type=ch['question_type'],
-                        question=ch['question'],
-                        correct_answers=correct,
-                        hint=ch['hint'],
-                        success_narrative=ch['success_narrative'],
-                        clue_unlocked=ch['clue_unlocked'],
-                        options=ch.get('options', [])
-                    ))
-
-                scenes.append(Scene(
-                    id=sc['id'],
-                    title=sc['title'],
-                    location=sc['location'],
-                    narrative=sc['narrative'],
-                    objective=sc['objective'],
-                    challenges=challenges
-                ))
-
-            # Count total clues
-            total_clues = sum(len(scene.challenges) for scene in scenes)
+            total_clues = 0
+            for scene in data.get('scenes') or ():
+                scenes.append(scene)
+                total_clues += len(scene.challenges)
 
             case = MysteryCase(
                 id=case_data['id'],
@@ -151,10 +346,12 @@ class MysteryEngine:
                 scenes=scenes,
                 conclusion_success=data['conclusion']['success'],
                 conclusion_failure=data['conclusion']['failure'],
-                rewards=data['rewards']
+                rewards=data['rewards'],
+                total_clues=total_clues
             )
 
             self.total_clues = total_clues
+            self._case_cache[data_path] = (st.st_mtime_ns, st.st_size, case)
             logger.info(f"Loaded mystery case: {case.title} with {len(scenes)} scenes")
             return case
 
@@ -197,10 +394,9 @@ class MysteryEngine:
         self.console.print(header)
 
         # List available cases
-        cases_path = Path(__file__).parent.parent.parent / "data" / "mystery"
-        case_files = list(cases_path.glob("case_*.yaml"))
+        available_cases = self._ensure_case_index()
 
-        if not case_files:
+        if not available_cases:
             self.console.print("\n[yellow]No mystery cases available yet![/yellow]")
             self.console.print("\n[dim]Press ENTER to return...[/dim]")
             input()
@@ -208,19 +404,15 @@ class MysteryEngine:
 
         self.console.print("\n[bold]Available Cases:[/bold]\n")
 
-        available_cases = []
-        for i, case_file in enumerate(sorted(case_files), 1):
-            case = self.load_case(case_file.name)
-            if case:
-                available_cases.append((case_file.name, case))
-
-                # Check if solved
-                solved = case.id in getattr(self.player, 'solved_mysteries', [])
-                status = "[bold green]SOLVED[/bold green]" if solved else ""
+        solved_ids = set(getattr(self.player, 'solved_mysteries', None) or ())
+        for i, (_, header) in enumerate(available_cases, 1):
+            # Check if solved
+            solved = header.id in solved_ids
+            status = "[bold green]SOLVED[/bold green]" if solved else ""
 
-                self.console.print(f"  {i}. [bold]{case.title}[/bold] {status}")
-                self.console.print(f"     [dim]{case.subtitle}[/dim]")
-                self.console.print(f"     [dim]Difficulty: {case.difficulty.title()}[/dim]\n")
+            self.console.print(f"  {i}. [bold]{header.title}[/bold] {status}")
+            self.console.print(f"     [dim]{header.subtitle}[/dim]")
+            self.console.print(f"     [dim]Difficulty: {header.difficulty.title()}[/dim]\n")
 
         self.console.print(f"  {len(available_cases) + 1}. [dim]Back to Menu[/dim]")
 
@@ -230,12 +422,17 @@ class MysteryEngine:
         if int(choice) > len(available_cases):
             return None
 
-        _, selected_case = available_cases[int(choice) - 1]
+        # Only the chosen case is loaded in full
+        case_file, _ = available_cases[int(choice) - 1]
+        selected_case = self.load_case(case_file)
+        if selected_case is None:
+            self.console.print("\n[red]This case could not be loaded.[/red]")
         return selected_case
 
     def run_case(self, case: MysteryCase):
         """Run a complete mystery case."""
         self.current_case = case
+        self.total_clues = case.total_clues
         self.clues_found = []
         self.scenes_completed = 0
         self.start_time = time.time()
@@ -382,8 +579,12 @@ class MysteryEngine:
 
         # Question
         question_text = challenge.question.strip()
+        # Parsed once per challenge; H can be pressed any number of times
+        hint_text = Text.from_markup(
+            f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {challenge.hint}\n"
+        )
 
-        if challenge.question_type == "multiple_choice" or challenge.question_type == "what_does_it_do":
+        if challenge.question_type in _CHOICE_TYPES:
             # Show options with letters
             self.console.print(f"\n[bold]{question_text}[/bold]\n")
             for i, option in enumerate(challenge.options, 1):
@@ -391,55 +592,35 @@ class MysteryEngine:
                 self.console.print(f"  {letter}) {option}")
             self.console.print(f"\n[dim][H] Hint  [P] Premium (40💎)  [Q] Quit case[/dim]\n")
 
-            # Build dynamic prompt text
-            num_options = len(challenge.options)
-            letters = '/'.join([chr(65 + i) for i in range(num_options)])
-            numbers = '/'.join([str(i + 1) for i in range(num_options)])
-            prompt_text = f"Your answer ({letters} or {numbers})"
+            prompt_text = f"Your answer ({challenge.letters} or {challenge.numbers})"
 
             while True:
                 answer = Prompt.ask(prompt_text).strip()
+                key = answer.upper()
 
-                if answer.upper() == 'Q':
+                if key == 'Q':
                     return None
-                elif answer.upper() == 'H':
-                    self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {challenge.hint}\n")
+                elif key == 'H':
+                    self.console.print(hint_text)
                     continue
-                elif answer.upper() == 'P':
+                elif key == 'P':
                     if self.player.spend_credits(PREMIUM_HINT_COST):
-                        # Generate a premium hint based on question type
+                        # Premium hint depends only on question type
                         if challenge.question_type == "multiple_choice":
-                            premium = "Two of these options are clearly wrong. Focus on the remaining two."
+                            self.console.print(_PREMIUM_HINT_CHOICE)
                         else:
-                            premium = "Think step by step about what the command needs to do. Start with the base command."
-                        self.console.print(f"\n[bold yellow]💎 Premium Hint:[/bold yellow] {premium}\n")
+                            self.console.print(_PREMIUM_HINT_COMMAND)
                     else:
                         self.console.print(f"[red]Not enough credits! Need {PREMIUM_HINT_COST}💎 (You have {self.player.credits}💎)[/red]")
                     continue
 
-                # Validate answer - accept letters or numbers
-                normalized_answer = answer.upper()
-                idx = -1
-
-                # Check if it's a valid letter (A, B, C, D based on number of options)
-                if len(normalized_answer) == 1 and normalized_answer.isalpha():
-                    letter_idx = ord(normalized_answer) - ord('A')
-                    # Only accept if within valid range
-                    if 0 <= letter_idx < num_options:
-                        idx = letter_idx
-                # Check if it's a number
-                elif len(normalized_answer) == 1 and normalized_answer.isdigit():
-                    num_idx = int(normalized_answer) - 1
-                    # Only accept if within valid range
-                    if 0 <= num_idx < num_options:
-                        idx = num_idx
-
-                # If valid index was found, use it
-                if idx >= 0:
+                # Validate answer - accept an in-range letter or number
+                idx = challenge.option_keys.get(key)
+                if idx is not None:
                     user_answer = challenge.options[idx]
                     break
 
-                self.console.print(f"[yellow]Please enter {letters} or {numbers}[/yellow]")
+                self.console.print(f"[yellow]Please enter {challenge.letters} or {challenge.numbers}[/yellow]")
 
         else:
             # Command builder - free text
@@ -453,20 +634,20 @@ class MysteryEngine:
 
             while True:
                 answer = Prompt.ask("[bold]$[/bold] ").strip()
+                key = answer.upper()
 
-                if answer.upper() == 'Q':
+                if key == 'Q':
                     return None
-                elif answer.upper() == 'H':
-                    self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {challenge.hint}\n")
+                elif key == 'H':
+                    self.console.print(hint_text)
                     continue
-                elif answer.upper() == 'P':
+                elif key == 'P':
                     if self.player.spend_credits(PREMIUM_HINT_COST):
-                        # Generate a premium hint based on question type
+                        # Premium hint depends only on question type
                         if challenge.question_type == "multiple_choice":
-                            premium = "Two of these options are clearly wrong. Focus on the remaining two."
+                            self.console.print(_PREMIUM_HINT_CHOICE)
                         else:
-                            premium = "Think step by step about what the command needs to do. Start with the base command."
-                        self.console.print(f"\n[bold yellow]💎 Premium Hint:[/bold yellow] {premium}\n")
+                            self.console.print(_PREMIUM_HINT_COMMAND)
                     else:
                         self.console.print(f"[red]Not enough credits! Need {PREMIUM_HINT_COST}💎 (You have {self.player.credits}💎)[/red]")
                     continue
@@ -503,13 +684,7 @@ class MysteryEngine:
 
     def check_answer(self, user_answer: str, challenge: Challenge) -> bool:
         """Check if the answer is correct."""
-        user_answer = user_answer.strip().lower()
-
-        for correct in challenge.correct_answers:
-            if user_answer == correct.lower():
-                return True
-
-        return False
+        return user_answer.strip().lower() in challenge.correct_answers_lower
 
     def show_conclusion(self, case: MysteryCase):
         """Show case conclusion."""
@@ -1,19 +1,69 @@
 """Quiz engine for question selection and answer validation."""
 
 import random
-from typing import List, Optional, Tuple
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
+from typing import AbstractSet, Deque, List, Optional, Sequence, Tuple
 from ..models.question import Question
 from ..models.player import PlayerStats, PlayerSession
 
 
+def _question_weights(ids: Sequence[str], commands: Sequence[str], type_codes: Sequence[int],
+                      recent_ids: AbstractSet[str], seen_ids: AbstractSet[str],
+                      weak_areas: AbstractSet[str],
+                      type_factor: Sequence[float]) -> List[float]:
+    """Selection weight for each question, from plain per-question columns.
+
+    type_factor is indexed by the question's type code.
+    """
+    return [
+        # Very low weight for recent questions (deprioritize, don't skip)
+        (0.1 if qid in recent_ids else 1.0)
+        # Prioritize weak areas (2x weight)
+        * (2.0 if command in weak_areas else 1.0)
+        * type_factor[type_code]
+        # Slightly favor questions player hasn't seen yet
+        * (1.0 if qid in seen_ids else 1.2)
+        for qid, command, type_code in zip(ids, commands, type_codes)
+    ]
+
+
+def _weighted_index(weights: List[float]) -> Optional[int]:
+    """Draw an index with probability proportional to its weight.
+
+    Binary search over the running totals. Returns None when no weight is
+    positive.
+    """
+    cumulative = list(accumulate(weights))
+    if not cumulative or cumulative[-1] <= 0:
+        return None
+    # random() is the C-level generator call; uniform() wraps it in Python
+    r = random.random() * cumulative[-1]
+    return min(bisect_left(cumulative, r), len(cumulative) - 1)
+
+
 class QuizEngine:
     """Manages quiz question selection and answer validation."""
 
+    # How many of the player's / this session's latest answers count as recent
+    PLAYER_RECENT = 20
+    SESSION_RECENT = 10
+
     def __init__(self, question_pool: List[Question]):
         """Initialize quiz engine with a pool of questions."""
         self.question_pool = question_pool
         self.current_question: Optional[Question] = None
-        self.session_questions: List[str] = []  # Question IDs asked this session
+        # IDs of the last few questions asked this session
+        self.session_questions: Deque[str] = deque(maxlen=self.SESSION_RECENT)
+
+        # Per-question columns read by the weighting pass, built once per
+        # pool; question types are stored as indexes into _type_names
+        self._ids = tuple(q.id for q in question_pool)
+        self._commands = tuple(q.command for q in question_pool)
+        self._type_names = tuple(sorted({q.type.value for q in question_pool}))
+        type_code = {name: code for code, name in enumerate(self._type_names)}
+        self._type_codes = tuple(type_code[q.type.value] for q in question_pool)
 
     def select_next_question(self, player: PlayerStats, session: PlayerSession) -> Optional[Question]:
         """
@@ -27,54 +77,27 @@ class QuizEngine:
         if not self.question_pool:
             return None
 
-        # Calculate weights for each question
-        weights = {}
-        for question in self.question_pool:
-            weight = 1.0
-
-            # Avoid recently asked questions (last 20 from player history)
-            recent_ids = player.recently_answered[-20:] + self.session_questions[-10:]
-            if question.id in recent_ids:
-                weight *= 0.1  # Very low weight (deprioritize, don't skip)
-
-            # Prioritize weak areas (2x weight)
-            if question.command in player.weak_areas:
-                weight *= 2.0
-
-            # Balance question types in session
-            q_type_str = question.type.value
-            type_count = session.question_types_used.get(q_type_str, 0)
-            weight *= 1.0 / (1.0 + type_count * 0.3)
-
-            # Slightly favor questions player hasn't seen yet
-            if question.id not in player.recently_answered:
-                weight *= 1.2
-
-            weights[question.id] = weight
-
-        if not weights:
-            # Fallback: if all questions have been asked recently, pick any
+        # Avoid recently asked questions (last 20 from player history)
+        recent_ids = frozenset(
+            player.recently_answered[-self.PLAYER_RECENT:]
+        ).union(self.session_questions)
+        seen_ids = frozenset(player.recently_answered)
+        weak_areas = frozenset(player.weak_areas)
+        # Balance question types in session
+        types_used = session.question_types_used
+        type_factor = [
+            1.0 / (1.0 + types_used.get(t, 0) * 0.3) for t in self._type_names
+        ]
+
+        weights = _question_weights(
+            self._ids, self._commands, self._type_codes,
+            recent_ids, seen_ids, weak_areas, type_factor,
+        )
+        index = _weighted_index(weights)
+        if index is None:
             self.current_question = random.choice(self.question_pool)
         else:
-            # Weighted random selection
-            questions_and_weights = [(q, weights[q.id]) for q in self.question_pool if q.id in weights]
-            if questions_and_weights:
-                total_weight = sum(w for _, w in questions_and_weights)
-                if total_weight <= 0:
-                    self.current_question = random.choice(self.question_pool)
-                else:
-                    r = random.uniform(0, total_weight)
-                    upto = 0
-                    for question, weight in questions_and_weights:
-                        upto += weight
-                        if upto >= r:
-                            self.current_question = question
-                            break
-                    else:
-                        # Fallback if loop completes without break (edge case)
-                        self.current_question = questions_and_weights[-1][0]
-            else:
-                self.current_question = random.choice(self.question_pool)
+            self.current_question = self.question_pool[index]
 
         self.session_questions.append(self.current_question.id)
         return self.current_question
@@ -123,5 +146,5 @@ class QuizEngine:
 
     def reset_session(self):
         """Reset session questions list."""
-        self.session_questions = []
+        self.session_questions = deque(maxlen=self.SESSION_RECENT)
         self.current_question = None
@@ -1,8 +1,8 @@
 """Quiz mode handlers for ShellQuest."""
 
 import time
-from typing import Optional
-from rich.console import Console
+from typing import Dict, Optional, Tuple
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
@@ -12,34 +12,90 @@ from ..models.player import PlayerStats, PlayerSession
 from ..models.question import Question
 from ..ui.components import UIComponents
 from ..ui.theme import Theme
-from ..utils import clear_terminal, PREMIUM_HINT_COST
+from ..utils import clear_terminal, wait_for_key, PREMIUM_HINT_COST
 from .quiz_engine import QuizEngine
 from .scoring_system import ScoringSystem
 
+SPEED_ROUND_SECONDS = 60
+
+# Static screens and prompt lines, built once instead of per question
+_SPEED_INTRO_PANEL = Panel(
+    Align.center(Text.assemble(
+        ("\n⚡ SPEED ROUND ⚡\n\n", f"bold {Theme.WARNING}"),
+        ("Answer as many questions as possible!\n", "white"),
+        (f"You have {SPEED_ROUND_SECONDS} seconds.\n\n", "dim"),
+        ("Press any key to start...\n", "bold"),
+    )),
+    border_style=Theme.WARNING
+)
+_PRACTICE_INTRO_PANEL = Panel(
+    Align.center(Text.assemble(
+        ("\n🎓 PRACTICE MODE 🎓\n\n", f"bold {Theme.INFO}"),
+        ("• No XP gained or lost\n", "white"),
+        ("• Hints are free\n", "white"),
+        ("• Learn at your own pace\n", "white"),
+        ("\nPress any key to start...\n", "dim"),
+    )),
+    border_style=Theme.INFO
+)
+_HINT_PROMPT_TEXT = Text.from_markup(
+    f"\n[dim][H] Hint  [P] Premium Hint ({PREMIUM_HINT_COST}💎)  [S] Skip  [Q] Quit[/dim]\n"
+)
+_PRACTICE_HINT_PROMPT_TEXT = Text.from_markup(
+    f"\n[dim][H] Free Hint  [P] Premium ({PREMIUM_HINT_COST}💎)  [S] Skip  [Q] Quit[/dim]\n"
+)
+_PRESS_KEY_TEXT = Text.from_markup("\n[dim]Press any key to continue...[/dim]")
+_PRESS_KEY_MENU_TEXT = Text.from_markup("\n[dim]Press any key to return to menu...[/dim]")
+_SUMMARY_TITLE = Text.from_markup("[bold]📊 Session Summary[/bold]")
+
 
 class QuizHandler:
     """Handles all quiz modes."""
 
+    __slots__ = ('console', 'scoring', 'quiz_engine', 'session', '_engine_cache')
+
     def __init__(self, console: Console, scoring_system: ScoringSystem):
         self.console = console
         self.scoring = scoring_system
         self.quiz_engine: Optional[QuizEngine] = None
         self.session: Optional[PlayerSession] = None
+        # (id(questions), difficulty) -> (questions, engine); questions is kept
+        # so a recycled id can't hand back an engine for a different list
+        self._engine_cache: Dict[Tuple[int, str], Tuple[list, QuizEngine]] = {}
+
+    def _engine_for(self, questions: list, difficulty: str = "mixed") -> Optional[QuizEngine]:
+        """Quiz engine for questions at difficulty, reused across sessions.
+
+        Returns None if no question matches the difficulty.
+        """
+        key = (id(questions), difficulty)
+        cached = self._engine_cache.get(key)
+        if cached is not None and cached[0] is questions:
+            engine = cached[1]
+            engine.reset_session()
+            return engine
 
-    def run_quiz(self, player: PlayerStats, questions: list, difficulty: str,
-                 num_questions: int, achievement_system, on_save) -> None:
-        """Run a standard quiz session."""
         if difficulty == "mixed":
             pool = questions
         else:
             pool = [q for q in questions if q.difficulty == difficulty]
-
         if not pool:
+            return None
+
+        engine = QuizEngine(pool)
+        self._engine_cache[key] = (questions, engine)
+        return engine
+
+    def run_quiz(self, player: PlayerStats, questions: list, difficulty: str,
+                 num_questions: int, achievement_system, on_save) -> None:
+        """Run a standard quiz session."""
+        engine = self._engine_for(questions, difficulty)
+        if engine is None:
             self.console.print(f"\n[bold red]No questions available![/bold red]")
             time.sleep(2)
             return
 
-        self.quiz_engine = QuizEngine(pool)
+        self.quiz_engine = engine
         self.session = PlayerSession()
 
         for q_num in range(1, num_questions + 1):
@@ -56,29 +112,19 @@ class QuizHandler:
             time.sleep(2)
             return
 
-        self.quiz_engine = QuizEngine(questions)
+        self.quiz_engine = self._engine_for(questions)
         self.session = PlayerSession()
 
         clear_terminal()
-        self.console.print(Panel(
-            Align.center(Text.assemble(
-                ("\n⚡ SPEED ROUND ⚡\n\n", f"bold {Theme.WARNING}"),
-                ("Answer as many questions as possible!\n", "white"),
-                ("You have 60 seconds.\n\n", "dim"),
-                ("Press ENTER to start...\n", "bold"),
-            )),
-            border_style=Theme.WARNING
-        ))
-        input()
+        self.console.print(_SPEED_INTRO_PANEL)
+        wait_for_key()
 
-        start_time = time.time()
-        time_limit = 60
+        deadline = time.monotonic() + SPEED_ROUND_SECONDS
         q_num = 0
 
-        while (time.time() - start_time) < time_limit:
+        while time.monotonic() < deadline:
             q_num += 1
-            remaining = int(time_limit - (time.time() - start_time))
-            if not self._run_speed_question(player, q_num, remaining):
+            if not self._run_speed_question(player, q_num, deadline):
                 break
 
         self._show_session_summary(player)
@@ -91,21 +137,12 @@ class QuizHandler:
             time.sleep(2)
             return
 
-        self.quiz_engine = QuizEngine(questions)
+        self.quiz_engine = self._engine_for(questions)
         self.session = PlayerSession()
 
         clear_terminal()
-        self.console.print(Panel(
-            Align.center(Text.assemble(
-                ("\n🎓 PRACTICE MODE 🎓\n\n", f"bold {Theme.INFO}"),
-                ("• No XP gained or lost\n", "white"),
-                ("• Hints are free\n", "white"),
-                ("• Learn at your own pace\n", "white"),
-                ("\nPress ENTER to start...\n", "dim"),
-            )),
-            border_style=Theme.INFO
-        ))
-        input()
+        self.console.print(_PRACTICE_INTRO_PANEL)
+        wait_for_key()
 
         q_num = 0
         while True:
@@ -122,8 +159,8 @@ class QuizHandler:
             )),
             border_style=Theme.INFO
         ))
-        self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-        input()
+        self.console.print(_PRESS_KEY_TEXT)
+        wait_for_key()
 
     def _run_single_question(self, player: PlayerStats, q_num: int, total: int,
                              achievement_system) -> bool:
@@ -132,35 +169,37 @@ class QuizHandler:
         if not question:
             return False
 
-        clear_terminal()
-        self.console.print(UIComponents.create_header())
-        _, _, xp_needed = self.scoring.get_level_progress(player.xp)
-        progress_pct = self.scoring.get_progress_percentage(player.xp)
-        self.console.print(UIComponents.create_stats_panel(player, xp_needed, progress_pct))
-        self.console.print(UIComponents.create_question_panel(question, q_num, total))
-        self.console.print(f"\n[dim][H] Hint  [P] Premium Hint ({PREMIUM_HINT_COST}💎)  [S] Skip  [Q] Quit[/dim]\n")
-
-        start_time = time.time()
+        clear_terminal(include_scrollback=False)
+        _, _, xp_needed, progress_pct = self.scoring.get_full_progress(player.xp)
+        self.console.print(Group(
+            UIComponents.create_header(),
+            UIComponents.create_stats_panel(player, xp_needed, progress_pct),
+            UIComponents.create_question_panel(question, q_num, total),
+            _HINT_PROMPT_TEXT,
+        ))
+
+        start_time = time.monotonic()
         hint_used = False
 
         while True:
             user_answer = Prompt.ask("Your answer").strip()
+            key = user_answer.upper()
 
-            if user_answer.upper() == 'Q':
+            if key == 'Q':
                 return False
-            elif user_answer.upper() == 'S':
+            elif key == 'S':
                 self.console.print(f"[yellow]Skipped! Answer was: {question.correct_answer[0]}[/yellow]")
                 player.record_answer(question.command, False, question.id)
                 self.session.record_question(question.type.value, False, 0)
-                self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-                input()
+                self.console.print(_PRESS_KEY_TEXT)
+                wait_for_key()
                 return True
-            elif user_answer.upper() == 'H':
+            elif key == 'H':
                 hint = self.quiz_engine.get_hint()
                 self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {hint}\n")
                 hint_used = True
                 continue
-            elif user_answer.upper() == 'P':
+            elif key == 'P':
                 if player.spend_credits(PREMIUM_HINT_COST):
                     premium = question.get_premium_hint()
                     self.console.print(f"\n[bold {Theme.WARNING}]💎 Premium Hint:[/bold {Theme.WARNING}] {premium}\n")
@@ -171,52 +210,56 @@ class QuizHandler:
             else:
                 break
 
-        time_taken = time.time() - start_time
+        time_taken = time.monotonic() - start_time
         is_correct, explanation = self.quiz_engine.validate_answer(user_answer)
 
         xp_gained = 0
         if is_correct:
             xp_gained = self.scoring.calculate_xp(question, time_taken, hint_used, player.streak)
-            player.xp += xp_gained
 
-        player.record_answer(question.command, is_correct, question.id)
+        xp_before = player.xp
+        player.apply_result(question.command, is_correct, question.id, xp_gained)
         self.session.record_question(question.type.value, is_correct, xp_gained)
 
-        self.console.print()
-        self.console.print(UIComponents.create_result_panel(
-            is_correct, explanation, xp_gained,
-            user_answer if not is_correct else None,
-            question.correct_answer[0] if not is_correct else None
-        ))
-
+        # Achievement rewards add XP too, so the level is settled afterwards
         unlocked = achievement_system.check_achievements(player, self.session)
-        for achievement in unlocked:
-            self.console.print(UIComponents.create_achievement_notification(achievement))
-
-        player.level = self.scoring.get_level(player.xp)
+        if player.xp != xp_before:
+            player.level = self.scoring.get_level(player.xp)
+        self.console.print(Group(
+            Text(),
+            UIComponents.create_result_panel(
+                is_correct, explanation, xp_gained,
+                user_answer if not is_correct else None,
+                question.correct_answer[0] if not is_correct else None
+            ),
+            *(UIComponents.create_achievement_notification(a) for a in unlocked),
+        ))
 
         if not is_correct:
-            self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-            input()
+            self.console.print(_PRESS_KEY_TEXT)
+            wait_for_key()
         else:
             time.sleep(1.5)
         return True
 
-    def _run_speed_question(self, player: PlayerStats, q_num: int, time_remaining: int) -> bool:
-        """Run a single speed round question."""
+    def _run_speed_question(self, player: PlayerStats, q_num: int, deadline: float) -> bool:
+        """Run a single speed round question; deadline is a time.monotonic() value."""
         question = self.quiz_engine.select_next_question(player, self.session)
         if not question:
             return False
 
-        clear_terminal()
-        self.console.print(f"[bold {Theme.WARNING}]⏱️  Time Remaining: {time_remaining}s[/bold {Theme.WARNING}]")
-        self.console.print(UIComponents.create_question_panel(question, q_num, 999))
+        time_remaining = max(int(deadline - time.monotonic()), 0)
+        clear_terminal(include_scrollback=False)
+        self.console.print(Group(
+            Text(f"⏱️  Time Remaining: {time_remaining}s", style=f"bold {Theme.WARNING}"),
+            UIComponents.create_question_panel(question, q_num, 999),
+        ))
 
-        question_start = time.time()
+        question_start = time.monotonic()
         user_answer = Prompt.ask("Your answer").strip()
-        time_taken = time.time() - question_start
+        time_taken = time.monotonic() - question_start
 
-        if user_answer.upper() == 'Q':
+        if user_answer in ('q', 'Q'):
             return False
 
         is_correct, _ = self.quiz_engine.validate_answer(user_answer)
@@ -224,18 +267,21 @@ class QuizHandler:
 
         if is_correct:
             xp_gained = self.scoring.calculate_xp(question, time_taken, False, player.streak)
-            player.xp += xp_gained
             self.console.print(f"[bold {Theme.SUCCESS}]✓ Correct! +{xp_gained} XP[/bold {Theme.SUCCESS}]")
         else:
-            self.console.print(f"[bold {Theme.ERROR}]✗ Wrong![/bold {Theme.ERROR}]")
-            self.console.print(f"[white]Correct answer: {question.correct_answer[0]}[/white]")
-
-        player.record_answer(question.command, is_correct, question.id)
+            self.console.print(Group(
+                Text("✗ Wrong!", style=f"bold {Theme.ERROR}"),
+                Text(f"Correct answer: {question.correct_answer[0]}", style="white"),
+            ))
+
+        player.apply_result(question.command, is_correct, question.id, xp_gained)
+        if xp_gained:
+            player.level = self.scoring.get_level(player.xp)
         self.session.record_question(question.type.value, is_correct, xp_gained)
 
         if not is_correct:
-            self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-            input()
+            self.console.print(_PRESS_KEY_TEXT)
+            wait_for_key()
         else:
             time.sleep(1.5)
         return True
@@ -246,25 +292,28 @@ class QuizHandler:
         if not question:
             return False
 
-        clear_terminal()
-        self.console.print(f"[bold {Theme.INFO}]🎓 Practice Mode - Question {q_num}[/bold {Theme.INFO}]")
-        self.console.print(UIComponents.create_question_panel(question, q_num, 999))
-        self.console.print(f"\n[dim][H] Free Hint  [P] Premium ({PREMIUM_HINT_COST}💎)  [S] Skip  [Q] Quit[/dim]\n")
+        clear_terminal(include_scrollback=False)
+        self.console.print(Group(
+            Text(f"🎓 Practice Mode - Question {q_num}", style=f"bold {Theme.INFO}"),
+            UIComponents.create_question_panel(question, q_num, 999),
+            _PRACTICE_HINT_PROMPT_TEXT,
+        ))
 
         while True:
             user_answer = Prompt.ask("Your answer").strip()
+            key = user_answer.upper()
 
-            if user_answer.upper() == 'Q':
+            if key == 'Q':
                 return False
-            elif user_answer.upper() == 'S':
+            elif key == 'S':
                 self.console.print(f"[yellow]Answer was: {question.correct_answer[0]}[/yellow]")
-                self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-                input()
+                self.console.print(_PRESS_KEY_TEXT)
+                wait_for_key()
                 return True
-            elif user_answer.upper() == 'H':
+            elif key == 'H':
                 self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {question.get_hint()}\n")
                 continue
-            elif user_answer.upper() == 'P':
+            elif key == 'P':
                 if player.spend_credits(PREMIUM_HINT_COST):
                     self.console.print(f"\n[bold {Theme.WARNING}]💎 Premium Hint:[/bold {Theme.WARNING}] {question.get_premium_hint()}\n")
                 else:
@@ -275,18 +324,19 @@ class QuizHandler:
 
         is_correct, explanation = self.quiz_engine.validate_answer(user_answer)
 
+        result = Text("\n")
         if is_correct:
-            self.console.print(f"\n[bold {Theme.SUCCESS}]✓ Correct![/bold {Theme.SUCCESS}]")
+            result.append("✓ Correct!", style=f"bold {Theme.SUCCESS}")
         else:
-            self.console.print(f"\n[bold {Theme.ERROR}]✗ Incorrect[/bold {Theme.ERROR}]")
-            self.console.print(f"[white]Correct answer: {question.correct_answer[0]}[/white]")
-
-        self.console.print(f"[dim]{explanation}[/dim]")
+            result.append("✗ Incorrect", style=f"bold {Theme.ERROR}")
+            result.append(f"\nCorrect answer: {question.correct_answer[0]}", style="white")
+        result.append(f"\n{explanation}", style="dim")
+        self.console.print(result)
         self.session.record_question(question.type.value, is_correct, 0)
 
         if not is_correct:
-            self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-            input()
+            self.console.print(_PRESS_KEY_TEXT)
+            wait_for_key()
         else:
             time.sleep(1.5)
         return True
@@ -294,8 +344,6 @@ class QuizHandler:
     def _show_session_summary(self, player: PlayerStats) -> None:
         """Show quiz session summary."""
         clear_terminal()
-        self.console.print(UIComponents.create_header())
-
         summary = Panel(
             Text.assemble(
                 ("\nSession Complete!\n\n", "bold"),
@@ -305,10 +353,9 @@ class QuizHandler:
                 (f"XP Earned: +{self.session.xp_earned_this_session}\n", f"bold {Theme.SUCCESS}"),
                 (f"\nCurrent Level: {player.level} ⭐\n", f"bold {Theme.PRIMARY}"),
             ),
-            title="[bold]📊 Session Summary[/bold]",
+            title=_SUMMARY_TITLE,
             border_style=Theme.PANEL_BORDER_STYLE
         )
 
-        self.console.print(summary)
-        self.console.print("\n[dim]Press ENTER to return to menu...[/dim]")
-        input()
+        self.console.print(Group(UIComponents.create_header(), summary, _PRESS_KEY_MENU_TEXT))
+        wait_for_key()
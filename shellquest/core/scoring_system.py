@@ -1,16 +1,64 @@
 """Scoring and leveling system for ShellQuest."""
 
+import math
+from bisect import bisect_right
+from functools import lru_cache
+
 from ..models.question import Question
 
+# Denominator for the four x1000 multipliers in calculate_xp
+_MULT_SCALE = 1000 ** 4
+
+_XP_BASE = 100  # XP needed for level 1
+_LEVEL_TABLE_SIZE = 1024
+
+# _XP_FOR_LEVEL[i] is the total XP needed to reach level i + 1
+_XP_FOR_LEVEL = [(i * i) * _XP_BASE for i in range(_LEVEL_TABLE_SIZE)]
+
+
+def _level_for_xp(xp: int) -> int:
+    if xp < _XP_BASE:
+        return 1
+    if xp < _XP_FOR_LEVEL[-1]:
+        return bisect_right(_XP_FOR_LEVEL, xp)
+    return math.isqrt(int(xp) // _XP_BASE) + 1
+
+
+def _xp_for_level(level: int) -> int:
+    if level <= 1:
+        return 0
+    if level <= _LEVEL_TABLE_SIZE:
+        return _XP_FOR_LEVEL[level - 1]
+    return ((level - 1) ** 2) * _XP_BASE
+
+
+# Keyed on xp alone, so the cache doesn't hold ScoringSystem instances alive
+@lru_cache(maxsize=256)
+def _full_progress(xp: int) -> tuple:
+    level = _level_for_xp(xp)
+    xp_for_current_level = _xp_for_level(level)
+    xp_for_next_level = _xp_for_level(level + 1)
+
+    current_xp_in_level = xp - xp_for_current_level
+    xp_needed = xp_for_next_level - xp
+
+    level_span = xp_for_next_level - xp_for_current_level
+    if level_span == 0:
+        progress = 100.0
+    else:
+        progress = min((current_xp_in_level / level_span) * 100, 100.0)
+
+    return (level, current_xp_in_level, xp_needed, progress)
+
 
 class ScoringSystem:
     """Handles XP calculation, leveling, and score multipliers."""
 
-    XP_BASE = 100  # XP needed for level 1
+    XP_BASE = _XP_BASE  # XP needed for level 1
     XP_EXPONENT = 0.5  # Square root progression
+    LEVEL_TABLE_SIZE = _LEVEL_TABLE_SIZE
 
-    def __init__(self):
-        pass
+    __slots__ = ()
 
     def calculate_xp(self, question: Question, time_taken: float,
                      hint_used: bool, streak: int) -> int:
@@ -26,26 +74,19 @@ class ScoringSystem:
         Returns:
             Total XP earned
         """
-        base_xp = question.points
-
-        # Difficulty multiplier
-        diff_mult = 1.5 if question.difficulty == "advanced" else 1.0
+        # All multipliers are scaled by 1000 so the product stays integral
+        diff_mult = 1500 if question.difficulty == "advanced" else 1000
 
         # Streak bonus (max 3x at streak 10+)
-        streak_mult = min(1.0 + (streak * 0.2), 3.0)
+        streak_mult = min(1000 + streak * 200, 3000)
 
-        # Speed bonus
-        if time_taken < 5:
-            speed_mult = 1.5  # Super fast
-        elif time_taken < 10:
-            speed_mult = 1.2  # Fast
-        else:
-            speed_mult = 1.0  # Normal
+        # Speed bonus: super fast, fast, normal
+        speed_mult = 1500 if time_taken < 5 else (1200 if time_taken < 10 else 1000)
 
         # Hint penalty
-        hint_mult = 0.5 if hint_used else 1.0
+        hint_mult = 500 if hint_used else 1000
 
-        total = int(base_xp * diff_mult * streak_mult * speed_mult * hint_mult)
+        total = (question.points * diff_mult * streak_mult * speed_mult * hint_mult) // _MULT_SCALE
         return max(total, 1)  # Minimum 1 XP
 
     def get_level(self, xp: int) -> int:
@@ -54,20 +95,25 @@ class ScoringSystem:
         Level = floor(sqrt(XP / 100))
         L1: 100 XP, L2: 400 XP, L3: 900 XP, L4: 1600 XP, etc.
         """
-        if xp < self.XP_BASE:
-            return 1
-        return int((xp / self.XP_BASE) ** self.XP_EXPONENT) + 1
+        return _level_for_xp(xp)
 
     def get_xp_for_level(self, level: int) -> int:
         """Get total XP needed to reach a specific level."""
-        if level <= 1:
-            return 0
-        return int(((level - 1) ** 2) * self.XP_BASE)
+        return _xp_for_level(level)
 
     def get_xp_for_next_level(self, current_level: int) -> int:
         """Get XP needed to reach next level."""
         return self.get_xp_for_level(current_level + 1)
 
+    def get_full_progress(self, xp: int) -> tuple:
+        """
+        Get level progress and percentage in one pass.
+
+        Returns:
+            (current_level, current_xp_in_level, xp_needed_for_next, percentage)
+        """
+        return _full_progress(xp)
+
     def get_level_progress(self, xp: int) -> tuple:
         """
         Get level progress information.
@@ -75,23 +121,8 @@ class ScoringSystem:
         Returns:
             (current_level, current_xp_in_level, xp_needed_for_next)
         """
-        level = self.get_level(xp)
-        xp_for_current_level = self.get_xp_for_level(level)
-        xp_for_next_level = self.get_xp_for_next_level(level)
-
-        current_xp_in_level = xp - xp_for_current_level
-        xp_needed = xp_for_next_level - xp
-
-        return (level, current_xp_in_level, xp_needed)
+        return self.get_full_progress(xp)[:3]
 
     def get_progress_percentage(self, xp: int) -> float:
         """Get percentage progress towards next level."""
-        level = self.get_level(xp)
-        xp_for_current = self.get_xp_for_level(level)
-        xp_for_next = self.get_xp_for_next_level(level)
-
-        if xp_for_next == xp_for_current:
-            return 100.0
-
-        progress = ((xp - xp_for_current) / (xp_for_next - xp_for_current)) * 100
-        return min(progress, 100.0)
+        return self.get_full_progress(xp)[3]
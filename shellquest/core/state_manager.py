@@ -1,55 +1,164 @@
 """State management for saving and loading player progress."""
 
+import atexit
 import json
+import os
+import queue
 import shutil
+import threading
 from pathlib import Path
-from dataclasses import asdict
 from typing import Optional, List
 from datetime import datetime
 
 from ..models.player import PlayerStats
 from ..utils import logger, SaveError, LoadError
 
+# Optional C JSON codec for saves (falls back to the stdlib)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on extras
+    orjson = None
+
+
+def _encode_save(save_data: dict) -> bytes:
+    """Serialize save data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(save_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(save_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _decode_save(raw: bytes) -> dict:
+    """Parse a save file's bytes (orjson's errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Point dst at src's data with a hard link, copying where links fail."""
+    try:
+        dst.unlink(missing_ok=True)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
 
 class StateManager:
     """Manages player state persistence."""
 
+    __slots__ = ('save_dir', 'current_player', '_save_queue', '_save_worker',
+                 '_async_save_failed', '_players_cache', '_players_cache_mtime')
+
     def __init__(self):
         """Initialize state manager with save directory."""
         self.save_dir = Path.home() / ".shellquest" / "saves"
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.current_player: Optional[PlayerStats] = None
+        # Holds at most the newest pending background save
+        self._save_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._save_worker: Optional[threading.Thread] = None
+        # Set by the background writer when a save fails; see take_async_save_failure
+        self._async_save_failed = False
+        # Sorted player names, valid while the save directory's mtime matches
+        self._players_cache: Optional[List[str]] = None
+        self._players_cache_mtime = -1
         logger.debug(f"StateManager initialized with save_dir: {self.save_dir}")
 
     def save_progress(self, player: PlayerStats) -> bool:
         """
         Save player progress to JSON file.
 
-        Uses atomic write with backup for safety.
+        Uses atomic write with backup for safety. Any queued background
+        save is written first so it can't land on top of this one.
+        """
+        self.wait_for_saves()
+        return self._write_save(player.username, self._snapshot(player))
+
+    def save_progress_async(self, player: PlayerStats) -> None:
         """
-        save_path = self.save_dir / f"{player.username}.json"
+        Queue a save for the background writer and return immediately.
+
+        A save still waiting in the queue is replaced by this newer one.
+        """
+        job = (player.username, self._snapshot(player))
+        if self._save_worker is None:
+            self._save_worker = threading.Thread(
+                target=self._save_loop, name="shellquest-save", daemon=True
+            )
+            self._save_worker.start()
+            atexit.register(self.wait_for_saves)
+
+        while True:
+            try:
+                self._save_queue.put_nowait(job)
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                    self._save_queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def take_async_save_failure(self) -> bool:
+        """Whether a background save failed since the last call (clears the flag)."""
+        failed = self._async_save_failed
+        self._async_save_failed = False
+        return failed
+
+    def wait_for_saves(self) -> None:
+        """Block until every queued background save has been written."""
+        if self._save_worker is not None:
+            self._save_queue.join()
+
+    def _save_loop(self) -> None:
+        """Background writer: save each queued snapshot in turn."""
+        while True:
+            username, save_data = self._save_queue.get()
+            try:
+                if not self._write_save(username, save_data):
+                    self._async_save_failed = True
+            except Exception as e:  # keep the writer alive for later saves
+                logger.exception(f"Background save failed: {e}")
+                self._async_save_failed = True
+            finally:
+                self._save_queue.task_done()
+
+    @staticmethod
+    def _snapshot(player: PlayerStats) -> dict:
+        """Copy the player into save data that no longer shares state with it."""
+        return {
+            "version": "1.0.0",
+            "player": player.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _write_save(self, username: str, save_data: dict) -> bool:
+        """Atomically write save data for username."""
+        save_path = self.save_dir / f"{username}.json"
         temp_path = save_path.with_suffix('.tmp')
         backup_path = save_path.with_suffix('.bak')
+        replaced = False
 
         try:
-            save_data = {
-                "version": "1.0.0",
-                "player": asdict(player),
-                "timestamp": datetime.now().isoformat()
-            }
-
-            # Write to temporary file
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            # Serialize in memory, then write the temp file in one go
+            payload = _encode_save(save_data)
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Backup existing save if it exists
+            # (a hard link is enough: the rename below swaps in a new inode)
             if save_path.exists():
-                shutil.copy(save_path, backup_path)
+                _link_or_copy(save_path, backup_path)
+            else:
+                self._players_cache = None
 
-            # Atomic rename
-            temp_path.rename(save_path)
+            # Atomic rename (replaces the old save on every platform)
+            os.replace(temp_path, save_path)
+            replaced = True
 
-            logger.info(f"Progress saved for player: {player.username}")
+            logger.info(f"Progress saved for player: {username}")
             return True
 
         except PermissionError as e:
@@ -62,8 +171,8 @@ class StateManager:
             logger.error(f"Serialization error saving progress: {e}")
             return False
         finally:
-            # Clean up temp file if it still exists
-            if temp_path.exists():
+            # The temp file is only left behind when something failed
+            if not replaced:
                 try:
                     temp_path.unlink()
                 except OSError:
@@ -75,6 +184,7 @@ class StateManager:
 
         Returns None if save doesn't exist or is invalid.
         """
+        self.wait_for_saves()
         save_path = self.save_dir / f"{username}.json"
 
         if not save_path.exists():
@@ -82,8 +192,7 @@ class StateManager:
             return None
 
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = _decode_save(save_path.read_bytes())
 
             player_data = save_data['player']
             player = PlayerStats(**player_data)
@@ -113,8 +222,7 @@ class StateManager:
         logger.info("Attempting to load from backup...")
 
         try:
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = _decode_save(backup_path.read_bytes())
 
             player_data = save_data['player']
             player = PlayerStats(**player_data)
@@ -139,12 +247,16 @@ class StateManager:
         return player
 
     def list_saved_players(self) -> List[str]:
-        """List all saved player usernames."""
-        players = []
-        for save_file in self.save_dir.glob("*.json"):
-            if not save_file.name.endswith(('.tmp', '.bak')):
-                players.append(save_file.stem)
-        return sorted(players)
+        """List all saved player usernames.
+
+        The directory is only rescanned when its mtime changes or this
+        manager adds or removes a save.
+        """
+        mtime = self.save_dir.stat().st_mtime_ns
+        if self._players_cache is None or mtime != self._players_cache_mtime:
+            self._players_cache = sorted(f.stem for f in self.save_dir.glob("*.json"))
+            self._players_cache_mtime = mtime
+        return list(self._players_cache)
 
     def player_exists(self, username: str) -> bool:
         """Check if a save file exists for the username."""
@@ -153,6 +265,8 @@ class StateManager:
 
     def delete_save(self, username: str) -> bool:
         """Delete a player's save file."""
+        self.wait_for_saves()
+        self._players_cache = None
         save_path = self.save_dir / f"{username}.json"
         backup_path = save_path.with_suffix('.bak')
 
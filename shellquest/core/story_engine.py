@@ -1,11 +1,14 @@
 """Story mode engine for ShellQuest."""
 
+import os
+import pickle
+import tempfile
 import time
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
@@ -18,10 +21,17 @@ from ..models.player import PlayerStats, PlayerSession
 from ..models.question import Question
 from .quiz_engine import QuizEngine
 from .scoring_system import ScoringSystem
-from ..utils import logger, clear_terminal, PREMIUM_HINT_COST
+from ..utils import (
+    logger, clear_terminal, CACHE_DIR, PREMIUM_HINT_COST, YAML_LOADER, DATACLASS_SLOTS
+)
 
+# Pickled chapters from the last parse; bump the version whenever Level
+# or Chapter change shape so stale pickles are ignored
+CHAPTERS_CACHE_PATH = CACHE_DIR / "chapters.pkl"
+_CHAPTERS_CACHE_VERSION = 2
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Level:
     """Represents a story level."""
     id: str
@@ -36,7 +46,7 @@ class Level:
     boss_description: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Chapter:
     """Represents a story chapter."""
     id: str
@@ -48,24 +58,88 @@ class Chapter:
     unlock_requirement: Optional[str] = None
 
 
+class _ChaptersUnpickler(pickle.Unpickler):
+    """Only rebuilds Level and Chapter, so a planted cache file can't name
+    arbitrary callables for pickle to run."""
+
+    _ALLOWED = frozenset({'Level', 'Chapter'})
+
+    def find_class(self, module, name):
+        if module == __name__ and name in self._ALLOWED:
+            return globals()[name]
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in the chapters cache")
+
+
+def _read_chapters_cache(source_key: tuple) -> Optional[List[Chapter]]:
+    """Chapters pickled for this exact chapters.yaml (mtime, size), if any."""
+    try:
+        with open(CHAPTERS_CACHE_PATH, 'rb') as f:
+            version, key, chapters = _ChaptersUnpickler(f).load()
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # any unreadable, disallowed or stale pickle just means a re-parse
+        logger.debug(f"Ignoring chapters cache: {e}")
+        return None
+    if version != _CHAPTERS_CACHE_VERSION or key != source_key:
+        return None
+    return chapters
+
+
+def _write_chapters_cache(source_key: tuple, chapters: List[Chapter]) -> None:
+    """Pickle parsed chapters for the next start; failures are only logged."""
+    temp_path = None
+    try:
+        CHAPTERS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name so two games starting at once can't interleave writes
+        fd, temp_path = tempfile.mkstemp(dir=CHAPTERS_CACHE_PATH.parent,
+                                         prefix=CHAPTERS_CACHE_PATH.name, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((_CHAPTERS_CACHE_VERSION, source_key, chapters), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, CHAPTERS_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write chapters cache: {e}")
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
 class StoryEngine:
     """Manages story mode progression."""
 
     def __init__(self, console: Console, questions: List[Question], player: PlayerStats):
         self.console = console
         self.all_questions = questions
+        self._questions_by_command: Dict[str, List[Question]] = {}
+        for q in questions:
+            self._questions_by_command.setdefault(q.command, []).append(q)
         self.player = player
         self.scoring = ScoringSystem()
         self.chapters: List[Chapter] = []
         self.load_chapters()
 
+    def questions_for_level(self, level: Level) -> List[Question]:
+        """All questions covering any of the level's commands."""
+        return [q for command in dict.fromkeys(level.commands)
+                for q in self._questions_by_command.get(command, ())]
+
     def load_chapters(self):
         """Load chapter data from YAML."""
         data_path = Path(__file__).parent.parent.parent / "data" / "story" / "chapters.yaml"
 
         try:
+            stat = data_path.stat()
+            source_key = (stat.st_mtime_ns, stat.st_size)
+            cached = _read_chapters_cache(source_key)
+            if cached is not None:
+                self.chapters = cached
+                logger.info(f"Loaded {len(self.chapters)} cached chapters for story mode")
+                return
+
             with open(data_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f.read(), Loader=YAML_LOADER)
 
             for ch_data in data.get('chapters', []):
                 levels = []
@@ -95,6 +169,7 @@ class StoryEngine:
                 )
                 self.chapters.append(chapter)
 
+            _write_chapters_cache(source_key, self.chapters)
             logger.info(f"Loaded {len(self.chapters)} chapters for story mode")
 
         except FileNotFoundError:
@@ -137,15 +212,14 @@ class StoryEngine:
     def show_chapter_select(self) -> Optional[Chapter]:
         """Show chapter selection screen."""
         clear_terminal()
-        self.console.print(UIComponents.create_header())
-
-        self.console.print("\n[bold]📖 STORY MODE[/bold]\n")
+        lines = ["\n[bold]📖 STORY MODE[/bold]\n"]
 
         # Show chapters
+        completed_ids = self.player.completed_levels
         available = []
         for i, chapter in enumerate(self.chapters):
             unlocked = self.is_chapter_unlocked(chapter)
-            completed_levels = sum(1 for lv in chapter.levels if lv.id in self.player.completed_levels)
+            completed_levels = sum(1 for lv in chapter.levels if lv.id in completed_ids)
             total_levels = len(chapter.levels)
 
             if unlocked:
@@ -153,12 +227,13 @@ class StoryEngine:
                 status = f"[{completed_levels}/{total_levels}]"
                 if completed_levels == total_levels:
                     status = "[bold green]COMPLETE[/bold green]"
-                self.console.print(f"  {len(available)}. {chapter.icon} {chapter.name} {status}")
-                self.console.print(f"     [dim]{chapter.description}[/dim]")
+                lines.append(f"  {len(available)}. {chapter.icon} {chapter.name} {status}")
+                lines.append(f"     [dim]{chapter.description}[/dim]")
             else:
-                self.console.print(f"  🔒 [dim]{chapter.name} - Complete {chapter.unlock_requirement} to unlock[/dim]")
+                lines.append(f"  🔒 [dim]{chapter.name} - Complete {chapter.unlock_requirement} to unlock[/dim]")
 
-        self.console.print(f"\n  {len(available) + 1}. ↩️  Back to Menu")
+        lines.append(f"\n  {len(available) + 1}. ↩️  Back to Menu")
+        self.console.print(Group(UIComponents.create_header(), Text.from_markup("\n".join(lines))))
 
         choices = [str(i) for i in range(1, len(available) + 2)]
         choice = Prompt.ask("Select chapter", choices=choices)
@@ -171,15 +246,16 @@ class StoryEngine:
     def show_level_select(self, chapter: Chapter) -> Optional[Level]:
         """Show level selection for a chapter."""
         clear_terminal()
-        self.console.print(UIComponents.create_header())
-
-        self.console.print(f"\n[bold]{chapter.icon} {chapter.name}[/bold]")
-        self.console.print(f"[dim]{chapter.description}[/dim]\n")
+        lines = [
+            f"\n[bold]{chapter.icon} {chapter.name}[/bold]",
+            f"[dim]{chapter.description}[/dim]\n",
+        ]
 
+        completed_ids = self.player.completed_levels
         available = []
         for i, level in enumerate(chapter.levels):
             unlocked = self.is_level_unlocked(chapter, i)
-            completed = level.id in self.player.completed_levels
+            completed = level.id in completed_ids
 
             if unlocked:
                 available.append(level)
@@ -190,12 +266,13 @@ class StoryEngine:
                 else:
                     status = ""
 
-                self.console.print(f"  {len(available)}. {level.name} {status}")
-                self.console.print(f"     [dim]{level.description}[/dim]")
+                lines.append(f"  {len(available)}. {level.name} {status}")
+                lines.append(f"     [dim]{level.description}[/dim]")
             else:
-                self.console.print(f"  🔒 [dim]{level.name} - Complete previous level[/dim]")
+                lines.append(f"  🔒 [dim]{level.name} - Complete previous level[/dim]")
 
-        self.console.print(f"\n  {len(available) + 1}. ↩️  Back to Chapters")
+        lines.append(f"\n  {len(available) + 1}. ↩️  Back to Chapters")
+        self.console.print(Group(UIComponents.create_header(), Text.from_markup("\n".join(lines))))
 
         choices = [str(i) for i in range(1, len(available) + 2)]
         choice = Prompt.ask("Select level", choices=choices)
@@ -211,7 +288,7 @@ class StoryEngine:
         self.show_level_intro(level)
 
         # Get questions for this level's commands
-        level_questions = [q for q in self.all_questions if q.command in level.commands]
+        level_questions = self.questions_for_level(level)
 
         if len(level_questions) < level.questions_needed:
             self.console.print(f"[yellow]Not enough questions for this level yet![/yellow]")
@@ -250,13 +327,13 @@ class StoryEngine:
 
         if correct_count >= correct_needed:
             if level.id not in self.player.completed_levels:
-                self.player.completed_levels.append(level.id)
+                self.player.completed_levels.add(level.id)
                 self.player.xp += level.xp_reward
 
             # Check if chapter complete
             all_complete = all(lv.id in self.player.completed_levels for lv in chapter.levels)
             if all_complete and chapter.id not in self.player.completed_chapters:
-                self.player.completed_chapters.append(chapter.id)
+                self.player.completed_chapters.add(chapter.id)
                 self.show_chapter_complete(chapter)
 
     def show_level_intro(self, level: Level):
@@ -304,13 +381,14 @@ class StoryEngine:
 
         while True:
             answer = Prompt.ask("Your answer").strip()
+            key = answer.upper()
 
-            if answer.upper() == 'Q':
+            if key == 'Q':
                 return None
-            elif answer.upper() == 'H':
+            elif key == 'H':
                 self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {question.get_hint()}\n")
                 continue
-            elif answer.upper() == 'P':
+            elif key == 'P':
                 if self.player.spend_credits(PREMIUM_HINT_COST):
                     premium = question.get_premium_hint()
                     self.console.print(f"\n[bold yellow]💎 Premium Hint:[/bold yellow] {premium}\n")
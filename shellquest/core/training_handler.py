@@ -2,7 +2,7 @@
 
 import time
 from typing import Optional, Dict, List
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
@@ -12,10 +12,30 @@ from ..models.player import PlayerStats, PlayerSession
 from ..models.command import Command
 from ..ui.components import UIComponents
 from ..ui.theme import Theme
-from ..utils import clear_terminal, PREMIUM_HINT_COST
+from ..utils import clear_terminal, wait_for_key, PREMIUM_HINT_COST
 from .quiz_engine import QuizEngine
 from .scoring_system import ScoringSystem
 
+# Training menu sections; commands outside these are listed under "Other"
+_CATEGORIES = {
+    "Navigation": ("cd", "pwd", "ls"),
+    "File Viewing": ("cat", "head", "tail", "less"),
+    "File Operations": ("cp", "mv", "rm", "touch", "mkdir"),
+    "Search": ("grep", "find"),
+    "Text Processing": ("sort", "uniq", "wc", "cut", "awk", "sed"),
+    "Permissions & System": ("chmod", "echo", "man", "ps", "kill"),
+    "Network": ("curl", "wget", "ping", "ssh"),
+    "Archives": ("tar", "zip", "gzip"),
+}
+_CATEGORIZED = frozenset(c for cmds in _CATEGORIES.values() for c in cmds)
+
+_LEGEND_MARKUP = "\n[dim]Legend: 🟢 Mastered  🟡 Learning  🔴 Needs Practice  ⚪ Not Started[/dim]\n"
+
+_ICON_MASTERED = "🟢"
+_ICON_LEARNING = "🟡"
+_ICON_NEEDS_PRACTICE = "🔴"
+_ICON_NOT_STARTED = "⚪"
+
 
 class TrainingHandler:
     """Handles command training mode."""
@@ -29,53 +49,43 @@ class TrainingHandler:
     def show_command_training(self, player: PlayerStats, commands: List[Command],
                               command_questions_cache: Dict, on_save) -> None:
         """Show command training selection menu."""
+        # The question counts don't change while the menu is open, so the
+        # sections and their order are worked out once
+        sections = []
+        for category, cmds in _CATEGORIES.items():
+            cat_cmds = [(c, len(command_questions_cache[c]))
+                        for c in cmds if c in command_questions_cache]
+            if cat_cmds:
+                sections.append((category, cat_cmds))
+
+        # Other commands not in categories, most questions first
+        other_cmds = sorted(((c, len(qs)) for c, qs in command_questions_cache.items()
+                             if c not in _CATEGORIZED),
+                            key=lambda x: -x[1])
+        if other_cmds:
+            sections.append(("Other", other_cmds))
+
         while True:
             clear_terminal()
-            self.console.print(UIComponents.create_header())
-            self.console.print("\n[bold]📝 Command Training[/bold]")
-            self.console.print("[dim]Select a command to practice[/dim]\n")
-
-            categories = {
-                "Navigation": ["cd", "pwd", "ls"],
-                "File Viewing": ["cat", "head", "tail", "less"],
-                "File Operations": ["cp", "mv", "rm", "touch", "mkdir"],
-                "Search": ["grep", "find"],
-                "Text Processing": ["sort", "uniq", "wc", "cut", "awk", "sed"],
-                "Permissions & System": ["chmod", "echo", "man", "ps", "kill"],
-                "Network": ["curl", "wget", "ping", "ssh"],
-                "Archives": ["tar", "zip", "gzip"]
-            }
+            lines = [
+                "\n[bold]📝 Command Training[/bold]",
+                "[dim]Select a command to practice[/dim]\n",
+            ]
 
             available_commands = []
             idx = 1
 
-            for category, cmds in categories.items():
-                cat_cmds = [(c, len(command_questions_cache.get(c, [])))
-                           for c in cmds if c in command_questions_cache]
-                if cat_cmds:
-                    self.console.print(f"\n[bold {Theme.PRIMARY}]{category}[/bold {Theme.PRIMARY}]")
-                    for cmd, count in cat_cmds:
-                        mastery = self._get_command_mastery(player, cmd)
-                        icon = self._get_mastery_icon(mastery)
-                        self.console.print(f"  {idx}. {icon} [bold]{cmd}[/bold] [dim]({count} questions)[/dim]")
-                        available_commands.append(cmd)
-                        idx += 1
-
-            # Other commands not in categories
-            sorted_commands = sorted(command_questions_cache.items(), key=lambda x: len(x[1]), reverse=True)
-            other_cmds = [(c, len(qs)) for c, qs in sorted_commands
-                         if c not in sum(categories.values(), [])]
-            if other_cmds:
-                self.console.print(f"\n[bold {Theme.PRIMARY}]Other[/bold {Theme.PRIMARY}]")
-                for cmd, count in other_cmds:
-                    mastery = self._get_command_mastery(player, cmd)
-                    icon = self._get_mastery_icon(mastery)
-                    self.console.print(f"  {idx}. {icon} [bold]{cmd}[/bold] [dim]({count} questions)[/dim]")
+            for category, cmds in sections:
+                lines.append(f"\n[bold {Theme.PRIMARY}]{category}[/bold {Theme.PRIMARY}]")
+                for cmd, count in cmds:
+                    icon = self._get_mastery_icon(player, cmd)
+                    lines.append(f"  {idx}. {icon} [bold]{cmd}[/bold] [dim]({count} questions)[/dim]")
                     available_commands.append(cmd)
                     idx += 1
 
-            self.console.print(f"\n  {idx}. ↩️  Back to Menu")
-            self.console.print("\n[dim]Legend: 🟢 Mastered  🟡 Learning  🔴 Needs Practice  ⚪ Not Started[/dim]\n")
+            lines.append(f"\n  {idx}. ↩️  Back to Menu")
+            lines.append(_LEGEND_MARKUP)
+            self.console.print(Group(UIComponents.create_header(), Text.from_markup("\n".join(lines))))
 
             choices = [str(i) for i in range(1, idx + 1)]
             choice = Prompt.ask("Select command", choices=choices)
@@ -113,14 +123,14 @@ class TrainingHandler:
         intro_parts.extend([
             (f"\n{len(questions)} questions available\n", "dim"),
             (f"Answer up to 40 questions to master this command!\n\n", "white"),
-            ("Press ENTER to start...\n", "dim"),
+            ("Press any key to start...\n", "dim"),
         ])
 
         self.console.print(Panel(
             Align.center(Text.assemble(*intro_parts)),
             border_style=Theme.PRIMARY
         ))
-        input()
+        wait_for_key()
 
         self.quiz_engine = QuizEngine(questions)
         self.session = PlayerSession()
@@ -163,20 +173,21 @@ class TrainingHandler:
 
         while True:
             user_answer = Prompt.ask("Your answer").strip()
+            key = user_answer.upper()
 
-            if user_answer.upper() == 'Q':
+            if key == 'Q':
                 return None
-            elif user_answer.upper() == 'S':
+            elif key == 'S':
                 self.console.print(f"[yellow]Skipped! Answer was: {question.correct_answer[0]}[/yellow]")
                 player.record_answer(command, False, question.id)
                 self.session.record_question(question.type.value, False, 0)
                 time.sleep(1.5)
                 return False
-            elif user_answer.upper() == 'H':
+            elif key == 'H':
                 self.console.print(f"\n[bold {Theme.INFO}]Hint:[/bold {Theme.INFO}] {question.get_hint()}\n")
                 hint_used = True
                 continue
-            elif user_answer.upper() == 'P':
+            elif key == 'P':
                 if player.spend_credits(PREMIUM_HINT_COST):
                     self.console.print(f"\n[bold {Theme.WARNING}]💎 Premium Hint:[/bold {Theme.WARNING}] {question.get_premium_hint()}\n")
                     hint_used = True
@@ -192,7 +203,6 @@ class TrainingHandler:
         xp_gained = 0
         if is_correct:
             xp_gained = self.scoring.calculate_xp(question, time_taken, hint_used, player.streak)
-            player.xp += xp_gained
             self.console.print(f"\n[bold {Theme.SUCCESS}]✓ Correct! +{xp_gained} XP[/bold {Theme.SUCCESS}]")
         else:
             self.console.print(f"\n[bold {Theme.ERROR}]✗ Incorrect[/bold {Theme.ERROR}]")
@@ -200,7 +210,9 @@ class TrainingHandler:
 
         self.console.print(f"[dim]{explanation}[/dim]")
 
-        player.record_answer(command, is_correct, question.id)
+        player.apply_result(command, is_correct, question.id, xp_gained)
+        if xp_gained:
+            player.level = self.scoring.get_level(player.xp)
         self.session.record_question(question.type.value, is_correct, xp_gained)
 
         time.sleep(1.2)
@@ -242,32 +254,24 @@ class TrainingHandler:
         )
 
         self.console.print(summary)
-        self.console.print("\n[dim]Press ENTER to continue...[/dim]")
-        input()
-
-    def _get_command_mastery(self, player: PlayerStats, command: str) -> str:
-        """Get mastery level for a command."""
-        if command not in player.command_stats:
-            return "not_started"
-
-        stats = player.command_stats[command]
-        if stats["total"] < 5:
-            return "not_started"
-
-        accuracy = stats["correct"] / stats["total"]
-        if accuracy >= 0.9:
-            return "mastered"
-        elif accuracy >= 0.6:
-            return "learning"
+        self.console.print("\n[dim]Press any key to continue...[/dim]")
+        wait_for_key()
+
+    def _get_mastery_icon(self, player: PlayerStats, command: str) -> str:
+        """Get the mastery icon for a command from the player's stats."""
+        stats = player.command_stats.get(command)
+        if stats is None:
+            return _ICON_NOT_STARTED
+
+        total = stats["total"]
+        if total < 5:
+            return _ICON_NOT_STARTED
+
+        # Accuracy thresholds of 90% / 60%, compared in integers
+        correct = stats["correct"] * 10
+        if correct >= total * 9:
+            return _ICON_MASTERED
+        elif correct >= total * 6:
+            return _ICON_LEARNING
         else:
-            return "needs_practice"
-
-    def _get_mastery_icon(self, mastery: str) -> str:
-        """Get icon for mastery level."""
-        icons = {
-            "mastered": "🟢",
-            "learning": "🟡",
-            "needs_practice": "🔴",
-            "not_started": "⚪"
-        }
-        return icons.get(mastery, "⚪")
+            return _ICON_NEEDS_PRACTICE
@@ -1,10 +1,11 @@
 """Data loader for YAML command and question files."""
 
+import sys
 import yaml
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
-from ..models.command import Command, CommandOption, CommandExample
+from ..models.command import Command, CommandGroup, CommandOption, CommandExample
 from ..models.question import Question
 from ..models.achievement import Achievement
 from ..utils import logger, DataLoadError
@@ -24,6 +25,7 @@ class DataLoader:
         self._commands_cache = {}
         self._questions_cache = {}
         self._achievements_cache = None
+        self._categories_cache = None
 
         logger.debug(f"DataLoader initialized with data_dir: {self.data_dir}")
 
@@ -61,10 +63,12 @@ class DataLoader:
                         for ex in cmd_data.get('examples', [])
                     ]
 
+                    # category/difficulty (and a question's command) take few
+                    # distinct values; intern them so repeats share one string
                     command = Command(
                         name=cmd_data['name'],
-                        category=cmd_data['category'],
-                        difficulty=cmd_data['difficulty'],
+                        category=sys.intern(cmd_data['category']),
+                        difficulty=sys.intern(cmd_data['difficulty']),
                         syntax=cmd_data['syntax'],
                         description=cmd_data['description'],
                         common_options=options,
@@ -117,8 +121,8 @@ class DataLoader:
                     question = Question(
                         id=q_data['id'],
                         type=q_data['type'],
-                        command=q_data['command'],
-                        difficulty=q_data['difficulty'],
+                        command=sys.intern(q_data['command']),
+                        difficulty=sys.intern(q_data['difficulty']),
                         question_text=q_data['question_text'],
                         correct_answer=q_data['correct_answer'],
                         explanation=q_data['explanation'],
@@ -207,9 +211,24 @@ class DataLoader:
         advanced = self.load_questions("advanced")
         return essential + advanced
 
+    def load_commands_by_category(self) -> Dict[str, CommandGroup]:
+        """Group all commands by category, in first-seen order."""
+        if self._categories_cache is not None:
+            return self._categories_cache
+
+        grouped = {}
+        for cmd in self.load_all_commands():
+            grouped.setdefault(cmd.category, []).append(cmd)
+        self._categories_cache = {
+            category: CommandGroup.from_commands(cmds)
+            for category, cmds in grouped.items()
+        }
+        return self._categories_cache
+
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._commands_cache = {}
         self._questions_cache = {}
         self._achievements_cache = None
+        self._categories_cache = None
         logger.info("Cache cleared")
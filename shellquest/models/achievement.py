@@ -83,7 +83,7 @@ class AchievementSystem:
             # Check if requirement is met
             if achievement.check_requirement(player_stats, session):
                 unlocked.append(achievement)
-                player_stats.unlocked_achievements.append(achievement.id)
+                player_stats.unlocked_achievements.add(achievement.id)
                 player_stats.xp += achievement.xp_reward
                 player_stats.add_credits(achievement.credit_reward)
 
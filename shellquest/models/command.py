@@ -1,7 +1,7 @@
 """Command data model for shell commands."""
 
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 @dataclass
@@ -50,3 +50,24 @@ class Command:
             "related_commands": self.related_commands,
             "tips": self.tips,
         }
+
+
+@dataclass(frozen=True)
+class CommandGroup:
+    """Commands of one category stored column-wise for list rendering."""
+
+    names: Tuple[str, ...]
+    previews: Tuple[str, ...]
+    commands: Tuple[Command, ...]
+
+    @classmethod
+    def from_commands(cls, commands: List[Command]) -> "CommandGroup":
+        """Build the columns from a list of commands."""
+        return cls(
+            names=tuple(cmd.name for cmd in commands),
+            previews=tuple(f"{cmd.description[:40]}..." for cmd in commands),
+            commands=tuple(commands),
+        )
+
+    def __len__(self) -> int:
+        return len(self.commands)
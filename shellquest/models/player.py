@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Set
 
 
 @dataclass
@@ -24,7 +24,7 @@ class PlayerStats:
     advanced_progress: Dict[str, bool] = field(default_factory=dict)
 
     # Achievement tracking
-    unlocked_achievements: List[str] = field(default_factory=list)
+    unlocked_achievements: Set[str] = field(default_factory=set)
 
     # Command statistics: {command: {"correct": int, "total": int}}
     command_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
@@ -33,8 +33,8 @@ class PlayerStats:
     recently_answered: List[str] = field(default_factory=list)
 
     # Story mode progress
-    completed_levels: List[str] = field(default_factory=list)
-    completed_chapters: List[str] = field(default_factory=list)
+    completed_levels: Set[str] = field(default_factory=set)
+    completed_chapters: Set[str] = field(default_factory=set)
 
     # Battle mode stats
     battles_won: int = 0
@@ -47,6 +47,33 @@ class PlayerStats:
     # Credits system
     credits: int = 100
 
+    # Fields held as sets in memory and saved as sorted lists
+    _SET_FIELDS = ('unlocked_achievements', 'completed_levels', 'completed_chapters')
+
+    def __post_init__(self):
+        """Coerce set fields loaded from JSON lists back into sets."""
+        for name in self._SET_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, set):
+                setattr(self, name, set(value))
+
+    def to_dict(self) -> dict:
+        """JSON-serializable dict of all fields.
+
+        Containers are copied one level deep (two for command_stats), which
+        is all the nesting PlayerStats has; cheaper than dataclasses.asdict.
+        """
+        data = self.__dict__.copy()
+        for name, value in data.items():
+            if isinstance(value, set):
+                data[name] = sorted(value)
+            elif isinstance(value, list):
+                data[name] = value.copy()
+            elif isinstance(value, dict):
+                data[name] = {k: v.copy() if isinstance(v, dict) else v
+                              for k, v in value.items()}
+        return data
+
     @property
     def accuracy(self) -> float:
         """Calculate accuracy percentage."""
@@ -80,6 +107,13 @@ class PlayerStats:
         """Add time to total time played."""
         self.time_played += seconds
 
+    def apply_result(self, command: str, is_correct: bool, question_id: str,
+                     xp_gained: int = 0):
+        """Award XP for an answer and record it."""
+        if xp_gained:
+            self.xp += xp_gained
+        self.record_answer(command, is_correct, question_id)
+
     def record_answer(self, command: str, is_correct: bool, question_id: str):
         """Record a question answer."""
         self.total_questions_answered += 1
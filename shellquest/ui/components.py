@@ -7,6 +7,7 @@ from rich.tree import Tree
 from rich.text import Text
 from rich.align import Align
 from rich.columns import Columns
+from functools import lru_cache
 from typing import Dict, List
 from .theme import Theme
 from ..models.player import PlayerStats
@@ -15,30 +16,40 @@ from ..models.achievement import Achievement
 from ..models.command import Command
 
 
+@lru_cache(maxsize=None)
+def _build_header() -> Panel:
+    """Build the static header panel."""
+    title = Text()
+    title.append("🚀 ", style="bold")
+    title.append("ShellQuest", style=f"bold {Theme.PRIMARY}")
+    title.append(" v1.0", style="dim")
+
+    subtitle = Text()
+    subtitle.append("Master Bash/Zsh Like a Pro", style=Theme.SECONDARY)
+
+    header_text = Text()
+    header_text.append(title)
+    header_text.append("\n")
+    header_text.append(subtitle)
+
+    return Panel(
+        Align.center(header_text),
+        border_style=Theme.PANEL_BORDER_STYLE,
+        padding=(0, 2)
+    )
+
+
 class UIComponents:
     """Collection of reusable UI components."""
 
     @staticmethod
     def create_header(player: PlayerStats = None) -> Panel:
-        """Create beautiful header panel."""
-        title = Text()
-        title.append("🚀 ", style="bold")
-        title.append("ShellQuest", style=f"bold {Theme.PRIMARY}")
-        title.append(" v1.0", style="dim")
-
-        subtitle = Text()
-        subtitle.append("Master Bash/Zsh Like a Pro", style=Theme.SECONDARY)
+        """Create beautiful header panel.
 
-        header_text = Text()
-        header_text.append(title)
-        header_text.append("\n")
-        header_text.append(subtitle)
-
-        return Panel(
-            Align.center(header_text),
-            border_style=Theme.PANEL_BORDER_STYLE,
-            padding=(0, 2)
-        )
+        The header is the same for every player, so one instance is built
+        and reused by every screen.
+        """
+        return _build_header()
 
     @staticmethod
     def create_stats_panel(player: PlayerStats, xp_needed: int, progress_pct: float) -> Panel:
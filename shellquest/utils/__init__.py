@@ -4,11 +4,24 @@ import logging
 import os
 import sys
 import re
+import select
 from pathlib import Path
 from typing import Optional
 from functools import wraps
+import yaml
 from rich.console import Console
 
+# Single-keystroke input: termios on POSIX, msvcrt on Windows
+try:
+    import termios
+    import tty
+except ImportError:  # pragma: no cover - Windows
+    termios = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
 
 # ============================================================================
 # CONSTANTS - Centralized configuration values
@@ -26,6 +39,16 @@ SOCKET_TIMEOUT = 60
 LOG_DIR = Path.home() / ".shellquest" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+# Parsed-data caches (created on first write)
+CACHE_DIR = Path.home() / ".shellquest" / "cache"
+
+# libyaml's C parser when PyYAML was built with it; same safe semantics
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Spread into @dataclass for load-once data models: drops the per-instance
+# __dict__ where dataclasses support it (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 def setup_logger(name: str = "shellquest", level: int = logging.INFO) -> logging.Logger:
     """
     Set up and return a configured logger.
@@ -170,6 +193,65 @@ def clear_terminal(include_scrollback: bool = True):
         sys.stdout.flush()
 
 
+def read_key() -> Optional[str]:
+    """Read one keystroke without waiting for ENTER, or None if unsupported."""
+    if not sys.stdin.isatty():
+        return None
+    if msvcrt is not None:
+        return msvcrt.getwch()
+    if termios is None:
+        return None
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd, termios.TCSANOW)
+        return _read_char(fd)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def _read_char(fd: int) -> str:
+    """Read exactly one character from fd; '' at end of input.
+
+    Multi-byte UTF-8 is read to its last byte, and the tail of an escape
+    sequence (arrow keys etc.) is swallowed so it can't leak into the next
+    read as stray keystrokes.
+    """
+    lead = os.read(fd, 1)
+    if not lead:
+        return ''
+    if lead == b'\x1b':
+        while select.select([fd], [], [], 0)[0] and os.read(fd, 1):
+            pass
+        return '\x1b'
+
+    first = lead[0]
+    extra = 3 if first >= 0xF0 else 2 if first >= 0xE0 else 1 if first >= 0xC0 else 0
+    data = lead
+    while extra and len(data) < 1 + extra:
+        chunk = os.read(fd, 1 + extra - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data.decode('utf-8', 'replace')[:1]
+
+
+def wait_for_key():
+    """Block until any key is pressed (falls back to a line read off a TTY)."""
+    if read_key() is None:
+        input()
+
+
+# sanitize_name deletion tables and markup pattern, built once
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x20), *range(0x7f, 0xa0)]
+)
+_PATH_CHARS_TABLE = str.maketrans('', '', '\\/:*?"<>|.')
+# Match [tag], [tag=value], [/tag] patterns
+_MARKUP_TAG_RE = re.compile(r'\[/?[a-zA-Z_][a-zA-Z0-9_]*(?:=[^\]]+)?\]')
+
+
 def sanitize_name(name: str) -> str:
     """
     Sanitize player name to prevent injection attacks.
@@ -181,12 +263,11 @@ def sanitize_name(name: str) -> str:
         Sanitized name safe for display and storage
     """
     # Remove any control characters first
-    name = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', name)
+    name = name.translate(_CONTROL_CHARS_TABLE)
     # Remove Rich markup tags to prevent formatting injection
-    # Match [tag], [tag=value], [/tag] patterns
-    name = re.sub(r'\[/?[a-zA-Z_][a-zA-Z0-9_]*(?:=[^\]]+)?\]', '', name)
+    name = _MARKUP_TAG_RE.sub('', name)
     # Remove path traversal characters and dangerous filesystem chars
-    name = re.sub(r'[\\/:*?"<>|.]', '', name)
+    name = name.translate(_PATH_CHARS_TABLE)
     # Trim whitespace and limit length
     name = name.strip()[:MAX_NAME_LENGTH]
     return name if name else "Player"
@@ -2,14 +2,16 @@
 
 import pytest
 import json
+import os
 import threading
 import time
 from unittest.mock import Mock, MagicMock, patch, PropertyMock
 from io import StringIO
 
 from shellquest.core.battle_engine import (
-    BattleServer, BattleClient, BattleResult, BattleState,
-    safe_json_loads, safe_recv, safe_send
+    BattleServer, BattleClient, BattleResult, BattleState, BattleChannel,
+    ClientResult, Handshake, calculate_battle_points,
+    safe_json_loads, safe_recv, safe_send, safe_send_multi
 )
 from shellquest.models.player import PlayerStats
 from shellquest.models.question import Question, QuestionType
@@ -83,32 +85,83 @@ class TestSafeJsonLoads:
 class TestSafeRecv:
     """Tests for safe_recv utility."""
 
-    def test_successful_recv(self):
-        """Test successful data receive."""
-        mock_socket = Mock()
-        mock_socket.recv.return_value = b'{"test": "data"}'
+    @pytest.fixture
+    def sock_pair(self):
+        """Create a connected pair of sockets."""
+        import socket
+        left, right = socket.socketpair()
+        yield left, right
+        left.close()
+        right.close()
 
-        result = safe_recv(mock_socket, timeout=5.0)
+    def test_successful_recv(self, sock_pair):
+        """Test successful message receive."""
+        sender, receiver = sock_pair
+        assert safe_send(sender, {"test": "data"})
+
+        result = safe_recv(receiver, timeout=5.0)
+
+        assert result == {"test": "data"}
+
+    def test_recv_reassembles_fragments(self, sock_pair):
+        """Test a message split across several writes is read whole."""
+        import struct
+        sender, receiver = sock_pair
+        payload = json.dumps({"type": "question", "num": 1}).encode('utf-8')
+        frame = struct.pack('!I', len(payload)) + payload
+
+        for i in range(0, len(frame), 3):
+            sender.sendall(frame[i:i + 3])
+
+        result = safe_recv(receiver, timeout=5.0)
+
+        assert result == {"type": "question", "num": 1}
+
+    def test_recv_keeps_messages_separate(self, sock_pair):
+        """Test back-to-back messages are not merged."""
+        sender, receiver = sock_pair
+        safe_send(sender, {"seq": 1})
+        safe_send(sender, {"seq": 2})
+
+        assert safe_recv(receiver, timeout=5.0) == {"seq": 1}
+        assert safe_recv(receiver, timeout=5.0) == {"seq": 2}
+
+    def test_oversized_message_rejected(self, sock_pair):
+        """Test a frame larger than the buffer limit is rejected."""
+        import struct
+        sender, receiver = sock_pair
+        sender.sendall(struct.pack('!I', 10 * 1024 * 1024))
+
+        result = safe_recv(receiver, timeout=1.0)
+
+        assert result is None
+
+    def test_non_object_message_rejected(self, sock_pair):
+        """Test a JSON payload that isn't an object is rejected."""
+        sender, receiver = sock_pair
+        safe_send(sender, [1, 2, 3])
 
-        assert result == '{"test": "data"}'
-        mock_socket.settimeout.assert_called_with(5.0)
+        result = safe_recv(receiver, timeout=1.0)
+
+        assert result is None
 
     def test_timeout_recv(self):
         """Test timeout returns None."""
         import socket
         mock_socket = Mock()
-        mock_socket.recv.side_effect = socket.timeout()
+        mock_socket.recv_into.side_effect = socket.timeout()
 
         result = safe_recv(mock_socket, timeout=1.0)
 
         assert result is None
+        mock_socket.settimeout.assert_called_with(1.0)
 
-    def test_empty_data_recv(self):
-        """Test empty data returns None."""
-        mock_socket = Mock()
-        mock_socket.recv.return_value = b''
+    def test_empty_data_recv(self, sock_pair):
+        """Test closed connection returns None."""
+        sender, receiver = sock_pair
+        sender.close()
 
-        result = safe_recv(mock_socket, timeout=5.0)
+        result = safe_recv(receiver, timeout=5.0)
 
         assert result is None
 
@@ -116,7 +169,7 @@ class TestSafeRecv:
         """Test socket error returns None."""
         import socket
         mock_socket = Mock()
-        mock_socket.recv.side_effect = socket.error("Connection reset")
+        mock_socket.recv_into.side_effect = socket.error("Connection reset")
 
         result = safe_recv(mock_socket, timeout=5.0)
 
@@ -159,6 +212,135 @@ class TestSafeSend:
         assert result is False
 
 
+class TestSafeSendMulti:
+    """Tests for safe_send_multi utility."""
+
+    def test_messages_arrive_in_order(self):
+        """Test batched messages are received individually and in order."""
+        import socket
+        sender, receiver = socket.socketpair()
+        try:
+            assert safe_send_multi(sender, [{"name": "Host"}, {"type": "question"}])
+
+            assert safe_recv(receiver, timeout=5.0) == {"name": "Host"}
+            assert safe_recv(receiver, timeout=5.0) == {"type": "question"}
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_single_write_without_sendmsg(self):
+        """Test platforms without sendmsg get one concatenated sendall."""
+        mock_socket = Mock(spec=['sendall'])
+
+        assert safe_send_multi(mock_socket, [{"a": 1}, {"b": 2}])
+
+        mock_socket.sendall.assert_called_once()
+
+    def test_partial_sendmsg_completed(self):
+        """Test a short gather write is finished with sendall."""
+        mock_socket = Mock()
+        mock_socket.sendmsg.return_value = 3
+
+        assert safe_send_multi(mock_socket, [{"a": 1}, {"b": 2}])
+
+        sent_tail = mock_socket.sendall.call_args[0][0]
+        assert len(sent_tail) > 0
+
+    def test_socket_error(self):
+        """Test socket error returns False."""
+        import socket
+        mock_socket = Mock()
+        mock_socket.sendmsg.side_effect = socket.error("Broken pipe")
+
+        assert safe_send_multi(mock_socket, [{"a": 1}]) is False
+
+
+class TestBattleChannel:
+    """Tests for the selector-driven BattleChannel."""
+
+    @pytest.fixture
+    def channel_pair(self):
+        """Create a socket pair with a channel on the receiving end."""
+        import socket
+        left, right = socket.socketpair()
+        channel = BattleChannel(right)
+        yield left, channel
+        channel.close()
+        left.close()
+        right.close()
+
+    def test_recv_message(self, channel_pair):
+        """Test a sent message is received through the channel."""
+        sender, channel = channel_pair
+        safe_send(sender, {"type": "question", "num": 1})
+
+        assert channel.recv(timeout=5.0) == {"type": "question", "num": 1}
+
+    def test_recv_buffers_coalesced_messages(self, channel_pair):
+        """Test messages arriving in one chunk are returned one at a time."""
+        import struct
+        sender, channel = channel_pair
+        frames = b""
+        for seq in (1, 2):
+            payload = json.dumps({"seq": seq}).encode('utf-8')
+            frames += struct.pack('!I', len(payload)) + payload
+        sender.sendall(frames)
+
+        assert channel.recv(timeout=5.0) == {"seq": 1}
+        assert channel.recv(timeout=5.0) == {"seq": 2}
+
+    def test_recv_message_larger_than_one_read(self, channel_pair):
+        """Test a message bigger than the receive buffer is reassembled."""
+        from shellquest.utils import BUFFER_SIZE
+        sender, channel = channel_pair
+        big = {"text": "x" * (BUFFER_SIZE - 20)}
+        assert safe_send(sender, big)
+
+        assert channel.recv(timeout=5.0) == big
+
+    def test_recv_timeout(self, channel_pair):
+        """Test recv returns None when nothing arrives in time."""
+        _, channel = channel_pair
+
+        assert channel.recv(timeout=0.05) is None
+
+    def test_recv_closed_peer(self, channel_pair):
+        """Test recv returns None once the peer hangs up."""
+        sender, channel = channel_pair
+        sender.close()
+
+        assert channel.recv(timeout=5.0) is None
+
+    def test_send_result_received_as_message(self, channel_pair):
+        """Test a binary result arrives in the same shape as a JSON result."""
+        sender, channel = channel_pair
+        peer = BattleChannel(sender)
+        result = BattleResult("Host", True, 2.5, 150)
+
+        assert peer.send_result(result, correct_answer="ls -la")
+
+        assert channel.recv(timeout=5.0) == {
+            'type': 'result',
+            'data': result.to_dict(),
+            'correct_answer': "ls -la",
+        }
+
+    def test_malformed_result_rejected(self, channel_pair):
+        """Test a truncated binary result is rejected."""
+        import struct
+        sender, channel = channel_pair
+        sender.sendall(struct.pack('!I', 3) + b"\x01\x00\x00")
+
+        assert channel.recv(timeout=5.0) is None
+
+    def test_send(self, channel_pair):
+        """Test messages sent through the channel use the same framing."""
+        sender, channel = channel_pair
+        assert channel.send({"type": "game_over"})
+
+        assert safe_recv(sender, timeout=5.0) == {"type": "game_over"}
+
+
 class TestBattleResult:
     """Tests for BattleResult dataclass."""
 
@@ -266,47 +448,250 @@ class TestBattleServerInit:
 
             assert ip == "127.0.0.1"
 
+    def test_iouring_off_by_default(self, mock_console, host_player, sample_questions, monkeypatch):
+        """Test the plain accept path is used without the opt-in flag."""
+        monkeypatch.delenv("SHELLQUEST_IOURING", raising=False)
+
+        server = BattleServer(mock_console, host_player, sample_questions)
+
+        assert server._use_iouring is False
+
+    def test_iouring_flag_without_bindings(self, mock_console, host_player, sample_questions, monkeypatch):
+        """Test the flag is ignored when liburing isn't installed."""
+        monkeypatch.setenv("SHELLQUEST_IOURING", "1")
+
+        with patch('shellquest.core.battle_engine.liburing', None):
+            server = BattleServer(mock_console, host_player, sample_questions)
+
+        assert server._use_iouring is False
+
+    def test_accept_client_falls_back(self, mock_console, host_player, sample_questions):
+        """Test a failing io_uring accept falls back to socket.accept()."""
+        server = BattleServer(mock_console, host_player, sample_questions)
+        server._acceptor = Mock()
+        server._acceptor.accept.side_effect = RuntimeError("ring broken")
+        server.server_socket = Mock()
+        server.server_socket.accept.return_value = ("conn", ("10.0.0.2", 4000))
+
+        result = server._accept_client(300)
+
+        assert result == ("conn", ("10.0.0.2", 4000))
+        server.server_socket.settimeout.assert_called_with(300)
+        assert server._acceptor is None
+        assert server._use_iouring is False
+
+
+class FakeLiburing:
+    """Just enough of the liburing bindings to drive IoUringAcceptor.
+
+    ``accept_fd`` completes the accept on submit (None leaves it armed),
+    ``late_fd`` completes it only when the cancel arrives, and
+    ``wait_errors`` are raised by successive timed waits first.
+    """
+
+    def __init__(self):
+        self.accept_fd = None
+        self.late_fd = None
+        self.wait_errors = []
+        self.submitted = []
+        self.armed = []
+        self.completed = []
+        self.rings = 0
+
+    def io_uring(self):
+        self.rings += 1
+        return object()
+
+    def io_uring_cqes(self):
+        return [None]
+
+    def io_uring_queue_init(self, depth, ring, flags):
+        pass
+
+    def io_uring_queue_exit(self, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = Mock()
+        self.submitted.append(sqe)
+        return sqe
+
+    def io_uring_prep_accept(self, sqe, fd, addr, addrlen, flags):
+        sqe.op = 'accept'
+
+    def io_uring_prep_cancel64(self, sqe, user_data, flags):
+        sqe.op = 'cancel'
+        sqe.target = user_data
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe.user_data = data
+
+    def io_uring_submit(self, ring):
+        import errno
+        while self.submitted:
+            sqe = self.submitted.pop(0)
+            if sqe.op == 'accept' and self.accept_fd is not None:
+                self._complete(sqe.user_data, self.accept_fd)
+            elif sqe.op == 'accept':
+                self.armed.append(sqe)
+            elif self.late_fd is not None:
+                # The connection arrived just before the cancel
+                self.armed.clear()
+                self._complete(sqe.user_data, -errno.ENOENT)
+                self._complete(sqe.target, self.late_fd)
+            else:
+                self.armed.clear()
+                self._complete(sqe.target, -errno.ECANCELED)
+                self._complete(sqe.user_data, 0)
+
+    def _complete(self, user_data, res):
+        self.completed.append(Mock(user_data=user_data, res=res))
+
+    def io_uring_wait_cqe_timeout(self, ring, cqes, ts):
+        import errno
+        if self.wait_errors:
+            raise self.wait_errors.pop(0)
+        if not self.completed:
+            raise OSError(errno.ETIME, "Timer expired")
+        cqes[0] = self.completed[0]
+
+    def io_uring_wait_cqe(self, ring, cqes):
+        cqes[0] = self.completed[0]
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        self.completed.remove(cqe)
+
+    def trap_error(self, res):
+        if res < 0:
+            raise OSError(-res, os.strerror(-res))
+        return res
+
+    def timespec(self, seconds):
+        return seconds
+
+
+class TestIoUringAcceptor:
+    """Tests for the io_uring accept path against a stubbed liburing."""
+
+    @pytest.fixture
+    def fake(self):
+        """Install a fake liburing that tracks submitted SQEs."""
+        fake = FakeLiburing()
+        with patch('shellquest.core.battle_engine.liburing', fake):
+            yield fake
+
+    def test_ring_built_only_when_hosting(self, mock_console, host_player, sample_questions,
+                                          monkeypatch, fake):
+        """Test a server that never accepts doesn't create a ring."""
+        monkeypatch.setenv("SHELLQUEST_IOURING", "1")
+
+        server = BattleServer(mock_console, host_player, sample_questions)
+
+        assert server._acceptor is None
+        assert fake.rings == 0
+
+    def test_accept_returns_connection(self, fake):
+        """Test a completed accept is wrapped in a socket."""
+        import socket
+        from shellquest.core.battle_engine import IoUringAcceptor
+        left, right = socket.socketpair()
+        fake.accept_fd = left.detach()
+
+        conn, _ = IoUringAcceptor().accept(Mock(), 5)
+
+        assert conn.fileno() >= 0
+        assert not fake.completed
+        conn.close()
+        right.close()
+
+    def test_eintr_is_retried(self, fake):
+        """Test an interrupted wait (e.g. SIGWINCH) keeps waiting."""
+        import errno
+        import socket
+        from shellquest.core.battle_engine import IoUringAcceptor
+        left, right = socket.socketpair()
+        fake.accept_fd = left.detach()
+        fake.wait_errors = [InterruptedError(errno.EINTR, "Interrupted")]
+
+        conn, _ = IoUringAcceptor().accept(Mock(), 5)
+
+        conn.close()
+        right.close()
+
+    def test_timeout_cancels_pending_accept(self, fake):
+        """Test a timeout cancels the armed accept and reaps both CQEs."""
+        import socket
+        from shellquest.core.battle_engine import IoUringAcceptor
+
+        with pytest.raises(socket.timeout):
+            IoUringAcceptor().accept(Mock(), 0)
+
+        assert not fake.armed
+        assert not fake.completed
+
+    def test_late_connection_is_closed(self, fake):
+        """Test a connection accepted while cancelling isn't leaked."""
+        import socket
+        from shellquest.core.battle_engine import IoUringAcceptor
+        left, right = socket.socketpair()
+        late_fd = left.detach()
+        fake.late_fd = late_fd
+
+        with pytest.raises(socket.timeout):
+            IoUringAcceptor().accept(Mock(), 0)
+
+        with pytest.raises(OSError):
+            os.fstat(late_fd)
+        right.close()
+
+    def test_failed_accept_still_releases_cqe(self, fake):
+        """Test an error completion is marked seen before it propagates."""
+        import errno
+        from shellquest.core.battle_engine import IoUringAcceptor
+        fake.accept_fd = -errno.ECONNABORTED
+
+        with pytest.raises(OSError):
+            IoUringAcceptor().accept(Mock(), 5)
+
+        assert not fake.completed
+
 
 class TestBattleServerPointCalculation:
     """Tests for battle point calculation."""
 
-    def test_correct_fast_answer(self, mock_console, host_player, sample_questions):
+    def test_correct_fast_answer(self):
         """Test points for correct fast answer."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
-        points = server.calculate_battle_points(True, 3.0)
+        points = calculate_battle_points(True, 3.0)
 
         assert points == 150  # 100 base + 50 speed bonus
 
-    def test_correct_medium_answer(self, mock_console, host_player, sample_questions):
+    def test_correct_medium_answer(self):
         """Test points for correct medium speed answer."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
-        points = server.calculate_battle_points(True, 7.0)
+        points = calculate_battle_points(True, 7.0)
 
         assert points == 130  # 100 base + 30 speed bonus
 
-    def test_correct_slow_answer(self, mock_console, host_player, sample_questions):
+    def test_correct_slow_answer(self):
         """Test points for correct slow answer."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
-        points = server.calculate_battle_points(True, 15.0)
+        points = calculate_battle_points(True, 15.0)
 
         assert points == 110  # 100 base + 10 speed bonus
 
-    def test_correct_very_slow_answer(self, mock_console, host_player, sample_questions):
+    def test_correct_very_slow_answer(self):
         """Test points for correct very slow answer."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
-        points = server.calculate_battle_points(True, 25.0)
+        points = calculate_battle_points(True, 25.0)
 
         assert points == 100  # 100 base + 0 speed bonus
 
-    def test_wrong_answer(self, mock_console, host_player, sample_questions):
-        """Test points for wrong answer."""
-        server = BattleServer(mock_console, host_player, sample_questions)
+    def test_tier_boundaries(self):
+        """Test a time exactly on a threshold falls into the slower tier."""
+        assert calculate_battle_points(True, 5.0) == 130
+        assert calculate_battle_points(True, 10.0) == 110
+        assert calculate_battle_points(True, 20.0) == 100
 
-        points = server.calculate_battle_points(False, 2.0)
+    def test_wrong_answer(self):
+        """Test points for wrong answer."""
+        points = calculate_battle_points(False, 2.0)
 
         assert points == 0
 
@@ -323,15 +708,6 @@ class TestBattleClientInit:
         assert client.socket is None
         assert client.host_name == ""
 
-    def test_client_point_calculation(self, mock_console, client_player):
-        """Test client point calculation matches server."""
-        client = BattleClient(mock_console, client_player)
-
-        # Same logic as server
-        assert client.calculate_battle_points(True, 3.0) == 150
-        assert client.calculate_battle_points(True, 7.0) == 130
-        assert client.calculate_battle_points(False, 1.0) == 0
-
 
 class TestBattleClientIPValidation:
     """Tests for IP/hostname validation in client."""
@@ -365,12 +741,30 @@ class TestBattleClientIPValidation:
 
             assert result is False  # Fails at connect, validation passed
 
+    def test_numeric_ip_skips_dns(self, mock_console, client_player):
+        """Test numeric addresses are resolved with AI_NUMERICHOST."""
+        import socket
+        client = BattleClient(mock_console, client_player)
+
+        with patch('socket.socket') as mock_socket, \
+                patch('socket.getaddrinfo', wraps=socket.getaddrinfo) as mock_resolve:
+            mock_instance = Mock()
+            mock_socket.return_value = mock_instance
+            mock_instance.connect.side_effect = ConnectionRefusedError()
+
+            client.join_game("10.0.0.5")
+
+            flags = mock_resolve.call_args[0][5]
+            assert flags & socket.AI_NUMERICHOST
+            mock_instance.connect.assert_called_with(("10.0.0.5", 5555))
+
     def test_invalid_ip_format(self, mock_console, client_player):
         """Test invalid IP format is rejected."""
         client = BattleClient(mock_console, client_player)
 
         with patch('socket.socket') as mock_socket:
             mock_instance = Mock()
+            mock_instance.recv_into.return_value = 0  # Host hangs up
             mock_socket.return_value = mock_instance
 
             result = client.join_game("not..valid..ip")
@@ -447,70 +841,83 @@ class TestBattleClientCleanup:
 class TestBattleServerTimeValidation:
     """Tests for server-side time validation (anti-cheat)."""
 
-    def test_impossibly_fast_time_penalized(self, mock_console, host_player, sample_questions):
+    def test_impossibly_fast_time_penalized(self):
         """Test that impossibly fast times are penalized."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
-        # Simulate receiving result with impossibly fast time
         opp_result_data = {
             'data': {'time_taken': 0.1},  # Too fast - impossible
             'answer': 'wrong'
         }
 
         # Server should cap this to 60 seconds (penalty)
-        client_time = opp_result_data['data'].get('time_taken', 0)
-        if not isinstance(client_time, (int, float)) or client_time < 0.5:
-            client_time = 60.0
-
-        assert client_time == 60.0
+        assert ClientResult.parse(opp_result_data).time_taken == 60.0
 
-    def test_negative_time_penalized(self, mock_console, host_player, sample_questions):
+    def test_negative_time_penalized(self):
         """Test that negative times are penalized."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
         opp_result_data = {
             'data': {'time_taken': -5.0},
             'answer': 'test'
         }
 
-        client_time = opp_result_data['data'].get('time_taken', 0)
-        if not isinstance(client_time, (int, float)) or client_time < 0.5:
-            client_time = 60.0
+        assert ClientResult.parse(opp_result_data).time_taken == 60.0
 
-        assert client_time == 60.0
+    def test_non_numeric_time_penalized(self):
+        """Test that non-numeric and NaN times are penalized."""
+        for bad in ("fast", None, True, float("nan")):
+            result = ClientResult.parse({'data': {'time_taken': bad}, 'answer': 'x'})
+            assert result.time_taken == 60.0
 
-    def test_valid_time_accepted(self, mock_console, host_player, sample_questions):
+    def test_valid_time_accepted(self):
         """Test that valid times are accepted."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
         opp_result_data = {
             'data': {'time_taken': 5.5},
             'answer': 'test'
         }
 
-        client_time = opp_result_data['data'].get('time_taken', 0)
-        if not isinstance(client_time, (int, float)) or client_time < 0.5:
-            client_time = 60.0
-        client_time = min(client_time, 300.0)
+        assert ClientResult.parse(opp_result_data).time_taken == 5.5
 
-        assert client_time == 5.5
-
-    def test_very_long_time_capped(self, mock_console, host_player, sample_questions):
+    def test_very_long_time_capped(self):
         """Test that very long times are capped."""
-        server = BattleServer(mock_console, host_player, sample_questions)
-
         opp_result_data = {
             'data': {'time_taken': 999999.0},
             'answer': 'test'
         }
 
-        client_time = opp_result_data['data'].get('time_taken', 0)
-        if not isinstance(client_time, (int, float)) or client_time < 0.5:
-            client_time = 60.0
-        client_time = min(client_time, 300.0)
+        assert ClientResult.parse(opp_result_data).time_taken == 300.0
+
+    def test_missing_data_rejected(self):
+        """Test a result without its data block is rejected."""
+        assert ClientResult.parse({'answer': 'test'}) is None
+
+    def test_non_string_answer_ignored(self):
+        """Test a non-string answer is treated as no answer."""
+        result = ClientResult.parse({'data': {'time_taken': 3.0}, 'answer': ['ls']})
+
+        assert result.answer == ''
+
+
+class TestHandshake:
+    """Tests for handshake validation."""
+
+    def test_valid_handshake(self):
+        """Test name and question hash are accepted."""
+        hello = Handshake.parse({'name': 'Player', 'questions_hash': 'abc'})
+
+        assert hello.name == 'Player'
+        assert hello.questions_hash == 'abc'
 
-        assert client_time == 300.0
+    def test_name_is_sanitized(self):
+        """Test the name goes through sanitize_name."""
+        assert Handshake.parse({'name': '[bold]Evil[/bold]'}).name == 'Evil'
 
+    @pytest.mark.parametrize("message", [
+        {},
+        {'name': 42},
+        {'name': 'Player', 'questions_hash': 1},
+    ])
+    def test_invalid_handshake(self, message):
+        """Test missing or mistyped fields raise ValueError."""
+        with pytest.raises(ValueError):
+            Handshake.parse(message)
 
 class TestBattlePlayerStats:
     """Tests for player stats updates after battle."""
@@ -636,3 +1043,47 @@ class TestBattleIntegration:
         assert parsed['type'] == 'game_over'
         assert parsed['winner'] == 'HostPlayer'
         assert parsed['scores']['HostPlayer'] == 450
+
+    def test_client_round_over_socket(self, mock_console, client_player, sample_questions):
+        """Test a full client round through the background receive thread."""
+        import socket
+        from shellquest.core.battle_engine import BattleState
+
+        host_sock, client_sock = socket.socketpair()
+        host = BattleChannel(host_sock)
+        client = BattleClient(mock_console, client_player)
+        client.socket = client_sock
+        client.channel = BattleChannel(client_sock)
+        client.host_name = "HostPlayer"
+        client.state = BattleState(
+            question_num=0, total_questions=1, player1_score=0, player2_score=0,
+            player1_name="HostPlayer", player2_name=client_player.username
+        )
+
+        question = sample_questions[0]
+        host.send_many([
+            {'type': 'question', 'num': 1, 'total': 1, 'scores': {},
+             'data': {'id': question.id, 'text': question.question_text,
+                      'options': question.options, 'type': question.type.value,
+                      'command': question.command}},
+        ])
+        host.send_result(BattleResult("HostPlayer", True, 2.0, 150), correct_answer="Option l")
+        host.send({'type': 'game_over', 'winner': "HostPlayer",
+                   'scores': {"HostPlayer": 150, client_player.username: 0}})
+
+        my_result = BattleResult(client_player.username, False, 3.0, 0)
+        try:
+            with patch.object(client, 'show_battle_question', return_value=(my_result, "Option l")), \
+                 patch.object(client, 'show_round_result') as round_result, \
+                 patch.object(client, 'show_battle_end'):
+                assert client.run_battle_as_client() is True
+
+            assert round_result.call_args[0][2] == "Option l"
+            assert client_player.battles_lost == 1
+            assert host.recv(timeout=5.0)['answer'] == "Option l"
+            assert client._rx_thread is None
+        finally:
+            host.close()
+            client.channel.close()
+            host_sock.close()
+            client_sock.close()
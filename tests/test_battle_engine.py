@@ -5,7 +5,10 @@ import json
 from dataclasses import asdict
 from shellquest.core.battle_engine import (
     BattleResult, BattleState, safe_json_loads,
-    BattleServer, BattleClient
+    BattleServer, BattleClient, _configure_battle_socket,
+    _IPV4_RE, _HOSTNAME_RE, _read_answer, _normalize_mcq_answer,
+    _select_battle_questions, questions_fingerprint,
+    BattleRenderer
 )
 from shellquest.models.player import PlayerStats
 from shellquest.models.question import Question, QuestionType
@@ -71,6 +74,30 @@ class TestBattleResult:
         assert data['player_name'] == "Test"
         assert data['is_correct'] is False
 
+    def test_to_dict_matches_asdict(self):
+        """Test the wire dict matches dataclasses.asdict."""
+        result = BattleResult(
+            player_name="Test",
+            is_correct=True,
+            time_taken=3.25,
+            points=150
+        )
+        assert result.to_dict() == asdict(result)
+
+    def test_pack_roundtrip(self):
+        """Test binary packing preserves every field."""
+        result = BattleResult("Ünïcode", True, 3.25, 150)
+
+        assert BattleResult.unpack(result.pack()) == result
+
+    def test_unpack_truncated(self):
+        """Test a truncated buffer is rejected."""
+        import struct
+        packed = BattleResult("Player", True, 1.0, 100).pack()
+
+        with pytest.raises(struct.error):
+            BattleResult.unpack(packed[:-2])
+
 
 class TestBattleState:
     """Tests for BattleState dataclass."""
@@ -151,6 +178,141 @@ class TestSafeJsonLoads:
         assert len(result['questions']) == 3
 
 
+class TestConfigureBattleSocket:
+    """Tests for battle socket tuning."""
+
+    def test_disables_nagle(self):
+        """Test that TCP_NODELAY is enabled on the socket."""
+        import socket
+        mock_sock = Mock()
+        _configure_battle_socket(mock_sock)
+        mock_sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def test_enables_keepalive(self):
+        """Test that SO_KEEPALIVE is enabled on the socket."""
+        import socket
+        mock_sock = Mock()
+        _configure_battle_socket(mock_sock)
+        mock_sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+class TestHostAddressPatterns:
+    """Tests for host address validation patterns."""
+
+    def test_ipv4_matches(self):
+        """Test dotted-quad addresses match the IPv4 pattern."""
+        assert _IPV4_RE.match("192.168.1.10")
+        assert not _IPV4_RE.match("192.168.1")
+
+    def test_hostname_matches(self):
+        """Test hostnames including single characters are accepted."""
+        assert _HOSTNAME_RE.match("localhost")
+        assert _HOSTNAME_RE.match("game-host.lan")
+        assert _HOSTNAME_RE.match("a")
+
+    def test_hostname_rejects_bad_edges(self):
+        """Test hostnames can't start or end with a dot or hyphen."""
+        assert not _HOSTNAME_RE.match("-host")
+        assert not _HOSTNAME_RE.match("host.")
+        assert not _HOSTNAME_RE.match("")
+
+
+class TestNormalizeMcqAnswer:
+    """Tests for multiple choice shortcut expansion."""
+
+    OPTIONS = ["correct", "wrong1", "wrong2", "wrong3"]
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("1", "correct"), ("4", "wrong3"),
+        ("a", "correct"), ("D", "wrong3"),
+    ])
+    def test_shortcuts_expand(self, raw, expected):
+        """Test number and letter shortcuts map to the same options."""
+        assert _normalize_mcq_answer(raw, self.OPTIONS) == expected
+
+    def test_out_of_range_kept(self):
+        """Test a shortcut past the last option is left as typed."""
+        assert _normalize_mcq_answer("c", ["yes", "no"]) == "c"
+
+    def test_free_text_kept(self):
+        """Test non-shortcut answers pass through unchanged."""
+        assert _normalize_mcq_answer("ls -la", self.OPTIONS) == "ls -la"
+        assert _normalize_mcq_answer("5", self.OPTIONS) == "5"
+
+    def test_no_options(self):
+        """Test shortcuts aren't expanded for free-form questions."""
+        assert _normalize_mcq_answer("a", None) == "a"
+        assert _normalize_mcq_answer("a", []) == "a"
+
+
+class TestReadAnswer:
+    """Tests for the battle answer prompt."""
+
+    OPTIONS = ["ls -la", "df -h", "cat file.txt", "chmod 755"]
+
+    def test_non_tty_uses_prompt(self, mock_console):
+        """Test piped input falls back to a normal line prompt."""
+        with patch('sys.stdin') as stdin, \
+             patch('shellquest.core.battle_engine.Prompt.ask', return_value=" b "):
+            stdin.isatty.return_value = False
+            answer, time_taken = _read_answer(mock_console, self.OPTIONS)
+
+        assert answer == "b"
+        assert time_taken >= 0
+
+    def test_option_key_returns_immediately(self, mock_console):
+        """Test an option number is accepted without waiting for ENTER."""
+        with patch('sys.stdin') as stdin, \
+             patch('shellquest.core.battle_engine.read_key', return_value="3"), \
+             patch('builtins.input') as mock_input:
+            stdin.isatty.return_value = True
+            answer, _ = _read_answer(mock_console, self.OPTIONS)
+
+        assert answer == "3"
+        mock_input.assert_not_called()
+
+    def test_other_key_reads_rest_of_line(self, mock_console):
+        """Test a non-option key continues as free-form input."""
+        with patch('sys.stdin') as stdin, \
+             patch('shellquest.core.battle_engine.read_key', return_value="l"), \
+             patch('builtins.input', return_value="s -la"):
+            stdin.isatty.return_value = True
+            answer, _ = _read_answer(mock_console, self.OPTIONS)
+
+        assert answer == "ls -la"
+
+    def test_option_text_starting_with_letter_shortcut(self, mock_console):
+        """Test typing an option's text that starts with a-d isn't cut short."""
+        with patch('sys.stdin') as stdin, \
+             patch('shellquest.core.battle_engine.read_key', return_value="c"), \
+             patch('builtins.input', return_value="at file.txt"):
+            stdin.isatty.return_value = True
+            answer, _ = _read_answer(mock_console, self.OPTIONS)
+
+        assert _normalize_mcq_answer(answer, self.OPTIONS) == "cat file.txt"
+
+    def test_digit_beyond_options_reads_line(self, mock_console):
+        """Test a digit with no matching option isn't taken as a shortcut."""
+        with patch('sys.stdin') as stdin, \
+             patch('shellquest.core.battle_engine.read_key', return_value="3"), \
+             patch('builtins.input', return_value="") as mock_input:
+            stdin.isatty.return_value = True
+            answer, _ = _read_answer(mock_console, self.OPTIONS[:2])
+
+        assert answer == "3"
+        mock_input.assert_called_once()
+
+    def test_free_form_question_uses_prompt(self, mock_console):
+        """Test questions without options always read a full line."""
+        with patch('shellquest.core.battle_engine.Prompt.ask', return_value="pwd") as ask, \
+             patch('shellquest.core.battle_engine.read_key') as first_key:
+            answer, _ = _read_answer(mock_console, None)
+
+        assert answer == "pwd"
+        ask.assert_called_once()
+        first_key.assert_not_called()
+
+
 class TestBattleServerInit:
     """Tests for BattleServer initialization."""
 
@@ -185,6 +347,62 @@ class TestBattleClientInit:
         assert client.socket is None
         assert client.host_name == ""
 
+    def test_client_builds_question_bank(self, mock_console, player, sample_questions):
+        """Test the client indexes its questions for ID-only rounds."""
+        client = BattleClient(mock_console, player, sample_questions)
+
+        assert set(client.question_bank) == {q.id for q in sample_questions}
+        assert 'correct_answer' not in client.question_bank["battle_q0"]
+
+    def test_rx_pump_stops_when_nobody_reads(self, mock_console, player):
+        """Test the receive thread exits on stop even with a full queue."""
+        import threading
+        client = BattleClient(mock_console, player)
+        client.channel = Mock(closed=False)
+        client.channel.recv.return_value = {'type': 'question'}
+        client._rx_thread = threading.Thread(target=client._rx_pump, daemon=True)
+        client._rx_thread.start()
+        thread = client._rx_thread
+
+        client._stop_rx_pump()
+
+        assert not thread.is_alive()
+
+    def test_client_resolves_question_id(self, mock_console, player, sample_questions):
+        """Test a question sent by ID is rendered from the local bank."""
+        client = BattleClient(mock_console, player, sample_questions)
+        client.host_name = "Host"
+        client.state = BattleState(
+            question_num=0, total_questions=1, player1_score=0, player2_score=0,
+            player1_name="Host", player2_name=player.username
+        )
+        client.channel = Mock()
+        client.channel.recv.side_effect = [
+            {'type': 'question', 'id': 'battle_q3', 'num': 1, 'total': 1, 'scores': {}},
+            None,
+        ]
+
+        with patch.object(client, 'show_battle_question',
+                          return_value=(BattleResult(player.username, False, 1.0, 0), "a")) as show:
+            client.run_battle_as_client()
+
+        assert show.call_args[0][0]['text'] == "Battle question 3?"
+
+
+class TestQuestionsFingerprint:
+    """Tests for the question bank fingerprint."""
+
+    def test_order_independent(self, sample_questions):
+        """Test the fingerprint doesn't depend on load order."""
+        assert questions_fingerprint(sample_questions) == questions_fingerprint(sample_questions[::-1])
+
+    def test_changes_with_content(self, sample_questions):
+        """Test editing a question changes the fingerprint."""
+        before = questions_fingerprint(sample_questions)
+        sample_questions[0].question_text = "Edited?"
+
+        assert questions_fingerprint(sample_questions) != before
+
 
 class TestBattleQuestionSelection:
     """Tests for battle question selection."""
@@ -224,6 +442,21 @@ class TestBattleQuestionSelection:
 
         assert len(selected) == 1  # Only 1 question available
 
+    def test_select_caps_at_pool_size(self, sample_questions):
+        """Test asking for more questions than exist returns the whole pool."""
+        selected = _select_battle_questions(sample_questions, 50)
+
+        assert len(selected) == len(sample_questions)
+        assert {q.id for q in selected} == {q.id for q in sample_questions}
+        assert selected is not sample_questions
+
+    def test_select_subset(self, sample_questions):
+        """Test a smaller request returns distinct questions from the pool."""
+        selected = _select_battle_questions(sample_questions, 3)
+
+        assert len(selected) == 3
+        assert len({q.id for q in selected}) == 3
+
 
 class TestBattleScoring:
     """Tests for battle scoring logic."""
@@ -260,6 +493,78 @@ class TestBattleScoring:
         assert total == 35
 
 
+class TestBattleRenderer:
+    """Tests for the shared battle screens."""
+
+    @pytest.fixture
+    def final_state(self):
+        """Finished battle won by the host."""
+        return BattleState(
+            question_num=5, total_questions=5, player1_score=400, player2_score=250,
+            player1_name="Host", player2_name="Guest", game_over=True, winner="Host"
+        )
+
+    def _rendered(self, final_state, my_name, is_host):
+        from rich.console import Console
+        console = Console(record=True, width=80)
+        with patch('shellquest.core.battle_engine.clear_terminal'), \
+             patch('builtins.input', return_value=""):
+            BattleRenderer.battle_end(console, final_state, my_name, is_host=is_host)
+        return console.export_text()
+
+    def test_battle_end_victory_for_host(self, final_state):
+        """Test the winner sees the victory banner."""
+        text = self._rendered(final_state, "Host", is_host=True)
+
+        assert "VICTORY" in text
+        assert text.index("Host: 400 pts") < text.index("Guest: 250 pts")
+
+    def test_battle_end_defeat_for_client(self, final_state):
+        """Test the loser sees defeat with the host still listed first."""
+        text = self._rendered(final_state, "Guest", is_host=False)
+
+        assert "DEFEAT" in text
+        assert text.index("Host: 400 pts") < text.index("Guest: 250 pts")
+
+    def test_question_screen_single_print(self, mock_console, final_state):
+        """Test the scoreboard and question go out in one print."""
+        from rich.panel import Panel
+        with patch('shellquest.core.battle_engine.clear_terminal') as clear:
+            BattleRenderer.question_screen(
+                mock_console, final_state, 2, 5, is_host=True, question_panel=Panel("Q?")
+            )
+
+        clear.assert_called_once()
+        mock_console.print.assert_called_once()
+
+    def test_question_screen_shows_scores(self, final_state):
+        """Test both players' names and scores are rendered."""
+        from rich.console import Console
+        from rich.panel import Panel
+        console = Console(record=True, width=80)
+        with patch('shellquest.core.battle_engine.clear_terminal'):
+            BattleRenderer.question_screen(
+                console, final_state, 2, 5, is_host=False, question_panel=Panel("Q?")
+            )
+        text = console.export_text()
+
+        assert "Round 2/5" in text
+        assert "Host" in text and "Guest" in text
+        assert "400" in text and "250" in text
+
+    def test_round_result_waits_after_wrong_answer(self, mock_console):
+        """Test a wrong answer pauses for ENTER."""
+        with patch('builtins.input') as mock_input:
+            BattleRenderer.round_result(
+                mock_console,
+                BattleResult("Me", False, 4.0, 0),
+                BattleResult("Them", True, 2.0, 150),
+                "ls -la"
+            )
+
+        mock_input.assert_called_once()
+
+
 class TestBattleStateTransitions:
     """Tests for battle state transitions."""
 
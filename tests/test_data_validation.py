@@ -46,6 +46,19 @@ class TestCommandsData:
         count = len(data['commands'])
         assert count >= 10, f"Expected at least 10 essential commands, got {count}"
 
+    def test_commands_grouped_by_category(self):
+        """Test category groups cover every command with aligned columns."""
+        from shellquest.data.loader import DataLoader
+
+        loader = DataLoader(DATA_DIR)
+        groups = loader.load_commands_by_category()
+
+        assert sum(len(g) for g in groups.values()) == len(loader.load_all_commands())
+        for category, group in groups.items():
+            assert group.names == tuple(c.name for c in group.commands)
+            assert all(len(p) <= 43 and p.endswith("...") for p in group.previews)
+            assert all(c.category == category for c in group.commands)
+
 
 class TestQuestionsData:
     """Validate questions YAML files."""
@@ -1,7 +1,9 @@
 """Unit tests for the Mystery Engine."""
 
 import pytest
+import yaml
 from unittest.mock import Mock, patch
+from rich.text import Text
 from shellquest.core.mystery_engine import (
     MysteryEngine, Challenge, Scene, Suspect, MysteryCase
 )
@@ -56,6 +58,43 @@ class TestChallenge:
         )
         assert len(challenge.correct_answers) == 3
 
+    def test_option_prompt_precomputed(self):
+        """Test option letters, numbers and key lookup are built up front."""
+        challenge = Challenge(
+            id="ch4",
+            context="",
+            question_type="multiple_choice",
+            question="?",
+            correct_answers=["cd"],
+            hint="",
+            success_narrative="",
+            clue_unlocked="",
+            options=["ls", "cd", "rm"]
+        )
+        assert challenge.letters == "A/B/C"
+        assert challenge.numbers == "1/2/3"
+        assert challenge.option_keys["B"] == 1
+        assert challenge.option_keys["3"] == 2
+        assert "D" not in challenge.option_keys
+        assert "0" not in challenge.option_keys
+
+    def test_challenge_is_frozen(self):
+        """Test loaded challenges can't be modified."""
+        from dataclasses import FrozenInstanceError
+
+        challenge = Challenge(
+            id="ch3",
+            context="",
+            question_type="fill_blank",
+            question="?",
+            correct_answers=["pwd"],
+            hint="",
+            success_narrative="",
+            clue_unlocked="",
+        )
+        with pytest.raises(FrozenInstanceError):
+            challenge.hint = "changed"
+
 
 class TestScene:
     """Tests for Scene dataclass."""
@@ -133,6 +172,20 @@ class TestMysteryCase:
         assert len(case.suspects) == 2
         assert case.rewards["xp"] == 500
 
+    def test_total_clues_counted_from_scenes(self):
+        """Test a case built without a clue count derives it from its scenes."""
+        challenge = Challenge("c", "", "fill_blank", "?", ["ls"], "", "", "")
+        scenes = [
+            Scene("s1", "T", "L", "N", "O", [challenge, challenge]),
+            Scene("s2", "T", "L", "N", "O", [challenge]),
+        ]
+        case = MysteryCase(
+            id="case2", title="T", subtitle="S", difficulty="easy",
+            intro="", setting="", suspects=[], scenes=scenes,
+            conclusion_success="", conclusion_failure="", rewards={}
+        )
+        assert case.total_clues == 3
+
 
 class TestMysteryEngineInit:
     """Tests for MysteryEngine initialization."""
@@ -147,6 +200,76 @@ class TestMysteryEngineInit:
         assert engine.total_clues == 0
 
 
+class TestCaseLoading:
+    """Tests for loading and caching case files."""
+
+    def test_unchanged_case_parsed_once(self, mock_console, player):
+        """Test a second load of an unchanged file reuses the parsed case."""
+        engine = MysteryEngine(mock_console, player)
+        with patch('shellquest.core.mystery_engine.yaml.load', wraps=yaml.load) as load:
+            first = engine.load_case("case_001.yaml")
+            second = engine.load_case("case_001.yaml")
+
+        assert first is not None
+        assert second is first
+        assert load.call_count == 1
+
+    def test_cache_hit_sets_total_clues(self, mock_console, player):
+        """Test total_clues follows the case returned from the cache."""
+        engine = MysteryEngine(mock_console, player)
+        case = engine.load_case("case_001.yaml")
+        engine.load_case("case_002.yaml")
+        engine.load_case("case_001.yaml")
+
+        assert engine.total_clues == sum(len(sc.challenges) for sc in case.scenes)
+
+    def test_case_index_built_once(self, mock_console, player):
+        """Test the case directory is scanned once while it is unchanged."""
+        engine = MysteryEngine(mock_console, player)
+        first = engine._ensure_case_index()
+        with patch.object(engine, 'load_case_header') as load_header:
+            second = engine._ensure_case_index()
+
+        assert second is first
+        assert [name for name, _ in first] == sorted(name for name, _ in first)
+        load_header.assert_not_called()
+
+    def test_header_matches_full_case(self, mock_console, player):
+        """Test the header-only read agrees with the full load."""
+        engine = MysteryEngine(mock_console, player)
+        header = engine.load_case_header("case_001.yaml")
+        case = engine.load_case("case_001.yaml")
+
+        assert (header.id, header.title, header.subtitle, header.difficulty) == \
+            (case.id, case.title, case.subtitle, case.difficulty)
+
+    def test_header_stops_after_case_section(self, mock_console, player, tmp_path):
+        """Test content after the case mapping is never parsed."""
+        (tmp_path / "case_x.yaml").write_text(
+            "case:\n  id: x\n  title: T\n  subtitle: S\n  difficulty: easy\n"
+            "  tags: [a, b]\n"
+            "scenes: [unterminated\n"
+        )
+        engine = MysteryEngine(mock_console, player)
+        with patch('shellquest.core.mystery_engine._CASES_DIR', tmp_path):
+            header = engine.load_case_header("case_x.yaml")
+
+        assert header.title == "T"
+        assert header.difficulty == "easy"
+
+    def test_empty_case_returns_none(self, mock_console, player, tmp_path):
+        """Test an empty case file is rejected instead of mapped."""
+        (tmp_path / "case_empty.yaml").write_bytes(b"")
+        engine = MysteryEngine(mock_console, player)
+        with patch('shellquest.core.mystery_engine._CASES_DIR', tmp_path):
+            assert engine.load_case("case_empty.yaml") is None
+
+    def test_missing_case_returns_none(self, mock_console, player):
+        """Test a missing file is reported as None."""
+        engine = MysteryEngine(mock_console, player)
+        assert engine.load_case("case_missing.yaml") is None
+
+
 class TestAnswerChecking:
     """Tests for answer checking logic."""
 
@@ -226,6 +349,56 @@ class TestAnswerChecking:
         assert engine.check_answer("als", challenge) is False
         assert engine.check_answer("lsof", challenge) is False
 
+    def test_answers_normalized_at_construction(self, mock_console, player):
+        """Test correct answers are stripped and lowercased once up front."""
+        engine = MysteryEngine(mock_console, player)
+        challenge = Challenge(
+            id="test",
+            context="",
+            question_type="fill_blank",
+            question="?",
+            correct_answers=["  Grep -R ", "ack"],
+            hint="",
+            success_narrative="",
+            clue_unlocked="",
+        )
+
+        assert challenge.correct_answers_lower == frozenset({"grep -r", "ack"})
+        assert engine.check_answer("grep -r", challenge) is True
+
+
+class TestRunChallenge:
+    """Tests for the challenge input loop."""
+
+    def test_hint_built_once_per_challenge(self, mock_console, player):
+        """Test repeated H presses reuse one parsed hint."""
+        engine = MysteryEngine(mock_console, player)
+        challenge = Challenge(
+            id="ch5",
+            context="",
+            question_type="fill_blank",
+            question="?",
+            correct_answers=["ls"],
+            hint="Try [bold]ls -a[/bold]",
+            success_narrative="",
+            clue_unlocked="",
+        )
+        scene = Scene(id="s1", title="Scene", location="", narrative="",
+                      objective="", challenges=[challenge])
+
+        with patch('shellquest.core.mystery_engine.Prompt.ask', side_effect=["H", "H", "Q"]), \
+             patch('shellquest.core.mystery_engine.clear_terminal'), \
+             patch('shellquest.core.mystery_engine.Text.from_markup',
+                   wraps=Text.from_markup) as parse:
+            result = engine.run_challenge(scene, challenge, 1, 1)
+
+        assert result is None
+        parse.assert_called_once()
+        hints = [c.args[0] for c in mock_console.print.call_args_list
+                 if getattr(c.args[0], 'plain', None) == "\nHint: Try ls -a\n"]
+        assert len(hints) == 2
+        assert hints[0] is hints[1]
+
 
 class TestClueTracking:
     """Tests for clue tracking."""
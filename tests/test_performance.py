@@ -286,7 +286,7 @@ class TestMemoryUsage:
             f"cmd{i}": {"correct": i * 100, "total": i * 150}
             for i in range(100)
         }
-        player.unlocked_achievements = [f"ach{i}" for i in range(50)]
+        player.unlocked_achievements = {f"ach{i}" for i in range(50)}
 
         # Should be reasonably sized
         size = sys.getsizeof(player)
@@ -26,7 +26,46 @@ class TestPlayerStatsCreation:
         assert player.battles_lost == 0
         assert player.essential_progress == {}
         assert player.advanced_progress == {}
-        assert player.unlocked_achievements == []
+        assert player.unlocked_achievements == set()
+
+    def test_list_fields_coerced_to_sets(self):
+        """Test set fields loaded from JSON lists become sets."""
+        player = PlayerStats(username="Test", unlocked_achievements=["a", "b", "a"])
+        assert player.unlocked_achievements == {"a", "b"}
+
+    def test_to_dict_serializes_sets_as_sorted_lists(self):
+        """Test set fields are JSON-friendly in to_dict()."""
+        player = PlayerStats(username="Test", unlocked_achievements={"b", "a"})
+        assert player.to_dict()["unlocked_achievements"] == ["a", "b"]
+
+    def test_story_progress_loaded_as_sets(self):
+        """Test completed levels and chapters from an old list save become sets."""
+        player = PlayerStats(username="Test", completed_levels=["l2", "l1"],
+                             completed_chapters=["ch1"])
+        assert player.completed_levels == {"l1", "l2"}
+        assert player.completed_chapters == {"ch1"}
+        assert player.to_dict()["completed_levels"] == ["l1", "l2"]
+
+    def test_to_dict_matches_asdict(self):
+        """Test to_dict has the same content as dataclasses.asdict."""
+        from dataclasses import asdict
+        player = PlayerStats(username="Test", recently_answered=["q1"],
+                             command_stats={"ls": {"correct": 1, "total": 2}})
+        expected = asdict(player)
+        for name in PlayerStats._SET_FIELDS:
+            expected[name] = []
+        assert player.to_dict() == expected
+
+    def test_to_dict_does_not_share_containers(self):
+        """Test later changes to the player don't show up in an earlier dict."""
+        player = PlayerStats(username="Test", recently_answered=["q1"],
+                             command_stats={"ls": {"correct": 1, "total": 2}})
+        data = player.to_dict()
+        player.recently_answered.append("q2")
+        player.command_stats["ls"]["total"] += 1
+
+        assert data["recently_answered"] == ["q1"]
+        assert data["command_stats"]["ls"]["total"] == 2
 
 
 class TestAccuracy:
@@ -124,6 +163,28 @@ class TestRecordAnswer:
         assert player.recently_answered[-1] == "q59"
 
 
+class TestApplyResult:
+    """Tests for apply_result method."""
+
+    def test_apply_result_adds_xp_and_records(self):
+        """Test XP is awarded and the answer recorded together."""
+        player = PlayerStats(username="Test")
+        player.apply_result("ls", True, "q1", 25)
+
+        assert player.xp == 25
+        assert player.correct_answers == 1
+        assert player.recently_answered == ["q1"]
+
+    def test_apply_result_without_xp(self):
+        """Test a wrong answer records without touching XP."""
+        player = PlayerStats(username="Test", xp=40)
+        player.apply_result("ls", False, "q1")
+
+        assert player.xp == 40
+        assert player.total_questions_answered == 1
+        assert player.streak == 0
+
+
 class TestWeakAndStrongAreas:
     """Tests for weak_areas and strong_areas properties."""
 
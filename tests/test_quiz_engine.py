@@ -1,7 +1,8 @@
 """Unit tests for the QuizEngine."""
 
 import pytest
-from shellquest.core.quiz_engine import QuizEngine
+from unittest.mock import patch
+from shellquest.core.quiz_engine import QuizEngine, _question_weights, _weighted_index
 from shellquest.models.question import Question, QuestionType
 from shellquest.models.player import PlayerStats, PlayerSession
 
@@ -51,7 +52,7 @@ class TestQuizEngineCreation:
         engine = QuizEngine(sample_questions)
         assert len(engine.question_pool) == 5
         assert engine.current_question is None
-        assert engine.session_questions == []
+        assert list(engine.session_questions) == []
 
     def test_create_with_empty_pool(self):
         """Test creating engine with empty question pool."""
@@ -82,6 +83,13 @@ class TestSelectNextQuestion:
         quiz_engine.select_next_question(player, session)
         assert len(quiz_engine.session_questions) == 2
 
+    def test_session_questions_keep_latest_only(self, sample_questions, player, session):
+        """Test only the most recent session IDs are kept."""
+        engine = QuizEngine(sample_questions * 3)
+        for _ in range(QuizEngine.SESSION_RECENT + 5):
+            engine.select_next_question(player, session)
+        assert len(engine.session_questions) == QuizEngine.SESSION_RECENT
+
     def test_select_sets_current_question(self, quiz_engine, player, session):
         """Test that select sets current_question."""
         question = quiz_engine.select_next_question(player, session)
@@ -170,7 +178,7 @@ class TestResetSession:
         assert len(quiz_engine.session_questions) == 2
 
         quiz_engine.reset_session()
-        assert quiz_engine.session_questions == []
+        assert list(quiz_engine.session_questions) == []
 
     def test_reset_clears_current_question(self, quiz_engine, player, session):
         """Test that reset clears current question."""
@@ -206,6 +214,21 @@ class TestGetQuestionDisplay:
 class TestWeightedSelection:
     """Tests for weighted selection algorithm edge cases."""
 
+    def test_draw_maps_to_cumulative_bucket(self, sample_questions, player, session):
+        """Test the random draw picks the question whose weight range holds it."""
+        engine = QuizEngine(sample_questions)
+        # Fresh player: every question weighs the same, so q2 covers 40%-60%
+        with patch('shellquest.core.quiz_engine.random.random', return_value=0.5):
+            question = engine.select_next_question(player, session)
+        assert question.id == "q2"
+
+    def test_draw_at_upper_bound_picks_last(self, sample_questions, player, session):
+        """Test a draw at the very top of the range selects the last question."""
+        engine = QuizEngine(sample_questions)
+        with patch('shellquest.core.quiz_engine.random.random', return_value=1.0):
+            question = engine.select_next_question(player, session)
+        assert question.id == "q4"
+
     def test_all_questions_recently_asked(self, sample_questions, player, session):
         """Test selection when all questions were recently asked."""
         engine = QuizEngine(sample_questions)
@@ -231,3 +254,26 @@ class TestWeightedSelection:
 
         question = engine.select_next_question(player, session)
         assert question.id == "only"
+
+
+class TestWeightKernel:
+    """Tests for the pure weighting and sampling helpers."""
+
+    def test_weights_combine_factors(self):
+        """Test recency, weak area, type balance and novelty multiply together."""
+        weights = _question_weights(
+            ["a", "b"], ["ls", "cd"], [0, 1],
+            recent_ids={"a"}, seen_ids={"a"}, weak_areas={"cd"},
+            type_factor=[1.0, 0.5],
+        )
+        assert weights == pytest.approx([0.1, 2.0 * 0.5 * 1.2])
+
+    def test_weighted_index_none_without_weight(self):
+        """Test an empty or all-zero weight list gives no index."""
+        assert _weighted_index([]) is None
+        assert _weighted_index([0.0, 0.0]) is None
+
+    def test_weighted_index_skips_zero_weights(self):
+        """Test zero-weight entries are never drawn."""
+        for _ in range(50):
+            assert _weighted_index([0.0, 1.0, 0.0]) == 1
@@ -0,0 +1,74 @@
+"""Unit tests for the QuizHandler."""
+
+import pytest
+from unittest.mock import Mock, patch
+from shellquest.core.quiz_handler import QuizHandler
+from shellquest.core.quiz_engine import QuizEngine
+from shellquest.core.scoring_system import ScoringSystem
+from shellquest.models.question import Question, QuestionType
+from shellquest.models.player import PlayerStats, PlayerSession
+
+
+@pytest.fixture
+def question():
+    """Create a single sample question."""
+    return Question(
+        id="q1",
+        type=QuestionType.MULTIPLE_CHOICE,
+        command="ls",
+        difficulty="essential",
+        question_text="Question about ls?",
+        correct_answer="correct",
+        explanation="Explanation for ls",
+        points=10,
+        options=["correct", "wrong1", "wrong2", "wrong3"]
+    )
+
+
+@pytest.fixture
+def handler(question):
+    """Create a QuizHandler ready to run one question."""
+    handler = QuizHandler(Mock(), ScoringSystem())
+    handler.quiz_engine = QuizEngine([question])
+    handler.session = PlayerSession()
+    return handler
+
+
+def _answer(handler, player, answer, achievement_system):
+    """Run one question with the given typed answer."""
+    with patch('shellquest.core.quiz_handler.Prompt.ask', return_value=answer), \
+         patch('shellquest.core.quiz_handler.clear_terminal'), \
+         patch('shellquest.core.quiz_handler.wait_for_key'), \
+         patch('shellquest.core.quiz_handler.time.sleep'), \
+         patch('shellquest.core.quiz_handler.UIComponents.create_achievement_notification'):
+        return handler._run_single_question(player, 1, 1, achievement_system)
+
+
+class TestLevelAfterAnswer:
+    """Tests for the player's level after a question."""
+
+    def test_achievement_xp_levels_up_after_wrong_answer(self, handler):
+        """Test achievement XP crossing a level threshold updates the level."""
+        player = PlayerStats(username="Test", xp=50)
+
+        def unlock(player_stats, session):
+            player_stats.xp += 100
+            return [Mock()]
+
+        achievements = Mock()
+        achievements.check_achievements.side_effect = unlock
+
+        assert _answer(handler, player, "wrong1", achievements) is True
+        assert player.xp == 150
+        assert player.level == 2
+
+    def test_correct_answer_updates_level(self, handler):
+        """Test XP from a correct answer updates the level."""
+        player = PlayerStats(username="Test", xp=99)
+        achievements = Mock()
+        achievements.check_achievements.return_value = []
+
+        _answer(handler, player, "correct", achievements)
+
+        assert player.xp > 99
+        assert player.level == 2
@@ -146,6 +146,13 @@ class TestLevelCalculation:
         # Level 10: need (10-1)^2 * 100 = 8100 XP
         assert scoring.get_level(8100) == 10
 
+    def test_level_beyond_lookup_table(self, scoring):
+        """Test XP past the precomputed table still maps to the right level."""
+        xp = scoring.get_xp_for_level(2000)
+        assert xp == 1999 ** 2 * 100
+        assert scoring.get_level(xp) == 2000
+        assert scoring.get_level(xp - 1) == 1999
+
 
 class TestXPForLevel:
     """Tests for get_xp_for_level method."""
@@ -203,3 +210,14 @@ class TestProgressPercentage:
         """Test percentage is capped at 100%."""
         pct = scoring.get_progress_percentage(10000000)
         assert pct <= 100.0
+
+
+class TestFullProgress:
+    """Tests for get_full_progress method."""
+
+    def test_matches_separate_calls(self, scoring):
+        """Test the combined result agrees with the individual getters."""
+        for xp in (0, 99, 100, 250, 650, 8100):
+            level, current, needed, pct = scoring.get_full_progress(xp)
+            assert (level, current, needed) == scoring.get_level_progress(xp)
+            assert pct == scoring.get_progress_percentage(xp)
@@ -67,6 +67,26 @@ class TestSaveProgress:
         backup_path = state_manager.save_dir / "TestPlayer.bak"
         assert backup_path.exists()
 
+    def test_backup_keeps_previous_save(self, state_manager, sample_player):
+        """Test the backup holds the save it replaced, not the new one."""
+        state_manager.save_progress(sample_player)
+        sample_player.xp = 1000
+        state_manager.save_progress(sample_player)
+
+        with open(state_manager.save_dir / "TestPlayer.bak", 'r') as f:
+            assert json.load(f)['player']['xp'] == 500
+        with open(state_manager.save_dir / "TestPlayer.json", 'r') as f:
+            assert json.load(f)['player']['xp'] == 1000
+
+    def test_backup_copied_when_links_unsupported(self, state_manager, sample_player):
+        """Test the backup falls back to a copy if hard links fail."""
+        from unittest.mock import patch
+        state_manager.save_progress(sample_player)
+        with patch('shellquest.core.state_manager.os.link', side_effect=OSError):
+            assert state_manager.save_progress(sample_player) is True
+
+        assert (state_manager.save_dir / "TestPlayer.bak").exists()
+
     def test_save_is_atomic(self, state_manager, sample_player):
         """Test that no temp file remains after save."""
         state_manager.save_progress(sample_player)
@@ -74,6 +94,94 @@ class TestSaveProgress:
         temp_path = state_manager.save_dir / "TestPlayer.tmp"
         assert not temp_path.exists()
 
+    def test_save_is_flushed_to_disk(self, state_manager, sample_player):
+        """Test the save is fsynced before it replaces the old file."""
+        from unittest.mock import patch
+        with patch('shellquest.core.state_manager.os.fsync') as mock_fsync:
+            assert state_manager.save_progress(sample_player) is True
+
+        mock_fsync.assert_called_once()
+
+    def test_save_writes_achievements_as_list(self, state_manager, sample_player):
+        """Test set fields are stored as sorted JSON lists."""
+        sample_player.unlocked_achievements = {"streak_5", "first_steps"}
+        state_manager.save_progress(sample_player)
+
+        with open(state_manager.save_dir / "TestPlayer.json", 'r') as f:
+            data = json.load(f)
+
+        assert data['player']['unlocked_achievements'] == ["first_steps", "streak_5"]
+
+    def test_save_without_orjson_falls_back(self, state_manager, sample_player):
+        """Test saves still work with only the stdlib json encoder."""
+        from unittest.mock import patch
+        with patch('shellquest.core.state_manager.orjson', None):
+            assert state_manager.save_progress(sample_player) is True
+
+        loaded = state_manager.load_progress("TestPlayer")
+        assert loaded.to_dict() == sample_player.to_dict()
+
+
+class TestSaveProgressAsync:
+    """Tests for background saves."""
+
+    def test_async_save_written_after_wait(self, state_manager, sample_player):
+        """Test a queued save is on disk once wait_for_saves returns."""
+        state_manager.save_progress_async(sample_player)
+        state_manager.wait_for_saves()
+
+        assert (state_manager.save_dir / "TestPlayer.json").exists()
+
+    def test_async_save_snapshots_player(self, state_manager, sample_player):
+        """Test later changes to the player don't leak into a queued save."""
+        sample_player.xp = 100
+        state_manager.save_progress_async(sample_player)
+        sample_player.xp = 999
+        state_manager.wait_for_saves()
+
+        with open(state_manager.save_dir / "TestPlayer.json", 'r') as f:
+            data = json.load(f)
+
+        assert data['player']['xp'] == 100
+
+    def test_burst_of_async_saves_keeps_latest(self, state_manager, sample_player):
+        """Test the newest of several queued saves is the one left on disk."""
+        for xp in range(50):
+            sample_player.xp = xp
+            state_manager.save_progress_async(sample_player)
+        state_manager.wait_for_saves()
+
+        loaded = state_manager.load_progress("TestPlayer")
+        assert loaded.xp == 49
+
+
+class TestAsyncSaveFailure:
+    """Tests for reporting failed background saves."""
+
+    def test_failed_async_save_is_reported_once(self, state_manager, sample_player):
+        """Test a background save failure is flagged for the caller."""
+        from unittest.mock import patch
+        with patch.object(StateManager, '_write_save', return_value=False):
+            state_manager.save_progress_async(sample_player)
+            state_manager.wait_for_saves()
+
+        assert state_manager.take_async_save_failure() is True
+        assert state_manager.take_async_save_failure() is False
+
+    def test_writer_survives_unexpected_error(self, state_manager, sample_player):
+        """Test an exception in one background save doesn't stop later ones."""
+        from unittest.mock import patch
+        with patch.object(StateManager, '_write_save', side_effect=RuntimeError("boom")):
+            state_manager.save_progress_async(sample_player)
+            state_manager.wait_for_saves()
+        assert state_manager.take_async_save_failure() is True
+
+        state_manager.save_progress_async(sample_player)
+        state_manager.wait_for_saves()
+
+        assert state_manager.take_async_save_failure() is False
+        assert (state_manager.save_dir / "TestPlayer.json").exists()
+
 
 class TestLoadProgress:
     """Tests for load_progress method."""
@@ -121,6 +229,16 @@ class TestLoadProgress:
         # Backup has original 500 XP
         assert loaded.xp == 500
 
+    def test_load_without_orjson(self, state_manager, sample_player):
+        """Test saves load with only the stdlib json decoder."""
+        from unittest.mock import patch
+        state_manager.save_progress(sample_player)
+
+        with patch('shellquest.core.state_manager.orjson', None):
+            loaded = state_manager.load_progress("TestPlayer")
+
+        assert loaded.to_dict() == sample_player.to_dict()
+
 
 class TestCreateNewPlayer:
     """Tests for create_new_player method."""
@@ -194,6 +312,28 @@ class TestListSavedPlayers:
         players = state_manager.list_saved_players()
         assert players == ["Alice", "Mike", "Zoe"]
 
+    def test_list_not_rescanned_when_unchanged(self, state_manager):
+        """Test repeated listings reuse the cached scan."""
+        from unittest.mock import patch
+        state_manager.create_new_player("Alice")
+        state_manager.list_saved_players()
+
+        with patch.object(Path, 'glob') as mock_glob:
+            assert state_manager.list_saved_players() == ["Alice"]
+
+        mock_glob.assert_not_called()
+
+    def test_list_sees_new_and_deleted_saves(self, state_manager):
+        """Test adding or deleting a save refreshes the listing."""
+        state_manager.create_new_player("Alice")
+        assert state_manager.list_saved_players() == ["Alice"]
+
+        state_manager.create_new_player("Bob")
+        assert state_manager.list_saved_players() == ["Alice", "Bob"]
+
+        state_manager.delete_save("Alice")
+        assert state_manager.list_saved_players() == ["Bob"]
+
 
 class TestPlayerExists:
     """Tests for player_exists method."""
@@ -250,7 +390,7 @@ class TestDataIntegrity:
         player.streak = 15
         player.best_streak = 20
         player.credits = 500
-        player.unlocked_achievements = ["ach1", "ach2"]
+        player.unlocked_achievements = {"ach1", "ach2"}
         player.command_stats = {"ls": {"correct": 10, "total": 12}}
         player.essential_progress = {"ls": True, "cd": True}
         player.solved_mysteries = ["case1"]
@@ -263,7 +403,27 @@ class TestDataIntegrity:
         assert loaded.streak == 15
         assert loaded.best_streak == 20
         assert loaded.credits == 500
-        assert loaded.unlocked_achievements == ["ach1", "ach2"]
+        assert loaded.unlocked_achievements == {"ach1", "ach2"}
         assert loaded.command_stats["ls"]["correct"] == 10
         assert loaded.essential_progress["ls"] is True
         assert "case1" in loaded.solved_mysteries
+
+    @pytest.mark.parametrize("write_orjson,read_orjson", [(True, False), (False, True)])
+    def test_saves_cross_load_between_encoders(self, state_manager, write_orjson,
+                                               read_orjson):
+        """Test a save written by one JSON backend loads with the other."""
+        from unittest.mock import patch
+        import shellquest.core.state_manager as sm
+        orjson = pytest.importorskip("orjson")
+
+        player = PlayerStats(username="Cross")
+        player.time_played = 1234.567
+        player.solved_mysteries = ["café_noir", "日本"]
+        player.command_stats = {"grep": {"correct": 3, "total": 4}}
+
+        with patch.object(sm, 'orjson', orjson if write_orjson else None):
+            state_manager.save_progress(player)
+        with patch.object(sm, 'orjson', orjson if read_orjson else None):
+            loaded = state_manager.load_progress("Cross")
+
+        assert loaded.to_dict() == player.to_dict()
@@ -128,6 +128,72 @@ class TestStoryEngineInit:
             assert len(engine.all_questions) == 5
 
 
+class TestChapterCache:
+    """Tests for the pickled chapters cache."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        """Point the chapters cache at a temporary file."""
+        path = tmp_path / "chapters.pkl"
+        with patch('shellquest.core.story_engine.CHAPTERS_CACHE_PATH', path):
+            yield path
+
+    def test_first_load_writes_cache(self, mock_console, sample_questions, player, cache_path):
+        """Test parsing chapters.yaml leaves a cache behind."""
+        engine = StoryEngine(mock_console, sample_questions, player)
+
+        assert engine.chapters
+        assert cache_path.exists()
+
+    def test_second_load_skips_yaml(self, mock_console, sample_questions, player, cache_path):
+        """Test a fresh cache is used instead of re-parsing the YAML."""
+        first = StoryEngine(mock_console, sample_questions, player)
+
+        with patch('shellquest.core.story_engine.yaml.load') as mock_load:
+            second = StoryEngine(mock_console, sample_questions, player)
+
+        mock_load.assert_not_called()
+        assert second.chapters == first.chapters
+
+    def test_corrupt_cache_is_ignored(self, mock_console, sample_questions, player, cache_path):
+        """Test an unreadable cache falls back to the YAML."""
+        cache_path.write_bytes(b"not a pickle")
+
+        engine = StoryEngine(mock_console, sample_questions, player)
+
+        assert engine.chapters
+
+    def test_cache_with_foreign_globals_is_rejected(self, mock_console, sample_questions,
+                                                    player, cache_path):
+        """Test a pickle naming anything but Level/Chapter is refused."""
+        import io
+        import os
+        import pickle
+        from shellquest.core.story_engine import _ChaptersUnpickler, yaml
+
+        class Payload:
+            def __reduce__(self):
+                return (os.system, ("exit 0",))
+
+        data = pickle.dumps(Payload())
+        with pytest.raises(pickle.UnpicklingError):
+            _ChaptersUnpickler(io.BytesIO(data)).load()
+
+        cache_path.write_bytes(data)
+        with patch('shellquest.core.story_engine.yaml.load', wraps=yaml.load) as mock_load:
+            engine = StoryEngine(mock_console, sample_questions, player)
+
+        mock_load.assert_called_once()
+        assert engine.chapters
+
+    def test_cache_write_leaves_no_temp_files(self, mock_console, sample_questions,
+                                              player, cache_path):
+        """Test the cache is written via a temp file that gets renamed away."""
+        StoryEngine(mock_console, sample_questions, player)
+
+        assert [p.name for p in cache_path.parent.iterdir()] == ["chapters.pkl"]
+
+
 class TestChapterUnlocking:
     """Tests for chapter unlocking logic."""
 
@@ -172,7 +238,7 @@ class TestChapterUnlocking:
             engine = StoryEngine(mock_console, sample_questions, player)
 
             # Player completed chapter_1
-            player.completed_chapters.append("chapter_1")
+            player.completed_chapters.add("chapter_1")
 
             chapter = Chapter(
                 id="chapter_2",
@@ -234,7 +300,7 @@ class TestLevelUnlocking:
             engine = StoryEngine(mock_console, sample_questions, player)
 
             # Player completed l1
-            player.completed_levels.append("l1")
+            player.completed_levels.add("l1")
 
             chapter = Chapter(
                 id="ch1",
@@ -273,6 +339,16 @@ class TestQuestionFiltering:
             filtered = [q for q in engine.all_questions if q.command in commands]
             assert len(filtered) == 3
 
+    def test_questions_for_level(self, mock_console, sample_questions, player):
+        """Test a level gets every question for its commands, once each."""
+        with patch.object(StoryEngine, 'load_chapters'):
+            engine = StoryEngine(mock_console, sample_questions, player)
+
+        level = Level("l1", "Level", "", "", ["cd", "ls", "cd", "missing"], 2, 50)
+        questions = engine.questions_for_level(level)
+
+        assert sorted(q.command for q in questions) == ["cd", "ls"]
+
 
 class TestProgressTracking:
     """Tests for story progress tracking."""
@@ -282,7 +358,7 @@ class TestProgressTracking:
         level = Level("test_level", "Test", "", "", [], 3, 100)
 
         # Simulate completing level
-        player.completed_levels.append(level.id)
+        player.completed_levels.add(level.id)
         player.xp += level.xp_reward
 
         assert level.id in player.completed_levels
@@ -292,7 +368,7 @@ class TestProgressTracking:
         """Test marking a chapter as complete."""
         chapter = Chapter("test_chapter", "Test", "", "", [], [])
 
-        player.completed_chapters.append(chapter.id)
+        player.completed_chapters.add(chapter.id)
 
         assert chapter.id in player.completed_chapters
 
@@ -305,7 +381,7 @@ class TestProgressTracking:
         ]
 
         for level in levels:
-            player.completed_levels.append(level.id)
+            player.completed_levels.add(level.id)
             player.xp += level.xp_reward
 
         assert len(player.completed_levels) == 3
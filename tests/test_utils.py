@@ -1,8 +1,12 @@
 """Unit tests for utility functions."""
 
+import os
 import pytest
+from unittest.mock import patch
 from shellquest.utils import (
+    _read_char,
     sanitize_name,
+    wait_for_key,
     truncate_string,
     format_duration,
     calculate_percentage,
@@ -126,6 +130,70 @@ class TestCalculatePercentage:
         assert calculate_percentage(10, 10) == 100.0
 
 
+class TestWaitForKey:
+    """Tests for wait_for_key."""
+
+    def test_single_key_skips_line_read(self):
+        """Test a keystroke returns without reading a line."""
+        with patch('shellquest.utils.read_key', return_value="x"), \
+             patch('builtins.input') as line:
+            wait_for_key()
+        line.assert_not_called()
+
+    def test_falls_back_to_input(self):
+        """Test input() is used when single keys can't be read."""
+        with patch('shellquest.utils.read_key', return_value=None), \
+             patch('builtins.input', return_value="") as line:
+            wait_for_key()
+        line.assert_called_once()
+
+
+class TestReadChar:
+    """Tests for _read_char."""
+
+    def _pipe(self, data):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        os.close(write_fd)
+        return read_fd
+
+    def test_fast_typing_keeps_every_key(self):
+        """Test keys arriving together are returned one per call."""
+        fd = self._pipe(b"12")
+        try:
+            assert _read_char(fd) == "1"
+            assert _read_char(fd) == "2"
+        finally:
+            os.close(fd)
+
+    def test_multibyte_character(self):
+        """Test a UTF-8 character is read whole."""
+        fd = self._pipe("é€x".encode())
+        try:
+            assert _read_char(fd) == "é"
+            assert _read_char(fd) == "€"
+            assert _read_char(fd) == "x"
+        finally:
+            os.close(fd)
+
+    def test_escape_sequence_swallowed(self):
+        """Test an arrow key's tail isn't read back as keystrokes."""
+        fd = self._pipe(b"\x1b[A")
+        try:
+            assert _read_char(fd) == "\x1b"
+            assert _read_char(fd) == ""
+        finally:
+            os.close(fd)
+
+    def test_eof(self):
+        """Test end of input returns an empty string."""
+        fd = self._pipe(b"")
+        try:
+            assert _read_char(fd) == ""
+        finally:
+            os.close(fd)
+
+
 class TestConstants:
     """Tests for centralized constants."""
 